@@ -0,0 +1,46 @@
+"""
+Measures request throughput against a live ModelDB backend with and without connection reuse.
+
+Usage::
+
+    MODELDB_HOST=localhost MODELDB_PORT=8080 python connection_pool.py --calls 500
+
+"""
+import os
+import time
+import argparse
+
+from verta import ModelDBClient
+
+
+def calls_per_sec(run, num_calls):
+    start = time.time()
+    for i in range(num_calls):
+        run.log_metric("metric{}".format(i), i)
+    return num_calls/(time.time() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500, help="number of `log_metric` calls per trial")
+    args = parser.parse_args()
+
+    host = os.environ.get("MODELDB_HOST", "localhost")
+    port = os.environ.get("MODELDB_PORT", "8080")
+    email = os.environ.get("MODELDB_EMAIL")
+    dev_key = os.environ.get("MODELDB_DEV_KEY")
+
+    for keep_alive in (False, True):
+        client = ModelDBClient(host, port, email, dev_key, keep_alive=keep_alive)
+        client.set_project()
+        client.set_experiment()
+        run = client.set_experiment_run()
+        try:
+            print("keep_alive={}: {:.1f} calls/sec".format(keep_alive, calls_per_sec(run, args.calls)))
+        finally:
+            client._conn.make_request("DELETE", "project/deleteProject",
+                                      json={'id': client.proj._id}).raise_for_status()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measures the per-call overhead of converting requests and responses between `protobuf` messages and
+JSON, comparing the current conversion against the previous round trip through a JSON string.
+
+This doesn't need a backend.
+
+Usage::
+
+    python proto_conversion.py --runs 10000
+
+"""
+import json
+import timeit
+import argparse
+
+from google.protobuf import json_format
+
+from verta import _utils
+from verta._protos.public.modeldb import CommonService_pb2 as _CommonService
+from verta._protos.public.modeldb import ExperimentRunService_pb2 as _ExperimentRunService
+
+
+def old_encode(msg):
+    data = json.loads(json_format.MessageToJson(msg,
+                                                preserving_proto_field_name=True,
+                                                use_integers_for_enums=True))
+    return json.dumps(data)
+
+
+def old_decode(content, response_cls):
+    return json_format.Parse(json.dumps(json.loads(content)), response_cls())
+
+
+def usec_per_call(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3))/number*1e6
+
+
+def make_runs_response(num_runs):
+    expt_runs = []
+    for i in range(num_runs):
+        expt_runs.append(_ExperimentRunService.ExperimentRun(
+            id="run{}".format(i), project_id="proj", experiment_id="expt", name="run {}".format(i),
+            metrics=[_CommonService.KeyValue(key="accuracy", value=_utils.python_to_val_proto(i/num_runs))],
+            hyperparameters=[_CommonService.KeyValue(key="C", value=_utils.python_to_val_proto(i % 10)),
+                             _CommonService.KeyValue(key="solver", value=_utils.python_to_val_proto("lbfgs"))],
+        ))
+    return _ExperimentRunService.FindExperimentRuns.Response(experiment_runs=expt_runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10000, help="number of runs in the `FindExperimentRuns` response")
+    args = parser.parse_args()
+
+    msg = _ExperimentRunService.LogMetric(id="run", metric=_CommonService.KeyValue(
+        key="accuracy", value=_utils.python_to_val_proto(.9)))
+    response_content = json.dumps(_utils.proto_to_json(msg.Response())).encode()
+    print("LogMetric request: old {:.1f} usec, new {:.1f} usec".format(
+        usec_per_call(lambda: old_encode(msg), 10000),
+        usec_per_call(lambda: _utils.proto_to_json_bytes(msg), 10000)))
+    print("LogMetric response: old {:.1f} usec, new {:.1f} usec".format(
+        usec_per_call(lambda: old_decode(response_content, msg.Response), 10000),
+        usec_per_call(lambda: _utils.json_bytes_to_proto(response_content, msg.Response), 10000)))
+
+    response_cls = _ExperimentRunService.FindExperimentRuns.Response
+    response_content = json.dumps(_utils.proto_to_json(make_runs_response(args.runs))).encode()
+    print("FindExperimentRuns response with {} runs: old {:.0f} msec, new {:.0f} msec".format(
+        args.runs,
+        usec_per_call(lambda: old_decode(response_content, response_cls), 1)/1000,
+        usec_per_call(lambda: _utils.json_bytes_to_proto(response_content, response_cls), 1)/1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Compares request throughput of the REST and gRPC transports against a live ModelDB backend.
+
+Usage::
+
+    MODELDB_HOST=localhost MODELDB_PORT=8080 MODELDB_GRPC_PORT=8085 python transport.py --calls 500
+
+"""
+import os
+import time
+import argparse
+
+from verta import ModelDBClient
+from verta._protos.public.modeldb import ProjectService_pb2 as _ProjectService
+
+
+def calls_per_sec(run, num_calls):
+    start = time.time()
+    for i in range(num_calls):
+        run.log_metric("metric{}".format(i), i)
+        run.get_metric("metric{}".format(i))
+    return 2*num_calls/(time.time() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500, help="number of `log_metric` calls per trial")
+    args = parser.parse_args()
+
+    host = os.environ.get("MODELDB_HOST", "localhost")
+    ports = {
+        "rest": os.environ.get("MODELDB_PORT", "8080"),
+        "grpc": os.environ.get("MODELDB_GRPC_PORT", "8085"),
+    }
+    email = os.environ.get("MODELDB_EMAIL")
+    dev_key = os.environ.get("MODELDB_DEV_KEY")
+
+    for transport in ("rest", "grpc"):
+        client = ModelDBClient(host, ports[transport], email, dev_key, transport=transport)
+        client.set_project()
+        client.set_experiment()
+        run = client.set_experiment_run()
+        try:
+            print("transport={}: {:.1f} calls/sec".format(transport, calls_per_sec(run, args.calls)))
+        finally:
+            client._conn.call("DELETE", "project/deleteProject",
+                              _ProjectService.DeleteProject(id=client.proj._id))
+
+
+if __name__ == "__main__":
+    main()
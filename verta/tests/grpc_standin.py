@@ -0,0 +1,220 @@
+"""
+In-memory stand-in for the ModelDB backend's gRPC server.
+
+Implements the subset of the Project, Experiment, and ExperimentRun services that
+:class:`verta.ModelDBClient` needs for logging and retrieving run metadata.
+
+"""
+import uuid
+from concurrent import futures
+
+import grpc
+
+from verta._protos.public.modeldb import ProjectService_pb2 as _ProjectService
+from verta._protos.public.modeldb import ProjectService_pb2_grpc as _ProjectServiceGrpc
+from verta._protos.public.modeldb import ExperimentService_pb2 as _ExperimentService
+from verta._protos.public.modeldb import ExperimentService_pb2_grpc as _ExperimentServiceGrpc
+from verta._protos.public.modeldb import ExperimentRunService_pb2 as _ExperimentRunService
+from verta._protos.public.modeldb import ExperimentRunService_pb2_grpc as _ExperimentRunServiceGrpc
+from verta._protos.public.modeldb import CommonService_pb2 as _CommonService
+
+
+def _gen_id():
+    return str(uuid.uuid4())
+
+
+def _get_or_abort(entities, id_, context):
+    try:
+        return entities[id_]
+    except KeyError:
+        context.abort(grpc.StatusCode.NOT_FOUND, "{} not found".format(id_))
+
+
+class Store:
+    def __init__(self):
+        self.projects = {}
+        self.experiments = {}
+        self.experiment_runs = {}
+
+
+class ProjectServicer(_ProjectServiceGrpc.ProjectServiceServicer):
+    def __init__(self, store):
+        self.store = store
+
+    def createProject(self, request, context):
+        project = _ProjectService.Project(id=_gen_id(), name=request.name,
+                                          description=request.description, tags=request.tags)
+        self.store.projects[project.id] = project
+        return _ProjectService.CreateProject.Response(project=project)
+
+    def getProjectById(self, request, context):
+        project = _get_or_abort(self.store.projects, request.id, context)
+        return _ProjectService.GetProjectById.Response(project=project)
+
+    def getProjectByName(self, request, context):
+        for project in self.store.projects.values():
+            if project.name == request.name:
+                return _ProjectService.GetProjectByName.Response(project_by_user=[project])
+        context.abort(grpc.StatusCode.NOT_FOUND, "{} not found".format(request.name))
+
+    def deleteProject(self, request, context):
+        self.store.projects.pop(request.id, None)
+        return _ProjectService.DeleteProject.Response(status=True)
+
+
+class ExperimentServicer(_ExperimentServiceGrpc.ExperimentServiceServicer):
+    def __init__(self, store):
+        self.store = store
+
+    def createExperiment(self, request, context):
+        experiment = _ExperimentService.Experiment(id=_gen_id(), project_id=request.project_id,
+                                                   name=request.name, description=request.description,
+                                                   tags=request.tags, attributes=request.attributes)
+        self.store.experiments[experiment.id] = experiment
+        return _ExperimentService.CreateExperiment.Response(experiment=experiment)
+
+    def getExperimentById(self, request, context):
+        experiment = _get_or_abort(self.store.experiments, request.id, context)
+        return _ExperimentService.GetExperimentById.Response(experiment=experiment)
+
+    def getExperimentByName(self, request, context):
+        for experiment in self.store.experiments.values():
+            if experiment.project_id == request.project_id and experiment.name == request.name:
+                return _ExperimentService.GetExperimentByName.Response(experiment=experiment)
+        context.abort(grpc.StatusCode.NOT_FOUND, "{} not found".format(request.name))
+
+
+class ExperimentRunServicer(_ExperimentRunServiceGrpc.ExperimentRunServiceServicer):
+    def __init__(self, store):
+        self.store = store
+
+    def _run(self, request, context):
+        return _get_or_abort(self.store.experiment_runs, request.id, context)
+
+    def createExperimentRun(self, request, context):
+        experiment_run = _ExperimentRunService.ExperimentRun(id=_gen_id(), project_id=request.project_id,
+                                                             experiment_id=request.experiment_id,
+                                                             name=request.name, description=request.description,
+                                                             tags=request.tags, attributes=request.attributes,
+                                                             hyperparameters=request.hyperparameters)
+        self.store.experiment_runs[experiment_run.id] = experiment_run
+        return _ExperimentRunService.CreateExperimentRun.Response(experiment_run=experiment_run)
+
+    def getExperimentRunById(self, request, context):
+        return _ExperimentRunService.GetExperimentRunById.Response(experiment_run=self._run(request, context))
+
+    def getExperimentRunsInProject(self, request, context):
+        experiment_runs = [experiment_run
+                           for experiment_run in self.store.experiment_runs.values()
+                           if experiment_run.project_id == request.project_id]
+        return _ExperimentRunService.GetExperimentRunsInProject.Response(experiment_runs=experiment_runs)
+
+    def getExperimentRunsInExperiment(self, request, context):
+        experiment_runs = [experiment_run
+                           for experiment_run in self.store.experiment_runs.values()
+                           if experiment_run.experiment_id == request.experiment_id]
+        return _ExperimentRunService.GetExperimentRunsInExperiment.Response(experiment_runs=experiment_runs)
+
+    def getExperimentRunByName(self, request, context):
+        for experiment_run in self.store.experiment_runs.values():
+            if experiment_run.experiment_id == request.experiment_id and experiment_run.name == request.name:
+                return _ExperimentRunService.GetExperimentRunByName.Response(experiment_run=experiment_run)
+        context.abort(grpc.StatusCode.NOT_FOUND, "{} not found".format(request.name))
+
+    def findExperimentRuns(self, request, context):
+        if request.predicates:
+            context.abort(grpc.StatusCode.UNIMPLEMENTED, "predicates are not supported by the stand-in")
+        experiment_runs = []
+        for experiment_run in self.store.experiment_runs.values():
+            if request.project_id and experiment_run.project_id != request.project_id:
+                continue
+            if request.experiment_id and experiment_run.experiment_id != request.experiment_id:
+                continue
+            if request.experiment_run_ids and experiment_run.id not in request.experiment_run_ids:
+                continue
+            if request.ids_only:
+                experiment_run = _ExperimentRunService.ExperimentRun(id=experiment_run.id)
+            experiment_runs.append(experiment_run)
+        return _ExperimentRunService.FindExperimentRuns.Response(experiment_runs=experiment_runs)
+
+    def logAttribute(self, request, context):
+        self._run(request, context).attributes.append(request.attribute)
+        return _ExperimentRunService.LogAttribute.Response()
+
+    def logAttributes(self, request, context):
+        self._run(request, context).attributes.extend(request.attributes)
+        return _ExperimentRunService.LogAttributes.Response()
+
+    def getExperimentRunAttributes(self, request, context):
+        attributes = [attribute
+                      for attribute in self._run(request, context).attributes
+                      if request.get_all or attribute.key in request.attribute_keys]
+        return _CommonService.GetAttributes.Response(attributes=attributes)
+
+    def logMetric(self, request, context):
+        self._run(request, context).metrics.append(request.metric)
+        return _ExperimentRunService.LogMetric.Response()
+
+    def logMetrics(self, request, context):
+        self._run(request, context).metrics.extend(request.metrics)
+        return _ExperimentRunService.LogMetrics.Response()
+
+    def getMetrics(self, request, context):
+        return _ExperimentRunService.GetMetrics.Response(metrics=self._run(request, context).metrics)
+
+    def logHyperparameter(self, request, context):
+        self._run(request, context).hyperparameters.append(request.hyperparameter)
+        return _ExperimentRunService.LogHyperparameter.Response()
+
+    def logHyperparameters(self, request, context):
+        self._run(request, context).hyperparameters.extend(request.hyperparameters)
+        return _ExperimentRunService.LogHyperparameters.Response()
+
+    def getHyperparameters(self, request, context):
+        hyperparameters = self._run(request, context).hyperparameters
+        return _ExperimentRunService.GetHyperparameters.Response(hyperparameters=hyperparameters)
+
+    def logDataset(self, request, context):
+        self._run(request, context).datasets.append(request.dataset)
+        return _ExperimentRunService.LogDataset.Response()
+
+    def logDatasets(self, request, context):
+        self._run(request, context).datasets.extend(request.datasets)
+        return _ExperimentRunService.LogDatasets.Response()
+
+    def getDatasets(self, request, context):
+        return _ExperimentRunService.GetDatasets.Response(datasets=self._run(request, context).datasets)
+
+    def logObservation(self, request, context):
+        self._run(request, context).observations.append(request.observation)
+        return _ExperimentRunService.LogObservation.Response()
+
+    def logObservations(self, request, context):
+        self._run(request, context).observations.extend(request.observations)
+        return _ExperimentRunService.LogObservations.Response()
+
+    def getObservations(self, request, context):
+        observations = [observation
+                        for observation in self._run(request, context).observations
+                        if observation.attribute.key == request.observation_key]
+        return _ExperimentRunService.GetObservations.Response(observations=observations)
+
+
+def serve(port=0):
+    """
+    Starts a stand-in server on `port`, or on a free port if `port` is 0.
+
+    Returns
+    -------
+    server : grpc.Server
+    port : int
+
+    """
+    store = Store()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    _ProjectServiceGrpc.add_ProjectServiceServicer_to_server(ProjectServicer(store), server)
+    _ExperimentServiceGrpc.add_ExperimentServiceServicer_to_server(ExperimentServicer(store), server)
+    _ExperimentRunServiceGrpc.add_ExperimentRunServiceServicer_to_server(ExperimentRunServicer(store), server)
+    port = server.add_insecure_port("localhost:{}".format(port))
+    server.start()
+    return server, port
@@ -0,0 +1,80 @@
+import pytest
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from verta import _utils
+from verta._protos.public.modeldb import CommonService_pb2 as _CommonService
+from verta._protos.public.modeldb import ExperimentRunService_pb2 as _ExperimentRunService
+
+
+class GatewayStandIn(requests.adapters.BaseAdapter):
+    """Answers GetMetrics requests, with or without support for binary `protobuf` bodies."""
+    def __init__(self, binary, reject_status=400, valid=True):
+        super(GatewayStandIn, self).__init__()
+        self.binary = binary
+        self.reject_status = reject_status
+        self.valid = valid
+        self.content_types = []
+
+    def send(self, request, **kwargs):
+        self.content_types.append(request.headers.get('Content-Type'))
+        response = requests.Response()
+        response.request, response.url = request, request.url
+        if not self.valid or (request.headers.get('Content-Type') == "application/x-protobuf" and not self.binary):
+            response.status_code = self.reject_status
+            response.headers = CaseInsensitiveDict({'Content-Type': "application/json"})
+            response._content = b'{"code": 3}'
+            return response
+
+        response_msg = _ExperimentRunService.GetMetrics.Response(metrics=[
+            _CommonService.KeyValue(key="accuracy", value=_utils.python_to_val_proto(.9)),
+        ])
+        response.status_code = 200
+        if self.binary:
+            response.headers = CaseInsensitiveDict({'Content-Type': "application/x-protobuf"})
+            response._content = response_msg.SerializeToString()
+        else:
+            response.headers = CaseInsensitiveDict({'Content-Type': "application/json"})
+            response._content = _utils.proto_to_json_bytes(response_msg)
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize("binary", [True, False])
+def test_negotiation(binary):
+    conn = _utils.Connection("localhost:8080")
+    gateway = GatewayStandIn(binary)
+    conn.session.mount("http://", gateway)
+
+    msg = _ExperimentRunService.GetMetrics(id="run")
+    for _ in range(2):
+        response_msg = conn.call("POST", "experiment-run/getMetrics", msg)
+        assert _utils.val_proto_to_python(response_msg.metrics[0].value) == .9
+    if binary:
+        assert gateway.content_types == ["application/x-protobuf"]*2
+    else:  # falls back to JSON, and remembers to
+        assert gateway.content_types == ["application/x-protobuf", "application/json", "application/json"]
+
+
+@pytest.mark.parametrize("reject_status", [400, 406, 415])
+def test_fallback_status(reject_status):
+    conn = _utils.Connection("localhost:8080")
+    gateway = GatewayStandIn(binary=False, reject_status=reject_status)
+    conn.session.mount("http://", gateway)
+
+    conn.call("POST", "experiment-run/getMetrics", _ExperimentRunService.GetMetrics(id="run"))
+    assert gateway.content_types == ["application/x-protobuf", "application/json"]
+
+
+def test_invalid_request():
+    conn = _utils.Connection("localhost:8080")
+    gateway = GatewayStandIn(binary=False, valid=False)
+    conn.session.mount("http://", gateway)
+
+    with pytest.raises(requests.HTTPError):
+        conn.call("POST", "experiment-run/getMetrics", _ExperimentRunService.GetMetrics(id="run"))
+    assert gateway.content_types == ["application/x-protobuf", "application/json"]
+    assert conn._binary_requests is None  # still undetermined
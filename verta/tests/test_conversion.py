@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from verta import _utils
+from verta._protos.public.modeldb import CommonService_pb2 as _CommonService
+from verta._protos.public.modeldb import ExperimentRunService_pb2 as _ExperimentRunService
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def json_codec(request):
+    if request.param == "stdlib":
+        _utils.set_json_codec(_utils._stdlib_json_loads, _utils._stdlib_json_dumps)
+    yield
+    _utils.set_json_codec()
+
+
+def test_round_trip(json_codec):
+    msg = _ExperimentRunService.FindExperimentRuns.Response(experiment_runs=[
+        _ExperimentRunService.ExperimentRun(id="run", name="run", metrics=[
+            _CommonService.KeyValue(key="accuracy", value=_utils.python_to_val_proto(.9)),
+        ]),
+    ])
+    content = _utils.proto_to_json_bytes(msg)
+    assert json.loads(content) == _utils.proto_to_json(msg)
+    assert _utils.json_bytes_to_proto(content, type(msg)) == msg
+
+
+def chunked(content, size):
+    return [content[i:i+size] for i in range(0, len(content), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_stream_json(chunk_size):
+    response = {'total_records': 4, 'experiment_runs': [
+        {'id': "a", 'name': "é"},
+        {'id': "b", 'tags': ["]", '\\"}', "{["], 'attributes': [{'value': [1, [2.5e3, None, True]]}]},
+        {},
+        7,
+    ], 'z': -1.5}
+    content = json.dumps(response, indent=1).encode()
+    elements = _utils._iter_json_array(chunked(content, chunk_size), {'experiment_runs'})
+    assert list(elements) == response['experiment_runs']
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_stream_proto(chunk_size):
+    msg = _ExperimentRunService.FindExperimentRuns.Response(experiment_runs=[
+        _ExperimentRunService.ExperimentRun(id="run{}".format(i), name="x"*i) for i in range(200)
+    ])
+    field_number = type(msg).DESCRIPTOR.fields_by_name['experiment_runs'].number
+    elements = _utils._iter_proto_field(chunked(msg.SerializeToString(), chunk_size), field_number)
+    assert [_ExperimentRunService.ExperimentRun.FromString(element) for element in elements] == list(msg.experiment_runs)
+
+
+def test_stream_truncated():
+    with pytest.raises(ValueError):
+        list(_utils._iter_json_array([b'{"experiment_runs": [{"id": "a"}, {"id"'], {'experiment_runs'}))
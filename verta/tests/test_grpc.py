@@ -0,0 +1,81 @@
+import pytest
+import utils
+import grpc_standin
+
+from verta import ModelDBClient
+
+
+@pytest.fixture(scope='module')
+def standin_port():
+    server, port = grpc_standin.serve()
+
+    yield port
+
+    server.stop(0)
+
+
+@pytest.fixture
+def grpc_run(standin_port):
+    client = ModelDBClient("localhost", standin_port, transport="grpc")
+    client.set_project()
+    client.set_experiment()
+    return client.set_experiment_run()
+
+
+def test_invalid_transport():
+    with pytest.raises(ValueError):
+        ModelDBClient(transport="carrier pigeon")
+
+
+def test_get_existing(standin_port):
+    client = ModelDBClient("localhost", standin_port, transport="grpc")
+    proj = client.set_project()
+    expt = client.set_experiment()
+    run = client.set_experiment_run()
+
+    assert client.set_project(proj.name)._id == proj._id
+    assert client.set_experiment(expt.name)._id == expt._id
+    assert client.set_experiment_run(run.name)._id == run._id
+    assert [run._id] == client.expt_runs._ids
+
+
+def test_metrics(grpc_run):
+    metrics = {
+        utils.gen_str(): utils.gen_str(),
+        utils.gen_str(): utils.gen_int(),
+        utils.gen_str(): utils.gen_float(),
+    }
+
+    for key, val in metrics.items():
+        grpc_run.log_metric(key, val)
+
+    with pytest.raises(KeyError):
+        grpc_run.get_metric(utils.gen_str())
+
+    assert grpc_run.get_metrics() == metrics
+
+
+def test_attributes(grpc_run):
+    attributes = {
+        utils.gen_str(): utils.gen_str(),
+        utils.gen_str(): utils.gen_int(),
+    }
+
+    for key, val in attributes.items():
+        grpc_run.log_attribute(key, val)
+
+    for key, val in attributes.items():
+        assert grpc_run.get_attribute(key) == val
+
+    assert grpc_run.get_attributes() == attributes
+
+
+def test_bulk_logging(grpc_run):
+    hyperparameters = {utils.gen_str(): utils.gen_int() for _ in range(50)}
+    metrics = {utils.gen_str(): utils.gen_float() for _ in range(3)}
+
+    grpc_run.log_hyperparameters(hyperparameters)
+    grpc_run.log_metrics(metrics)
+
+    assert grpc_run.get_hyperparameters() == hyperparameters
+    assert grpc_run.get_metrics() == metrics
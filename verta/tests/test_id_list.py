@@ -0,0 +1,46 @@
+import pickle
+
+import pytest
+
+from verta import _utils
+
+
+@pytest.fixture
+def dictionary():
+    return _utils.IdDictionary()
+
+
+def test_sequence(dictionary):
+    ids = ["a", "b", "c", "d"]
+    id_list = _utils.IdList(dictionary, ids)
+    assert len(id_list) == 4
+    assert list(id_list) == ids
+    assert id_list[1] == "b"
+    assert id_list[-1] == "d"
+    assert id_list[1:3] == ["b", "c"]
+    assert isinstance(id_list[1:3], _utils.IdList)
+    assert "c" in id_list
+    assert "e" not in id_list
+    assert ids == id_list
+
+
+def test_set_operations(dictionary):
+    left = _utils.IdList(dictionary, ["a", "b", "c", "d"])
+    right = _utils.IdList(dictionary, ["e", "c", "a"])
+    assert left | right == ["a", "b", "c", "d", "e"]
+    assert left & right == ["a", "c"]
+    assert left - right == ["b", "d"]
+    assert right - left == ["e"]
+
+
+def test_set_operations_across_dictionaries(dictionary):
+    left = _utils.IdList(dictionary, ["a", "b", "c"])
+    right = _utils.IdList(_utils.IdDictionary(), ["c", "d"])
+    assert left | right == ["a", "b", "c", "d"]
+    assert left & ["b", "c"] == ["b", "c"]
+
+
+def test_pickle(dictionary):
+    id_list = _utils.IdList(dictionary, ["a", "b", "c"])
+    assert pickle.loads(pickle.dumps(id_list)) == id_list
+    assert pickle.loads(pickle.dumps(id_list[:0])) == []
@@ -0,0 +1,54 @@
+import collections
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from verta._local_query import LocalEngine
+
+
+nan = float('nan')
+
+
+@pytest.fixture
+def engine():
+    columns = collections.OrderedDict([
+        ('id', np.array(["a", "b", "c", "d", "e"], dtype=object)),
+        ('metrics.accuracy', np.array([.9, nan, .7, .9, .8])),
+        ('hyperparameters.optimizer', np.array(["adam", "sgd", nan, "adam", "sgd"], dtype=object)),
+    ])
+    return LocalEngine(columns)
+
+
+def test_find(engine):
+    ids = ["a", "b", "c", "d", "e"]
+    assert engine.find(ids, [("metrics.accuracy", ">=", .8)]) == ["a", "d", "e"]
+    assert engine.find(ids, [("metrics.accuracy", "!=", .9)]) == ["c", "e"]
+    assert engine.find(ids, [("metrics.accuracy", ">", .7),
+                             ("hyperparameters.optimizer", "==", "sgd")]) == ["e"]
+    assert engine.find(ids[2:], [("hyperparameters.optimizer", "==", "adam")]) == ["d"]
+    assert engine.find(ids, [("metrics.loss", "<", 1)]) == []
+    assert engine.find(ids, [("code_version", "==", "0.1")]) is None
+
+
+def test_find_conditions(engine):
+    ids = ["a", "b", "c", "d", "e"]
+    assert engine.find(ids, [("metrics.accuracy", "in", (.7, .8))]) == ["c", "e"]
+    assert engine.find(ids, [("hyperparameters.optimizer", "in", ("sgd",))]) == ["b", "e"]
+    assert engine.find(ids, [("metrics.accuracy", "exists", None)]) == ["a", "c", "d", "e"]
+    assert engine.find(ids, [("hyperparameters.optimizer", "missing", None)]) == ["c"]
+
+
+def test_sort(engine):
+    ids = ["a", "b", "c", "d", "e"]
+    assert engine.sort(ids, "metrics.accuracy") == ["c", "e", "a", "d", "b"]
+    assert engine.sort(ids, "metrics.accuracy", descending=True) == ["a", "d", "e", "c", "b"]
+    assert engine.sort(ids, "hyperparameters.optimizer") == ["a", "d", "b", "e", "c"]
+
+
+def test_top_k(engine):
+    ids = ["a", "b", "c", "d", "e"]
+    assert engine.top_k(ids, "metrics.accuracy", 1) == ["a"]
+    assert engine.top_k(ids, "metrics.accuracy", 3) == ["a", "d", "e"]
+    assert engine.top_k(ids, "metrics.accuracy", 2, descending=False) == ["c", "e"]
+    assert engine.top_k(ids, "metrics.accuracy", 10) == ["a", "d", "e", "c"]
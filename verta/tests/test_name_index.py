@@ -0,0 +1,25 @@
+from verta import _utils
+
+
+def test_complete():
+    index = _utils.NameIndex(maxsize=2)
+    index.put("expt", "run-1", "id-1")
+    index.mark_complete("expt")
+    assert index.is_complete("expt")
+    assert index.get("expt", "run-1") == "id-1"
+
+    index.put("other", "run-2", "id-2")
+    index.put("other", "run-3", "id-3")  # evicts run-1
+    assert index.get("expt", "run-1") is None
+    assert not index.is_complete("expt")
+
+
+def test_complete_expires(monkeypatch):
+    now = [1000.]
+    monkeypatch.setattr(_utils.time, "monotonic", lambda: now[0])
+    index = _utils.NameIndex(complete_ttl=30)
+    index.mark_complete("expt")
+    now[0] += 29
+    assert index.is_complete("expt")
+    now[0] += 2  # a run may since have been created by another client
+    assert not index.is_complete("expt")
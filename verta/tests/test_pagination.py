@@ -0,0 +1,46 @@
+import pytest
+
+from verta import _utils
+
+
+class PagedSource:
+    def __init__(self, n, report_total=True):
+        self.items = list(range(n))
+        self.report_total = report_total
+        self.pages_fetched = []
+
+    def fetch_page(self, page_number, page_limit):
+        self.pages_fetched.append(page_number)
+        start = (page_number - 1)*page_limit
+        total = len(self.items) if self.report_total else None
+        return self.items[start:start+page_limit], total
+
+
+@pytest.mark.parametrize("report_total", [True, False])
+@pytest.mark.parametrize("n", [0, 7, 10, 23])
+def test_iter(n, report_total):
+    source = PagedSource(n, report_total)
+    cursor = _utils.PageCursor(source.fetch_page, page_size=5, max_pages=2)
+    assert list(cursor) == source.items
+    assert len(cursor) == n
+
+
+def test_len_from_first_page():
+    source = PagedSource(23)
+    cursor = _utils.PageCursor(source.fetch_page, page_size=5)
+    assert len(cursor) == 23
+    assert source.pages_fetched == [1]
+
+
+def test_bounded_pages():
+    source = PagedSource(23)
+    cursor = _utils.PageCursor(source.fetch_page, page_size=5, max_pages=2)
+    assert cursor[12] == 12
+    assert cursor[0] == 0
+    assert cursor[13] == 13  # still held
+    assert source.pages_fetched == [3, 1]
+    cursor[7]
+    cursor[0]  # least recently used page was evicted
+    assert source.pages_fetched == [3, 1, 2, 1]
+    with pytest.raises(IndexError):
+        cursor[23]
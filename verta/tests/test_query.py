@@ -0,0 +1,71 @@
+import pytest
+
+from verta import Query
+from verta import _query
+from verta import _utils
+from verta._protos.public.modeldb import CommonService_pb2 as _CommonService
+from verta._protos.public.modeldb import ExperimentRunService_pb2 as _ExperimentRunService
+
+
+def test_parse():
+    assert Query("metrics.accuracy >= .8").compile() == [(("metrics.accuracy", ">=", .8),)]
+    assert Query(".8 <= metrics.accuracy < .9").compile() == [(("metrics.accuracy", "<", .9),
+                                                               ("metrics.accuracy", ">=", .8))]
+    assert Query("hyperparameters.hidden size in [128, 256]").compile() == [
+        (("hyperparameters.hidden size", "in", (128, 256)),),
+    ]
+    assert Query("attributes.team == 'a>b'").compile() == [(("attributes.team", "==", "a>b"),)]
+    assert Query("attributes.team == 'a < b <= c'").compile() == [(("attributes.team", "==", "a < b <= c"),)]
+
+
+@pytest.mark.parametrize("predicate", ["metrics.accuracy", "1 < metrics.accuracy > 2",
+                                       "metrics.accuracy == accuracy", "metrics.accuracy in [accuracy]",
+                                       "metrics.accuracy in (1)"])
+def test_parse_invalid(predicate):
+    with pytest.raises(ValueError):
+        Query(predicate)
+
+
+def test_compose():
+    a, b, c = Query("a == 1"), Query("b > 2"), Query("c < 3")
+    assert (a & (b | c)).compile() == [(("a", "==", 1), ("b", ">", 2)),
+                                       (("a", "==", 1), ("c", "<", 3))]
+    assert (~(a | b)).compile() == [(("a", "!=", 1), ("b", "<=", 2))]
+    assert (~(a & b)).compile() == [(("a", "!=", 1),), (("b", "<=", 2),)]
+    assert (~~a).compile() == a.compile()
+    assert (~Query.exists("c")).compile() == Query.missing("c").compile()
+    assert (~Query("b in ['x', 'y']")).compile() == [(("b", "!=", "x"), ("b", "!=", "y"))]
+    assert (a | a).compile() == a.compile()
+    assert Query.from_where(["a == 1", "b > 2"]).compile() == (a & b).compile()
+
+
+def test_match_all():
+    assert Query.from_where([]).compile() == [()]
+    assert (Query.from_where([]) & Query("a == 1")).compile() == Query("a == 1").compile()
+
+
+def test_project_json():
+    projection = _query.parse_fields(["name", "metrics.accuracy", "observations.loss"])
+    expt_run = {'id': "run", 'name': "run", 'description': "unused", 'dateCreated': "0",
+                'metrics': [{'key': "accuracy", 'value': .9}, {'key': "f1", 'value': .8}],
+                'observations': [{'attribute': {'key': "loss", 'value': 1}},
+                                 {'attribute': {'key': "lr", 'value': .1}}]}
+    assert _query.project_json(expt_run, projection) == {
+        'id': "run", 'name': "run",
+        'metrics': [{'key': "accuracy", 'value': .9}],
+        'observations': [{'attribute': {'key': "loss", 'value': 1}}],
+    }
+    assert 'dateCreated' in _query.project_json(expt_run, _query.parse_fields(["date_created"]))
+
+
+def test_project_proto_bytes():
+    projection = _query.parse_fields(["name", "metrics.accuracy", "observations.loss"])
+    expt_run = _ExperimentRunService.ExperimentRun(
+        id="run", name="run", description="unused",
+        metrics=[_CommonService.KeyValue(key="accuracy", value=_utils.python_to_val_proto(.9)),
+                 _CommonService.KeyValue(key="f1", value=_utils.python_to_val_proto(.8))],
+        observations=[_ExperimentRunService.Observation(attribute=_CommonService.KeyValue(key=key))
+                      for key in ["loss", "lr"]])
+    content = _query.project_proto_bytes(expt_run.SerializeToString(), projection,
+                                         _ExperimentRunService.ExperimentRun.DESCRIPTOR)
+    assert _ExperimentRunService.ExperimentRun.FromString(content) == _query.project_proto(expt_run, projection)
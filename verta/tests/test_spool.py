@@ -0,0 +1,145 @@
+import os
+
+import pytest
+import requests
+import utils
+
+from verta import ModelDBClient
+from verta import _utils
+from verta._protos.public.modeldb import ExperimentRunService_pb2 as _ExperimentRunService
+
+
+@pytest.fixture
+def spool_client(host, port, email, dev_key, tmp_path):
+    client = ModelDBClient(host, port, email, dev_key, spool_path=str(tmp_path/"spool.jsonl"))
+
+    yield client
+
+    if client.proj is not None:
+        utils.delete_project(client._conn.spool.resolve(client.proj._id), client)
+
+
+def test_replay_requires_spool(client):
+    with pytest.raises(ValueError):
+        client.replay_spool()
+
+
+def test_unreachable_backend(tmp_path):
+    spool_path = str(tmp_path/"spool.jsonl")
+    client = ModelDBClient("localhost", 1, spool_path=spool_path)  # nothing listens on port 1
+    client.set_project()
+    client.set_experiment()
+    run = client.set_experiment_run()
+    run.log_metric(utils.gen_str(), utils.gen_float())
+
+    with open(spool_path) as f:
+        assert len(f.readlines()) == 4
+
+
+def test_replay(spool_client):
+    metrics = {utils.gen_str(): utils.gen_float() for _ in range(3)}
+    hyperparameters = {utils.gen_str(): utils.gen_int() for _ in range(3)}
+
+    spool_client.set_project()
+    spool_client.set_experiment()
+    run = spool_client.set_experiment_run()
+    for key, val in metrics.items():
+        run.log_metric(key, val)
+    run.log_hyperparameters(hyperparameters)
+
+    assert spool_client.replay_spool() == 3 + len(metrics) + 1
+    assert spool_client.replay_spool() == 0  # already replayed
+
+    assert run.get_metrics() == metrics
+    assert run.get_hyperparameters() == hyperparameters
+
+
+def test_replay_from_new_process(spool_client, host, port, email, dev_key):
+    spool_client.set_project()
+    spool_client.set_experiment()
+    run = spool_client.set_experiment_run()
+    key, val = utils.gen_str(), utils.gen_float()
+    run.log_metric(key, val)
+
+    replayer = ModelDBClient(host, port, email, dev_key, spool_path=spool_client._conn.spool.path)
+    assert replayer.replay_spool() == 4
+    spool_client._conn.spool._ids.update(replayer._conn.spool._ids)  # so fixture cleanup can resolve
+
+    assert os.path.exists(spool_client._conn.spool.path + ".checkpoint")
+    assert run._conn.spool.resolve(run._id) != run._id
+
+
+def test_find_spooled_runs(spool_client):
+    spool_client.set_project()
+    expt = spool_client.set_experiment()
+    runs = expt.create_runs([{'hyperparams': {'C': C}} for C in [.1, 1, 10]])
+    spool_client.replay_spool()
+
+    found = runs.find("hyperparameters.C >= 1")
+    assert sorted(run.get_hyperparameter("C") for run in found) == [1, 10]
+    assert len(list(runs)) == 3
+
+
+class FailingCreate:
+    def __init__(self, fail_names=()):
+        self.fail_names = set(fail_names)
+        self.created = []
+
+    def __call__(self, conn, record):
+        if record['name'] in self.fail_names:
+            self.fail_names.remove(record['name'])
+            raise requests.ConnectionError()
+        self.created.append(record['name'])
+        return "id-" + record['name']
+
+
+def test_replay_skips_corrupt_lines(tmp_path):
+    create = FailingCreate()
+    spool = _utils.Spool(str(tmp_path/"spool.jsonl"), create)
+    spool.defer_create("project", [], "a")
+    with open(spool.path, 'ab') as f:
+        f.write(b'{"type": "cre')  # writer killed mid-record
+    placeholder = spool.defer_create("project", [], "b")
+
+    assert spool.replay(None) == 2
+    assert create.created == ["a", "b"]
+    assert spool.resolve(placeholder) == "id-b"
+    with open(spool.path + ".corrupt", 'rb') as f:
+        assert f.read() == b'{"type": "cre\n'
+
+
+def test_replay_resumes(tmp_path):
+    create = FailingCreate(fail_names=["b"])
+    spool = _utils.Spool(str(tmp_path/"spool.jsonl"), create)
+    for name in ["a", "b", "c"]:
+        spool.defer_create("project", [], name)
+
+    with pytest.raises(requests.ConnectionError):
+        spool.replay(None)
+    assert _utils.Spool(spool.path, create).replay(None) == 2  # as if from a new process
+    assert spool.replay(None) == 0
+    assert create.created == ["a", "b", "c"]
+
+
+def test_replay_only_new_records(tmp_path):
+    create = FailingCreate()
+    spool = _utils.Spool(str(tmp_path/"spool.jsonl"), create)
+    spool.defer_create("project", [], "a")
+    assert spool.has_pending()
+    assert spool.replay(None) == 1
+    assert not spool.has_pending()
+
+    spool.defer_create("project", [], "b")
+    assert spool.has_pending()
+    assert spool.replay(None) == 1
+    assert create.created == ["a", "b"]
+
+
+def test_resolve_repeated_ids(tmp_path):
+    spool = _utils.Spool(str(tmp_path/"spool.jsonl"), FailingCreate())
+    placeholder = spool.defer_create("experiment-run", ["project", "experiment"], "a")
+    msg = _ExperimentRunService.FindExperimentRuns(experiment_run_ids=[placeholder, "other"])
+
+    assert spool.resolve_all(None, list(msg.experiment_run_ids)) == ["id-a", "other"]  # replays first
+    spool.resolve_ids(msg)
+    assert list(msg.experiment_run_ids) == ["id-a", "other"]
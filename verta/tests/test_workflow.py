@@ -1,6 +1,12 @@
+import json
+
 import pytest
+import requests
 import utils
 
+import verta.modeldbclient
+from verta import _utils
+
 
 def test_attributes(run):
     attributes = {
@@ -173,3 +179,308 @@ def test_observations(run):
         assert run.get_observation(key) == val
 
     assert run.get_observations() == observations
+
+
+def test_async_logging(client):
+    client.set_project()
+    client.set_experiment()
+
+    observations = [utils.gen_float() for _ in range(8)]
+    with client.set_experiment_run(async_logging=True) as run:
+        key = utils.gen_str()
+        for val in observations:
+            run.log_observation(key, val)
+
+        assert run.get_observation(key) == observations
+
+    run.log_metric(key, observations[-1])  # sent synchronously after close
+    assert run.get_metric(key) == observations[-1]
+
+
+def test_async_logging_exit_error(client, monkeypatch):
+    client.set_project()
+    client.set_experiment()
+
+    def fail(method, path, msg):
+        raise requests.HTTPError("500: queued call failed")
+
+    with pytest.raises(KeyError):
+        with client.set_experiment_run(async_logging=True) as run:
+            monkeypatch.setattr(run._conn, "call", fail)
+            run.log_metric(utils.gen_str(), utils.gen_float())
+            raise KeyError("raised inside the block")
+    assert run._request_queue is None  # still drained and closed
+
+
+def test_bulk_logging(run):
+    attributes = {utils.gen_str(): utils.gen_int() for _ in range(3)}
+    metrics = {utils.gen_str(): utils.gen_float() for _ in range(3)}
+    datasets = {utils.gen_str(): utils.gen_str() for _ in range(3)}
+
+    with pytest.raises(ValueError):
+        run.log_metrics(metrics, **metrics)
+    with pytest.raises(ValueError):
+        run.log_metrics({"invalid key": 0})
+
+    run.log_attributes(attributes)
+    run.log_metrics(**metrics)
+    run.log_datasets(datasets)
+
+    assert run.get_attributes() == attributes
+    assert run.get_metrics() == metrics
+    assert run.get_datasets() == datasets
+
+
+def test_observation_series(run):
+    observations = {
+        utils.gen_str(): [utils.gen_float() for _ in range(16)],
+        utils.gen_str(): [utils.gen_int() for _ in range(16)],
+    }
+
+    for key, vals in observations.items():
+        run.log_observations(key, (val for val in vals))
+
+    with pytest.raises(ValueError):
+        run.log_observations(utils.gen_str(), [1, 2, 3], timestamps=[0])
+    with pytest.raises(ValueError):
+        run.log_observations(utils.gen_str(), (val for val in [1, 2, 3]), steps=(step for step in [1, 2]))
+
+    assert run.get_observations() == observations
+
+
+def test_observation_steps(run, monkeypatch):
+    bodies = []
+    monkeypatch.setattr(run._conn, "call",
+                        lambda method, path, msg: bodies.append(json.loads(_utils.proto_to_json_bytes(msg))))
+
+    run.log_observations(utils.gen_str(), [.1, .2, .3], steps=[1, 2, 3])
+    run.log_observations(utils.gen_str(), [.1, .2, .3])
+
+    with_steps, without_steps = bodies
+    assert [observation['epoch_number'] for observation in with_steps['observations']] == [1, 2, 3]
+    assert all('epoch_number' not in observation for observation in without_steps['observations'])
+
+
+def test_fetch(run):
+    hyperparameters = {utils.gen_str(): utils.gen_int() for _ in range(3)}
+    metrics = {utils.gen_str(): utils.gen_float() for _ in range(3)}
+    observations = {utils.gen_str(): [utils.gen_float(), utils.gen_float()]}
+
+    run.log_hyperparameters(hyperparameters)
+    run.log_metrics(metrics)
+    for key, vals in observations.items():
+        run.log_observations(key, vals)
+
+    snapshot = run.fetch()
+    assert snapshot['id'] == run._id
+    assert snapshot['name'] == run.name
+    assert snapshot['hyperparameters'] == hyperparameters
+    assert snapshot['metrics'] == metrics
+    assert snapshot['observations'] == observations
+    assert snapshot['attributes'] == {}
+
+
+def test_cache(client):
+    client.set_project()
+    client.set_experiment()
+    run = client.set_experiment_run(cache_ttl=60)
+
+    metrics = {utils.gen_str(): utils.gen_float() for _ in range(3)}
+    run.log_metrics(metrics)
+    assert run.get_metrics() == metrics  # populates cache
+
+    key, val = utils.gen_str(), utils.gen_float()
+    run.log_metric(key, val)  # updates cache
+    assert run.get_metric(key) == val
+
+    other_run = client.set_experiment_run(run.name)  # uncached view of the same run
+    other_key, other_val = utils.gen_str(), utils.gen_float()
+    other_run.log_metric(other_key, other_val)
+    with pytest.raises(KeyError):
+        run.get_metric(other_key)
+
+    run.refresh()
+    assert run.get_metric(other_key) == other_val
+
+
+def test_cache_async_logging(client, monkeypatch):
+    client.set_project()
+    client.set_experiment()
+    run = client.set_experiment_run(cache_ttl=60, async_logging=True)
+    run.get_attributes()  # populates cache
+
+    key = utils.gen_str()
+    run.log_attribute(key, utils.gen_int())
+    run.flush()
+    cached = run.get_attribute(key)
+    run.refresh()
+    assert cached == run.get_attribute(key)
+    assert type(cached) is type(run.get_attribute(key))  # as if fetched
+
+    def reject(method, path, msg):
+        raise requests.HTTPError("INVALID_ARGUMENT: rejected")
+    monkeypatch.setattr(run._conn, "call", reject)
+    rejected_key = utils.gen_str()
+    run.log_metric(rejected_key, utils.gen_float())
+    with pytest.raises(requests.HTTPError):
+        run.flush()
+    monkeypatch.undo()
+    with pytest.raises(KeyError):
+        run.get_metric(rejected_key)  # failed write never reached the cache
+
+
+def test_cached_properties(client):
+    desc, tags = utils.gen_str(), [utils.gen_str(), utils.gen_str()]
+    proj = client.set_project(desc=desc, tags=tags)
+    expt = client.set_experiment()
+    run = client.set_experiment_run(desc=desc, tags=tags)
+
+    assert proj.description == run.description == desc
+    assert proj.tags == run.tags == tags
+    assert client.set_project(proj.name)._id == proj._id
+    assert client.set_experiment(expt.name).date_created == expt.date_created
+
+
+def test_get_run_by_name(client):
+    client.set_project()
+    expt1 = client.set_experiment()
+    run = client.set_experiment_run()
+    assert client.set_experiment_run(run.name)._id == run._id
+
+    client.set_experiment()  # same run name under another experiment is a different run
+    other_run = client.set_experiment_run(run.name)
+    assert other_run._id != run._id
+
+    client.set_experiment(expt1.name)
+    client._conn.expt_run_index = type(client._conn.expt_run_index)()  # lookup from scratch
+    assert client.set_experiment_run(run.name)._id == run._id
+
+
+def test_create_only(client):
+    client.set_project()
+    client.set_experiment()
+    names = {client.set_experiment_run().name for _ in range(10)}
+    assert len(names) == 10
+
+    run = client.set_experiment_run()
+    assert client.set_experiment_run(run.name, create_only=True)._id != run._id
+
+
+def test_create_runs(client):
+    client.set_project()
+    client.set_experiment()
+    specs = [{'name': "C={}".format(C), 'tags': ["sweep"], 'hyperparams': {'C': C}}
+             for C in [.01, .1, 1, 10]]
+    runs = client.set_experiment_runs(specs)
+    assert len(runs) == len(specs)
+    for run, spec in zip(runs, specs):
+        assert run.name == spec['name']
+        assert run.tags == spec['tags']
+        assert run.get_hyperparameter('C') == spec['hyperparams']['C']
+    assert client.set_experiment_run(specs[0]['name'])._id == runs[0]._id
+
+
+def test_iterate_expt_runs(client):
+    client.set_project()
+    client.set_experiment()
+    runs = client.set_experiment_runs(["run {}".format(i) for i in range(5)])
+    assert {run._id for run in client.expt_runs} == {run._id for run in runs}
+    assert len(client.expt_runs) == 5
+
+
+def test_to_numpy(client):
+    np = pytest.importorskip("numpy")
+
+    client.set_project()
+    client.set_experiment()
+    runs = client.set_experiment_runs([{'hyperparams': {'C': C}} for C in [.1, 1]])
+    runs[0].log_metric("accuracy", .9)
+    runs[1].log_attribute("note", "baseline")
+
+    arrays = runs.to_numpy()
+    assert list(arrays['id']) == [run._id for run in runs]
+    assert arrays['hyperparameters.C'].tolist() == [.1, 1]
+    assert arrays['metrics.accuracy'][0] == .9
+    assert np.isnan(arrays['metrics.accuracy'][1])
+    assert arrays['attributes.note'][1] == "baseline"
+
+
+def test_find_query(client):
+    from verta import Query
+
+    client.set_project()
+    expt = client.set_experiment()
+    runs = client.set_experiment_runs([{'hyperparams': {'C': C}} for C in [.01, .1, 1, 10]])
+    runs[0].log_metric("accuracy", .9)
+
+    found = expt.find(Query("hyperparameters.C <= .01") | Query("hyperparameters.C >= 10"))
+    assert {run._id for run in found} == {runs[0]._id, runs[3]._id}
+    found = runs.find(Query("hyperparameters.C in [.1, 1]") & Query.missing("metrics.accuracy"))
+    assert [run._id for run in found] == [runs[1]._id, runs[2]._id]
+
+
+def test_lazy_chain(client):
+    client.set_project()
+    expt = client.set_experiment()
+    runs = client.set_experiment_runs([{'hyperparams': {'C': C}} for C in [.01, .1, 1, 10]])
+    for run, accuracy in zip(runs, [.6, .9, .8, .7]):
+        run.log_metric("accuracy", accuracy)
+
+    chain = expt.find("hyperparameters.C >= .1").sort("metrics.accuracy", descending=True)[:2]
+    assert "total:" in chain.explain()
+    assert [run._id for run in chain] == [runs[1]._id, runs[2]._id]
+    assert chain.explain() == "already fetched; no requests"
+
+
+def test_chunked_ids(client, monkeypatch):
+    client.set_project()
+    client.set_experiment()
+    runs = client.set_experiment_runs([{} for _ in range(5)])
+    for run, accuracy in zip(runs, [.6, .9, .8, .5, .7]):
+        run.log_metric("accuracy", accuracy)
+
+    monkeypatch.setattr(verta.modeldbclient.ExperimentRuns, '_ID_CHUNK_SIZE', 2)
+    monkeypatch.setattr(verta.modeldbclient.ExperimentRuns, '_GET_ID_CHUNK_SIZE', 2)
+    expt_runs = verta.modeldbclient.ExperimentRuns(client._conn, [run._id for run in runs])
+    assert [run._id for run in expt_runs.sort("metrics.accuracy")] == [runs[i]._id for i in [3, 0, 4, 2, 1]]
+    assert [run._id for run in expt_runs.top_k("metrics.accuracy", 2)] == [runs[1]._id, runs[2]._id]
+
+
+def test_expt_runs_cache(client):
+    client.set_project()
+    expt = client.set_experiment()
+    run = client.set_experiment_run()
+    expt_runs = client.expt_runs
+    assert client.expt_runs is expt_runs
+    assert list(expt.runs()._ids) == [run._id]
+
+    other_run = client.set_experiment_run()
+    assert client.expt_runs is not expt_runs
+    assert set(client.expt_runs._ids) == {run._id, other_run._id}
+
+
+def test_iterate_batches(client):
+    client.set_project()
+    client.set_experiment()
+    runs = client.set_experiment_runs([{'hyperparams': {'C': C}} for C in range(5)])
+
+    iterated = list(runs.iterate(batch_size=2, cache_ttl=60))
+    assert [run._id for run in iterated] == [run._id for run in runs]
+    assert [run.get_hyperparameter("C") for run in iterated] == list(range(5))
+
+
+def test_find_fields(client):
+    client.set_project()
+    client.set_experiment()
+    runs = client.set_experiment_runs([{'hyperparams': {'C': C, 'penalty': "l2"}} for C in [.1, 1]])
+    for run, accuracy in zip(runs, [.6, .9]):
+        run.log_metric("accuracy", accuracy)
+        run.log_metric("f1", accuracy)
+
+    expt_runs = runs.top_k("metrics.accuracy", 1, ret_all_info=True, fields=["metrics.accuracy", "hyperparameters.C"])
+    assert [expt_run.id for expt_run in expt_runs] == [runs[1]._id]
+    assert [metric.key for metric in expt_runs[0].metrics] == ["accuracy"]
+    assert [hyperparameter.key for hyperparameter in expt_runs[0].hyperparameters] == ["C"]
+    assert expt_runs[0].name == ""
+    with pytest.raises(ValueError):
+        runs.find("metrics.accuracy > .5", fields=["name"])
@@ -1 +1,2 @@
 from .modeldbclient import ModelDBClient
+from ._query import Query
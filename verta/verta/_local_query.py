@@ -0,0 +1,174 @@
+"""
+Local evaluation of Experiment Run queries over NumPy columns.
+
+"""
+import operator
+
+import numpy as np
+
+
+_OPS = {'==': operator.eq,
+        '!=': operator.ne,
+        '>':  operator.gt,
+        '>=': operator.ge,
+        '<':  operator.lt,
+        '<=': operator.le}
+
+_FIELDS = ('metrics', 'hyperparameters', 'attributes')
+
+
+def _is_number(value):
+    return type(value) in (int, float)
+
+
+class LocalEngine:
+    """
+    Evaluates predicates, sorts, and top-k selections against a local snapshot of Experiment Runs.
+
+    Each method takes the IDs of the Experiment Runs to operate on, which must all be in the
+    snapshot, and returns the resulting IDs. A method returns None if it cannot reproduce the
+    backend's result, e.g. for a key that isn't held locally, in which case the caller should ask the
+    backend instead.
+
+    Parameters
+    ----------
+    columns : dict of str to numpy.ndarray
+        Snapshot as returned by :meth:`~verta.modeldbclient.ExperimentRuns.to_numpy`, with an
+        ``"id"`` column. Missing values are NaN.
+
+    """
+    def __init__(self, columns):
+        self._columns = columns
+        self._rows = {expt_run_id: row for row, expt_run_id in enumerate(columns['id'])}
+        self._present = {}
+        for key, values in columns.items():
+            if values.dtype == object:
+                self._present[key] = np.array([not (type(value) is float and value != value)
+                                               for value in values], dtype=bool)
+            else:
+                self._present[key] = ~np.isnan(values)
+
+    def _column(self, key, rows):
+        """
+        Returns `key`'s values and presence mask for `rows`, or None if `key` isn't held locally.
+
+        """
+        if key in self._columns:
+            return self._columns[key][rows], self._present[key][rows]
+        elif key.split('.', 1)[0] in _FIELDS:  # no run in the snapshot has this key
+            return np.full(len(rows), np.nan), np.zeros(len(rows), dtype=bool)
+        else:
+            return None
+
+    def _to_rows(self, expt_run_ids):
+        return np.array([self._rows[expt_run_id] for expt_run_id in expt_run_ids], dtype=np.intp)
+
+    def find(self, expt_run_ids, predicates):
+        """
+        Parameters
+        ----------
+        expt_run_ids : list of str
+        predicates : list of tuple of (str, str, object)
+            Key, operator, and value of each predicate, all of which must be satisfied, as in
+            :meth:`verta.Query.compile`.
+
+        """
+        mask = np.ones(len(expt_run_ids), dtype=bool)
+        rows = self._to_rows(expt_run_ids)
+        for key, op, value in predicates:
+            column = self._column(key, rows)
+            if column is None:
+                return None
+            values, present = column
+            if op == 'exists':
+                mask &= present
+            elif op == 'missing':
+                mask &= ~present
+            elif op == 'in':
+                matches = np.zeros(len(values), dtype=bool)
+                for item in value:
+                    matches |= self._compare(values, present & mask, '==', item)
+                mask &= matches
+            else:
+                mask &= self._compare(values, present & mask, op, value)
+        return [expt_run_ids[i] for i in np.flatnonzero(mask)]
+
+    @staticmethod
+    def _compare(values, present, op, value):
+        """
+        Returns a mask of which of `values` satisfy `op` `value`, among those that are `present`.
+
+        """
+        if values.dtype != object and _is_number(value):
+            with np.errstate(invalid='ignore'):
+                return _OPS[op](values, value) & present
+        matches = np.zeros(len(values), dtype=bool)
+        for i in np.flatnonzero(present):
+            try:
+                matches[i] = _OPS[op](values[i], value)
+            except TypeError:  # e.g. str < float
+                pass
+        return matches
+
+    def _order(self, expt_run_ids, key, descending):
+        """
+        Returns positions into `expt_run_ids` of runs that have `key`, ordered by its value.
+
+        """
+        rows = self._to_rows(expt_run_ids)
+        column = self._column(key, rows)
+        if column is None:
+            return None
+        values, present = column
+        positions = np.flatnonzero(present)
+        if values.dtype != object:
+            keys = values[positions]
+            order = np.argsort(-keys if descending else keys, kind='mergesort')
+            return positions[order]
+        try:
+            return np.array(sorted(positions, key=lambda i: values[i], reverse=descending), dtype=np.intp)
+        except TypeError:  # mixed types
+            return None
+
+    def sort(self, expt_run_ids, key, descending=False):
+        """
+        Runs without `key` are placed last, in their original order.
+
+        """
+        positions = self._order(expt_run_ids, key, descending)
+        if positions is None:
+            return None
+        has_key = np.zeros(len(expt_run_ids), dtype=bool)
+        has_key[positions] = True
+        return ([expt_run_ids[i] for i in positions]
+                + [expt_run_ids[i] for i in np.flatnonzero(~has_key)])
+
+    def top_k(self, expt_run_ids, key, k, descending=True):
+        """
+        Runs without `key` are excluded.
+
+        """
+        rows = self._to_rows(expt_run_ids)
+        column = self._column(key, rows)
+        if column is None:
+            return None
+        values, present = column
+        if values.dtype == object:
+            positions = self._order(expt_run_ids, key, descending)
+            return None if positions is None else [expt_run_ids[i] for i in positions[:k]]
+
+        positions = np.flatnonzero(present)
+        k = min(k, len(positions))
+        if k == 0:
+            return []
+        keys = -values[positions] if descending else values[positions]
+        if k < len(positions):
+            # take ties for the kth place in original order, as a full stable sort would
+            kth = np.partition(keys, k - 1)[k - 1]
+            less = np.flatnonzero(keys < kth)
+            equal = np.flatnonzero(keys == kth)[:k - len(less)]
+            candidates = np.sort(np.concatenate([less, equal]))
+        else:
+            candidates = np.arange(len(positions))
+        order = candidates[np.argsort(keys[candidates], kind='mergesort')]
+        return [expt_run_ids[i] for i in positions[order]]
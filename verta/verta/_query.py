@@ -0,0 +1,395 @@
+"""
+Composable predicates over Experiment Run properties.
+
+"""
+import re
+import ast
+import functools
+import itertools
+
+from . import _utils
+
+
+COMPARISON_OPS = ('==', '!=', '>', '>=', '<', '<=')
+_NEGATED_OPS = {'==': '!=', '!=': '==',
+                '>': '<=', '<=': '>',
+                '<': '>=', '>=': '<',
+                'exists': 'missing', 'missing': 'exists'}
+_FLIPPED_OPS = {'<': '>', '<=': '>=', '>': '<', '>=': '<='}
+_OP_PATTERN = re.compile(r"({})".format('|'.join(sorted(COMPARISON_OPS, key=lambda s: len(s), reverse=True))))
+_IN_PATTERN = re.compile(r"^(.+?)\s+in\s+([\[(].*[\])])$")
+_FIELDS = ('metrics', 'hyperparameters', 'attributes')
+_KEYED_FIELDS = _FIELDS + ('observations', 'datasets', 'artifacts')
+_CAMEL_CASE_PATTERN = re.compile(r"[A-Z]")
+
+
+def _parse_literal(value, predicate):
+    try:
+        expr_node = ast.parse(value, mode='eval')
+    except SyntaxError:
+        raise ValueError("value `{}` must be a number or string literal".format(value))
+    value_node = expr_node.body
+    if type(value_node) is ast.Num:
+        return value_node.n
+    elif type(value_node) is ast.Str:
+        return value_node.s
+    elif type(value_node) is ast.Compare:
+        raise ValueError("predicate `{}` must be a two-operand comparison".format(predicate))
+    else:
+        raise ValueError("value `{}` must be a number or string literal".format(value))
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_predicate(predicate):
+    """
+    Parses a predicate string into a tuple of ``(key, operator, value)`` conditions, all of which
+    must hold.
+
+    Supported forms are ``"<key> <op> <literal>"``, ``"<literal> <op> <key> <op> <literal>"`` for
+    ranges, and ``"<key> in [<literal>, ...]"``.
+
+    """
+    match = _IN_PATTERN.match(predicate.strip())
+    if match is not None:
+        key, values = match.groups()
+        try:
+            values = ast.literal_eval(values)
+        except (SyntaxError, ValueError):
+            raise ValueError("values `{}` must be a list of number or string literals".format(values))
+        if (not isinstance(values, (list, tuple))
+                or not all(type(value) in (int, float, str) for value in values)):
+            raise ValueError("values `{}` must be a list of number or string literals".format(values))
+        return ((key.strip(), 'in', tuple(values)),)
+
+    tokens = list(map(str.strip, _OP_PATTERN.split(predicate)))
+    if len(tokens) == 5:
+        low, low_op, key, high_op, high = tokens
+        try:
+            low_value, high_value = _parse_literal(low, predicate), _parse_literal(high, predicate)
+        except ValueError:  # not a range, e.g. an operator within a string literal
+            pass
+        else:
+            if {low_op, high_op} <= {'<', '<='} or {low_op, high_op} <= {'>', '>='}:
+                # flip the lower bound around so that the key is on the left
+                return ((key, _FLIPPED_OPS[low_op], low_value),
+                        (key, high_op, high_value))
+            raise ValueError("range `{}` must use two of `<` and `<=`, or two of `>` and `>=`".format(predicate))
+
+    tokens = list(map(str.strip, _OP_PATTERN.split(predicate, maxsplit=1)))
+    if len(tokens) != 3:
+        raise ValueError("predicate `{}` must be a two-operand comparison".format(predicate))
+    key, op, value = tokens
+    return ((key, op, _parse_literal(value, predicate)),)
+
+
+def _negate(condition):
+    """
+    Returns the negation of `condition` in disjunctive normal form.
+
+    """
+    key, op, value = condition
+    if op == 'in':
+        return [tuple((key, '!=', item) for item in value)]
+    return [((key, _NEGATED_OPS[op], value),)]
+
+
+def has_key(expt_run, key):
+    """
+    Returns whether `expt_run` has a value for `key`.
+
+    Parameters
+    ----------
+    expt_run : google.protobuf.message.Message
+        `protobuf` ``ExperimentRun``.
+    key : str
+        Dot-delimited Experiment Run property.
+
+    """
+    field, _, name = key.partition('.')
+    if field in _FIELDS:
+        return any(key_value.key == name for key_value in getattr(expt_run, field))
+    return bool(getattr(expt_run, key, None))
+
+
+def get_value(expt_run, key):
+    """
+    Returns whether `expt_run` has a value for `key`, and the value.
+
+    Parameters
+    ----------
+    expt_run : google.protobuf.message.Message
+        `protobuf` ``ExperimentRun``.
+    key : str
+        Dot-delimited Experiment Run property.
+
+    Returns
+    -------
+    has_value : bool
+    value : object
+        None if `has_value` is False.
+
+    """
+    field, _, name = key.partition('.')
+    if field in _FIELDS:
+        for key_value in getattr(expt_run, field):
+            if key_value.key == name:
+                return True, _utils.val_proto_to_python(key_value.value)
+        return False, None
+    value = getattr(expt_run, key, None)
+    return (True, value) if value else (False, None)
+
+
+def parse_fields(fields):
+    """
+    Parses dot-delimited Experiment Run properties into a projection for :func:`project_json` and
+    :func:`project_proto`.
+
+    Parameters
+    ----------
+    fields : iterable of str
+        Properties such as ``"name"`` or ``"metrics.accuracy"``. A field such as ``"metrics"``
+        selects all of its keys.
+
+    Returns
+    -------
+    dict of str to set of str or None
+        Fields to keep, each with the keys to keep from it, or None to keep all of it. ``"id"`` is
+        always kept.
+
+    """
+    projection = {'id': None}
+    for field in fields:
+        name, _, key = field.partition('.')
+        if key and name in _KEYED_FIELDS:
+            if projection.get(name, ()) is not None:
+                projection.setdefault(name, set()).add(key)
+        else:
+            projection[name] = None
+    return projection
+
+
+def _to_snake_case(json_name):
+    return _CAMEL_CASE_PATTERN.sub(lambda match: '_' + match.group(0).lower(), json_name)
+
+
+def project_json(expt_run, projection):
+    """
+    Returns the fields of a JSON ``ExperimentRun`` selected by `projection`, from :func:`parse_fields`.
+
+    """
+    result = {}
+    for json_name, value in expt_run.items():
+        name = _to_snake_case(json_name)
+        if name not in projection:
+            continue
+        keys = projection[name]
+        if keys is None:
+            result[json_name] = value
+        else:
+            result[json_name] = [element for element in value
+                                 if element.get('key', element.get('attribute', {}).get('key')) in keys]
+    return result
+
+
+def project_proto(expt_run, projection):
+    """
+    Returns a copy of `protobuf` ``ExperimentRun`` `expt_run` with only the fields selected by
+    `projection`, from :func:`parse_fields`.
+
+    """
+    result = type(expt_run)()
+    for field_desc, value in expt_run.ListFields():
+        if field_desc.name not in projection:
+            continue
+        keys = projection[field_desc.name]
+        if field_desc.label == field_desc.LABEL_REPEATED:
+            getattr(result, field_desc.name).extend(
+                element for element in value
+                if keys is None or (element.attribute.key if field_desc.name == 'observations' else element.key) in keys
+            )
+        elif field_desc.message_type is not None:
+            getattr(result, field_desc.name).CopyFrom(value)
+        else:
+            setattr(result, field_desc.name, value)
+    return result
+
+
+def project_proto_bytes(content, projection, descriptor):
+    """
+    Returns the wire format of a `protobuf` ``ExperimentRun`` with only the fields selected by
+    `projection`, from :func:`parse_fields`, without decoding the fields that are dropped.
+
+    Parameters
+    ----------
+    content : bytes
+        Wire format of the ``ExperimentRun``.
+    projection : dict
+        As returned by :func:`parse_fields`.
+    descriptor : google.protobuf.descriptor.Descriptor
+        Descriptor of ``ExperimentRun``.
+
+    """
+    content = memoryview(content)
+    kept = []
+    for field_number, start, value_start, end in _utils.iter_wire_fields(content):
+        field_desc = descriptor.fields_by_number.get(field_number)
+        if field_desc is None or field_desc.name not in projection:
+            continue
+        keys = projection[field_desc.name]
+        if keys is None or _encoded_key(content[value_start:end], field_desc.message_type) in keys:
+            kept.append(content[start:end])
+    return b"".join(kept)
+
+
+def _encoded_key(content, descriptor):
+    """
+    Returns the key of an encoded ``KeyValue`` or ``Artifact``, or of an ``Observation``'s attribute.
+
+    """
+    field_desc = descriptor.fields_by_name.get('key') or descriptor.fields_by_name['attribute']
+    for field_number, _, value_start, end in _utils.iter_wire_fields(content):
+        if field_number == field_desc.number:
+            if field_desc.message_type is not None:
+                return _encoded_key(content[value_start:end], field_desc.message_type)
+            return bytes(content[value_start:end]).decode('utf-8')
+    return ""
+
+
+def _format_condition(condition):
+    key, op, value = condition
+    if op in ('exists', 'missing'):
+        return "{} {}".format(key, op)
+    return "{} {} {!r}".format(key, op, value)
+
+
+class Query:
+    """
+    Predicate on Experiment Run properties, composable with ``&``, ``|``, and ``~``.
+
+    A Query can be passed anywhere a predicate string is accepted, such as :meth:`Project.find`.
+    It is compiled once, on first use, into as few backend requests as the backend can evaluate:
+    each alternative of an ``|`` costs one request, which are sent concurrently.
+
+    Parameters
+    ----------
+    predicate : str
+        A comparison between a dot-delimited Experiment Run property and a literal, such as
+        ``"metrics.accuracy >= .8"``; a range, such as ``".8 <= metrics.accuracy < .9"``; or a
+        membership test, such as ``"hyperparameters.optimizer in ['adam', 'sgd']"``.
+
+    Notes
+    -----
+    As with predicate strings, a comparison only matches Experiment Runs that have the key being
+    compared, so ``~Query("metrics.accuracy >= .8")`` matches Experiment Runs whose accuracy is
+    below ``.8``, but not ones without an accuracy. Use :meth:`missing` for the latter.
+
+    Examples
+    --------
+    >>> query = (Query("hyperparameters.optimizer in ['adam', 'sgd']")
+    ...          & (Query("metrics.accuracy >= .8") | ~Query.exists("metrics.accuracy")))
+    >>> proj.find(query)
+    <ExperimentRuns containing 12 runs>
+
+    """
+    def __init__(self, predicate=None, *, _node=None):
+        if _node is not None:
+            self._node = _node
+        elif predicate is not None:
+            self._node = ('and', [('cond', condition) for condition in parse_predicate(predicate)])
+        else:
+            raise ValueError("insufficient arguments")
+        self._dnf = None
+
+    @classmethod
+    def exists(cls, key):
+        """
+        Returns a Query matching Experiment Runs that have a value for `key`.
+
+        Parameters
+        ----------
+        key : str
+            Dot-delimited Experiment Run property, such as ``"metrics.accuracy"``.
+
+        """
+        return cls(_node=('cond', (key, 'exists', None)))
+
+    @classmethod
+    def missing(cls, key):
+        """
+        Returns a Query matching Experiment Runs that do not have a value for `key`.
+
+        Parameters
+        ----------
+        key : str
+            Dot-delimited Experiment Run property, such as ``"metrics.accuracy"``.
+
+        """
+        return cls(_node=('cond', (key, 'missing', None)))
+
+    @classmethod
+    def from_where(cls, where):
+        """
+        Returns `where` as a Query.
+
+        Parameters
+        ----------
+        where : str or list of str or :class:`Query`
+            Predicates, all of which must hold. An empty list matches every Experiment Run.
+
+        """
+        if isinstance(where, cls):
+            return where
+        if isinstance(where, str):
+            return cls(where)
+        return cls(_node=('and', [cls.from_where(item)._node for item in where]))
+
+    def __and__(self, other):
+        if not isinstance(other, Query):
+            return NotImplemented
+        return Query(_node=('and', [self._node, other._node]))
+
+    def __or__(self, other):
+        if not isinstance(other, Query):
+            return NotImplemented
+        return Query(_node=('or', [self._node, other._node]))
+
+    def __invert__(self):
+        return Query(_node=('not', self._node))
+
+    def __repr__(self):
+        return "<Query matching {}>".format(
+            " OR ".join("({})".format(" AND ".join(map(_format_condition, conjunct)))
+                        for conjunct in self.compile()))
+
+    def compile(self):
+        """
+        Returns this Query in disjunctive normal form.
+
+        Returns
+        -------
+        list of tuple of tuple of (str, str, object)
+            Alternatives, each of which is a tuple of ``(key, operator, value)`` conditions that
+            must all hold.
+
+        """
+        if self._dnf is None:
+            dnf = []
+            for conjunct in _to_dnf(self._node, negate=False):
+                conjunct = tuple(sorted(set(conjunct), key=repr))
+                if conjunct not in dnf:
+                    dnf.append(conjunct)
+            self._dnf = dnf
+        return self._dnf
+
+
+def _to_dnf(node, negate):
+    kind, child = node
+    if kind == 'cond':
+        return _negate(child) if negate else [(child,)]
+    elif kind == 'not':
+        return _to_dnf(child, not negate)
+    elif (kind == 'and') != negate:  # AND, or NOT OR
+        return [tuple(itertools.chain.from_iterable(conjuncts))
+                for conjuncts in itertools.product(*(_to_dnf(grandchild, negate) for grandchild in child))]
+    else:  # OR, or NOT AND
+        return list(itertools.chain.from_iterable(_to_dnf(grandchild, negate) for grandchild in child))
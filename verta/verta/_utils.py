@@ -1,16 +1,1340 @@
 import os
+import re
 import json
+import time
+import queue
+import atexit
 import pathlib
 import string
+import threading
+import uuid
+import itertools
+import codecs
+import array
+import operator
+import collections
+import collections.abc
+from concurrent import futures
 
 import joblib
+import requests
+from requests.adapters import HTTPAdapter
 
 from google.protobuf import json_format
-from google.protobuf.struct_pb2 import Value, NULL_VALUE
+from google.protobuf import symbol_database
+from google.protobuf.message import DecodeError
+from google.protobuf.struct_pb2 import Value, ListValue, NULL_VALUE
 
 
 _VALID_FLAT_KEY_CHARS = set(string.ascii_letters + string.digits + '_')
 
+_GRPC_PREFIX = "Grpc-Metadata-"
+
+_PROTOBUF_CONTENT_TYPE = "application/x-protobuf"
+_JSON_CONTENT_TYPE = "application/json"
+# prefer binary responses, which the gRPC gateway sends if it has a marshaler for them
+_ACCEPT = "{}, {};q=0.9".format(_PROTOBUF_CONTENT_TYPE, _JSON_CONTENT_TYPE)
+
+# REST endpoint paths whose gRPC method names differ from the last path component
+_GRPC_METHOD_NAMES = {
+    "experiment-run/getAttributes": "getExperimentRunAttributes",
+}
+
+
+class NotFoundError(requests.HTTPError):
+    """
+    Raised by :meth:`Connection.call` when the requested entity does not exist.
+
+    """
+    pass
+
+
+class NameIndex:
+    """
+    Bounded least-recently-used mapping of (parent ID, name) to entity ID.
+
+    A parent can be marked complete once all of its children have been indexed from a bulk listing,
+    in which case a lookup miss under it means that no such child exists. Since other clients may
+    create children in the meantime, a parent only stays complete for `complete_ttl` seconds, and
+    stops being complete sooner if any of its entries are evicted or discarded.
+
+    Parameters
+    ----------
+    maxsize : int, default 100000
+        Maximum number of entries to hold.
+    complete_ttl : float, default 30
+        Number of seconds for which a parent stays complete after being marked.
+
+    """
+    def __init__(self, maxsize=100000, complete_ttl=30):
+        self._maxsize = maxsize
+        self._complete_ttl = complete_ttl
+        self._ids = collections.OrderedDict()
+        self._complete_parents = {}  # parent ID -> time marked complete
+        self._lock = threading.Lock()
+
+    def get(self, parent_id, name):
+        with self._lock:
+            key = (parent_id, name)
+            if key not in self._ids:
+                return None
+            self._ids.move_to_end(key)
+            return self._ids[key]
+
+    def put(self, parent_id, name, id_):
+        with self._lock:
+            key = (parent_id, name)
+            self._ids[key] = id_
+            self._ids.move_to_end(key)
+            while len(self._ids) > self._maxsize:
+                (evicted_parent_id, _), _ = self._ids.popitem(last=False)
+                self._complete_parents.pop(evicted_parent_id, None)
+
+    def discard(self, parent_id, name):
+        with self._lock:
+            self._ids.pop((parent_id, name), None)
+            self._complete_parents.pop(parent_id, None)
+
+    def is_complete(self, parent_id):
+        with self._lock:
+            marked_at = self._complete_parents.get(parent_id)
+            if marked_at is None:
+                return False
+            if time.monotonic() - marked_at > self._complete_ttl:
+                del self._complete_parents[parent_id]
+                return False
+            return True
+
+    def mark_complete(self, parent_id):
+        with self._lock:
+            self._complete_parents[parent_id] = time.monotonic()
+
+
+class PageCursor:
+    """
+    Lazily-fetched sequence of items from a paginated ModelDB endpoint.
+
+    Pages are fetched on demand, and only the `max_pages` most recently used are held in memory.
+
+    Parameters
+    ----------
+    fetch_page : callable
+        Function that takes a 1-based page number and a page size, and returns a list of that
+        page's items and the total number of items (or None if the backend doesn't report it).
+    page_size : int, default 1000
+        Number of items per page.
+    max_pages : int, default 4
+        Maximum number of pages to hold.
+
+    """
+    def __init__(self, fetch_page, page_size=1000, max_pages=4):
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self._max_pages = max_pages
+        self._pages = collections.OrderedDict()
+        self._total = None
+
+    def _page(self, page_index):
+        if page_index in self._pages:
+            self._pages.move_to_end(page_index)
+            return self._pages[page_index]
+
+        items, total = self._fetch_page(page_index + 1, self._page_size)
+        if total is not None:
+            self._total = total
+        elif len(items) < self._page_size:  # last page
+            self._total = page_index*self._page_size + len(items)
+
+        self._pages[page_index] = items
+        while len(self._pages) > self._max_pages:
+            self._pages.popitem(last=False)
+        return items
+
+    @property
+    def total(self):
+        """Number of items, or None if it isn't known without fetching more pages."""
+        return self._total
+
+    def __len__(self):
+        if self._total is None:
+            self._page(0)
+        if self._total is None:  # backend doesn't report counts, so walk to the last page
+            for _ in self:
+                pass
+        return self._total
+
+    def __getitem__(self, index):
+        page_index, offset = divmod(index, self._page_size)
+        items = self._page(page_index)
+        if offset >= len(items):
+            raise IndexError("index out of range")
+        return items[offset]
+
+    def __iter__(self):
+        page_index = 0
+        while True:
+            items = self._page(page_index)
+            for item in items:
+                yield item
+            page_index += 1
+            if len(items) < self._page_size:
+                return
+            if self._total is not None and page_index*self._page_size >= self._total:
+                return
+
+
+class IdDictionary:
+    """
+    Mapping between entity IDs and small integer codes, shared by :class:`IdList`\ s.
+
+    Codes are assigned in order of first appearance and are never reused.
+
+    """
+    def __init__(self):
+        self._codes = {}
+        self._ids = []
+        self._lock = threading.Lock()
+
+    def encode(self, ids):
+        """
+        Returns an ``array`` of the codes of `ids`, assigning new codes as needed.
+
+        """
+        codes = self._codes
+        with self._lock:
+            result = array.array('l')
+            for id_ in ids:
+                code = codes.get(id_)
+                if code is None:
+                    code = codes[id_] = len(self._ids)
+                    self._ids.append(id_)
+                result.append(code)
+            return result
+
+    def decode(self, code):
+        return self._ids[code]
+
+
+class IdList(collections.abc.Sequence):
+    """
+    Immutable sequence of entity IDs, stored as an ``array`` of codes from an :class:`IdDictionary`.
+
+    Besides taking a fraction of the memory of a ``list`` of ``str``\ s, this supports linear-time
+    order-preserving set operations, and cheap slicing and pickling.
+
+    Parameters
+    ----------
+    dictionary : :class:`IdDictionary`
+        Dictionary with which to encode IDs.
+    ids : iterable of str, optional
+        IDs to store.
+
+    """
+    __slots__ = ('_dictionary', '_codes', '_code_set')
+
+    def __init__(self, dictionary, ids=(), *, _codes=None):
+        self._dictionary = dictionary
+        self._codes = _codes if _codes is not None else dictionary.encode(ids)
+        self._code_set = None
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return IdList(self._dictionary, _codes=self._codes[key])
+        return self._dictionary.decode(self._codes[operator.index(key)])
+
+    def __iter__(self):
+        return map(self._dictionary.decode, self._codes)
+
+    def __contains__(self, id_):
+        code = self._dictionary._codes.get(id_)
+        return code is not None and code in self._get_code_set()
+
+    def __eq__(self, other):
+        if isinstance(other, IdList) and other._dictionary is self._dictionary:
+            return self._codes == other._codes
+        if isinstance(other, (IdList, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "IdList({!r})".format(list(self))
+
+    def __reduce__(self):
+        # a single joined string pickles far faster than a list of them
+        return (_unpickle_id_list, ("\n".join(self),))
+
+    def _get_code_set(self):
+        if self._code_set is None:
+            self._code_set = frozenset(self._codes)
+        return self._code_set
+
+    def _other_codes(self, other):
+        if isinstance(other, IdList) and other._dictionary is self._dictionary:
+            return other._codes
+        return self._dictionary.encode(other)
+
+    def union(self, other):
+        """
+        Returns the IDs in this list, followed by those in `other` that aren't in this list.
+
+        """
+        code_set = self._get_code_set()
+        new_codes = array.array('l', (code for code in self._other_codes(other) if code not in code_set))
+        return IdList(self._dictionary, _codes=self._codes + new_codes)
+
+    def intersection(self, other):
+        """
+        Returns the IDs in this list that are also in `other`.
+
+        """
+        other_code_set = frozenset(self._other_codes(other))
+        return IdList(self._dictionary, _codes=array.array('l', (code for code in self._codes
+                                                                 if code in other_code_set)))
+
+    def difference(self, other):
+        """
+        Returns the IDs in this list that aren't in `other`.
+
+        """
+        other_code_set = frozenset(self._other_codes(other))
+        return IdList(self._dictionary, _codes=array.array('l', (code for code in self._codes
+                                                                 if code not in other_code_set)))
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+def _unpickle_id_list(joined_ids):
+    return IdList(IdDictionary(), joined_ids.split("\n") if joined_ids else ())
+
+
+class Connection:
+    """
+    Persistent connection to the ModelDB backend.
+
+    A single instance is shared by a :class:`~verta.modeldbclient.ModelDBClient` and every
+    Project, Experiment, and Experiment Run it creates, so that requests reuse open TCP connections
+    instead of performing a new handshake each time.
+
+    With the default ``"rest"`` transport, messages are sent over a pooled HTTP session as binary
+    `protobuf` if the backend accepts it, and as JSON otherwise. With the ``"grpc"`` transport,
+    they are sent as binary `protobuf` over a single gRPC channel.
+
+    Parameters
+    ----------
+    socket : str
+        Hostname and port of the ModelDB backend, e.g. ``"localhost:8080"``.
+    auth : dict of str to str or None, default None
+        Authentication headers to send with every request.
+    pool_connections : int, default 10
+        Number of per-host connection pools to keep cached.
+    pool_maxsize : int, default 10
+        Maximum number of connections kept alive to each host.
+    pool_block : bool, default False
+        Whether to block when more than `pool_maxsize` requests to a host are in flight, rather than
+        opening (and then discarding) extra connections.
+    keep_alive : bool, default True
+        Whether to reuse connections across requests.
+    transport : {"rest", "grpc"}, default "rest"
+        Protocol with which to communicate with the backend.
+    spool : :class:`Spool` or None, default None
+        If provided, Experiment Run writes are appended to `spool` instead of being sent.
+
+    """
+    _STREAM_CHUNK_SIZE = 64*1024
+
+    def __init__(self, socket, auth=None,
+                 pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True,
+                 transport="rest", spool=None):
+        if transport not in ("rest", "grpc"):
+            raise ValueError("`transport` must be one of {\"rest\", \"grpc\"}")
+
+        self.socket = socket
+        self.auth = auth
+        self.transport = transport
+        self.spool = spool
+        self.expt_run_index = NameIndex()
+        self.id_dictionary = IdDictionary()
+        self.max_concurrency = pool_maxsize
+        self._binary_requests = None  # whether the backend accepts binary request bodies, once known
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                              pool_block=pool_block)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if auth is not None:
+            self.session.headers.update(auth)
+        if not keep_alive:
+            self.session.headers['Connection'] = "close"
+
+        self._channel = None
+        self._stubs = None
+        self._grpc_metadata = None
+        if transport == "grpc":
+            self._connect_grpc()
+
+    def _connect_grpc(self):
+        import grpc
+        from ._protos.public.modeldb import ProjectService_pb2_grpc
+        from ._protos.public.modeldb import ExperimentService_pb2_grpc
+        from ._protos.public.modeldb import ExperimentRunService_pb2_grpc
+
+        self._channel = grpc.insecure_channel(self.socket)
+        self._stubs = {
+            "project": ProjectService_pb2_grpc.ProjectServiceStub(self._channel),
+            "experiment": ExperimentService_pb2_grpc.ExperimentServiceStub(self._channel),
+            "experiment-run": ExperimentRunService_pb2_grpc.ExperimentRunServiceStub(self._channel),
+        }
+        if self.auth is not None:
+            self._grpc_metadata = [(key[len(_GRPC_PREFIX):].lower(), value)
+                                   for key, value in self.auth.items()]
+
+    def verify(self, timeout=10):
+        """
+        Checks that the ModelDB backend is reachable.
+
+        Parameters
+        ----------
+        timeout : float, default 10
+            Number of seconds to wait for the backend.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the backend cannot be reached.
+        requests.HTTPError
+            If the backend reports an error.
+
+        """
+        if self.transport == "grpc":
+            import grpc
+            try:
+                grpc.channel_ready_future(self._channel).result(timeout=timeout)
+            except grpc.FutureTimeoutError:
+                raise requests.ConnectionError("connection failed; please check `host` and `port`")
+            return
+
+        try:
+            response = self.make_request("GET", "project/verifyConnection", timeout=timeout)
+        except requests.ConnectionError:
+            raise requests.ConnectionError("connection failed; please check `host` and `port`")
+
+        if not response.ok:
+            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+
+        if not response.json()['status']:
+            raise requests.HTTPError("the server encountered an error")
+
+    def make_request(self, method, path, **kwargs):
+        """
+        Sends a request to a ModelDB REST endpoint over this connection's pool.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method, e.g. ``"GET"``.
+        path : str
+            Endpoint path relative to ``/v1/``, e.g. ``"experiment-run/logMetric"``.
+        **kwargs
+            Additional arguments passed through to :meth:`requests.Session.request`.
+
+        Returns
+        -------
+        requests.Response
+
+        """
+        return self.session.request(method, "http://{}/v1/{}".format(self.socket, path), **kwargs)
+
+    def call(self, method, path, msg):
+        """
+        Sends `msg` to a ModelDB endpoint and returns the backend's response.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method of the endpoint's REST binding, e.g. ``"GET"``.
+        path : str
+            Endpoint path relative to ``/v1/``, e.g. ``"experiment-run/logMetric"``.
+        msg : google.protobuf.message.Message
+            Request `protobuf` `Message` object, e.g. ``LogMetric``.
+
+        Returns
+        -------
+        google.protobuf.message.Message
+            Response `protobuf` `Message` object, e.g. ``LogMetric.Response``.
+
+        Raises
+        ------
+        NotFoundError
+            If the requested entity does not exist.
+        requests.HTTPError
+            If the backend otherwise reports an error.
+
+        """
+        if self.spool is not None:
+            self.spool.resolve_ids(msg)
+
+        if self.transport == "grpc":
+            response_msg = self._call_grpc(path, msg)
+        else:
+            response = self._send(method, path, msg)
+            _raise_for_status(response)
+            if _is_protobuf(response):
+                response_msg = type(msg).Response.FromString(response.content)
+            else:
+                response_msg = json_bytes_to_proto(response.content, type(msg).Response)
+
+        if self.spool is not None:
+            self.spool.replay_pending(self)  # backend is reachable, so send what was spooled
+        return response_msg
+
+    def call_streaming(self, method, path, msg, field, ids_only=False, trim_json=None, trim_proto=None):
+        """
+        Sends `msg` to a ModelDB endpoint and yields the elements of a repeated field of the
+        backend's response as they arrive.
+
+        Unlike :meth:`call`, the response body is read and parsed incrementally, so memory use does
+        not grow with the number of elements.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method of the endpoint's REST binding, e.g. ``"GET"``.
+        path : str
+            Endpoint path relative to ``/v1/``, e.g. ``"experiment-run/findExperimentRuns"``.
+        msg : google.protobuf.message.Message
+            Request `protobuf` `Message` object, e.g. ``FindExperimentRuns``.
+        field : str
+            Name of a repeated message field of the response, e.g. ``"experiment_runs"``.
+        ids_only : bool, default False
+            Whether to yield only the ``id`` of each element, without building its `Message`.
+        trim_json : callable, optional
+            Function applied to each element of a JSON response before it is converted into a
+            `Message`, e.g. to drop parts of it that won't be used.
+        trim_proto : callable, optional
+            Function applied to the wire format of each element of a binary `protobuf` response
+            before it is decoded, likewise.
+
+        Yields
+        ------
+        google.protobuf.message.Message or str
+            Elements of `field`, or their IDs.
+
+        Raises
+        ------
+        NotFoundError
+            If the requested entity does not exist.
+        requests.HTTPError
+            If the backend otherwise reports an error.
+
+        """
+        if self.spool is not None:
+            self.spool.resolve_ids(msg)
+
+        if self.transport == "grpc":
+            for element in getattr(self._call_grpc(path, msg), field):
+                yield element.id if ids_only else element
+            return
+
+        field_desc = type(msg).Response.DESCRIPTOR.fields_by_name[field]
+        element_cls = symbol_database.Default().GetSymbol(field_desc.message_type.full_name)
+        response = self._send(method, path, msg, stream=True)
+        try:
+            _raise_for_status(response)
+            chunks = response.iter_content(self._STREAM_CHUNK_SIZE)
+            if _is_protobuf(response):
+                for content in _iter_proto_field(chunks, field_desc.number):
+                    element = element_cls.FromString(trim_proto(content) if trim_proto is not None else content)
+                    yield element.id if ids_only else element
+            else:
+                for element in _iter_json_array(chunks, {field_desc.name, field_desc.json_name}):
+                    if ids_only:
+                        yield element.get('id', "")
+                    else:
+                        yield json_to_proto(trim_json(element) if trim_json is not None else element, element_cls)
+        finally:
+            response.close()
+
+    def _send(self, method, path, msg, **kwargs):
+        if method == "GET":
+            return self.make_request(method, path, params=proto_to_json(msg),
+                                     headers={'Accept': _ACCEPT}, **kwargs)
+        elif self._binary_requests is False:
+            return self._post_json(method, path, msg, **kwargs)
+
+        response = self.make_request(method, path, data=msg.SerializeToString(),
+                                     headers={'Content-Type': _PROTOBUF_CONTENT_TYPE, 'Accept': _ACCEPT},
+                                     **kwargs)
+        if self._binary_requests is None:
+            if (response.status_code in (406, 415)
+                    or response.status_code == 400 and _error_code(response) == 3):  # INVALID_ARGUMENT
+                # the backend may not accept binary bodies---a gRPC gateway without a `protobuf`
+                # marshaler reports them as unparseable---so retry as JSON, which fails the same way
+                # if the request itself was invalid
+                response.close()
+                response = self._post_json(method, path, msg, **kwargs)
+                if response.ok:
+                    self._binary_requests = False
+            elif response.ok:
+                self._binary_requests = True
+        return response
+
+    def _post_json(self, method, path, msg, **kwargs):
+        return self.make_request(method, path, data=proto_to_json_bytes(msg),
+                                 headers={'Content-Type': _JSON_CONTENT_TYPE, 'Accept': _ACCEPT},
+                                 **kwargs)
+
+    def call_many(self, method, path, msgs):
+        """
+        Sends each of `msgs` to a ModelDB endpoint, with up to ``pool_maxsize`` requests in flight.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method of the endpoint's REST binding, e.g. ``"POST"``.
+        path : str
+            Endpoint path relative to ``/v1/``, e.g. ``"experiment-run/createExperimentRun"``.
+        msgs : list of google.protobuf.message.Message
+            Request `protobuf` `Message` objects.
+
+        Returns
+        -------
+        list of google.protobuf.message.Message
+            Response `protobuf` `Message` objects, in the same order as `msgs`.
+
+        Raises
+        ------
+        requests.HTTPError
+            If the backend reports an error for any request. Requests are not rolled back.
+
+        """
+        if len(msgs) <= 1:
+            return [self.call(method, path, msg) for msg in msgs]
+
+        with futures.ThreadPoolExecutor(min(self.max_concurrency, len(msgs))) as executor:
+            return list(executor.map(lambda msg: self.call(method, path, msg), msgs))
+
+    def call_many_streaming(self, method, path, msgs, field, **kwargs):
+        """
+        Sends each of `msgs` to a ModelDB endpoint, with up to ``pool_maxsize`` requests in flight,
+        and parses each response as :meth:`call_streaming` does.
+
+        Parameters
+        ----------
+        method, path, msgs
+            As for :meth:`call_many`.
+        field : str
+            Name of a repeated message field of the responses, e.g. ``"experiment_runs"``.
+        **kwargs
+            Additional arguments passed through to :meth:`call_streaming`.
+
+        Returns
+        -------
+        list of list
+            Elements of each response's `field`, in the same order as `msgs`.
+
+        """
+        def call(msg):
+            return list(self.call_streaming(method, path, msg, field, **kwargs))
+
+        if len(msgs) <= 1:
+            return [call(msg) for msg in msgs]
+
+        with futures.ThreadPoolExecutor(min(self.max_concurrency, len(msgs))) as executor:
+            return list(executor.map(call, msgs))
+
+    def _call_grpc(self, path, msg):
+        import grpc
+
+        service, method_name = path.split('/')
+        method_name = _GRPC_METHOD_NAMES.get(path, method_name)
+        try:
+            return getattr(self._stubs[service], method_name)(msg, metadata=self._grpc_metadata)
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                raise NotFoundError("{}: {}".format(e.code().name, e.details()))
+            else:
+                raise requests.HTTPError("{}: {}".format(e.code().name, e.details()))
+
+    def close(self):
+        """
+        Closes all pooled connections.
+
+        """
+        self.session.close()
+        if self._channel is not None:
+            self._channel.close()
+        if self.spool is not None:
+            self.spool.close()
+
+
+def _is_protobuf(response):
+    return response.headers.get('Content-Type', "").startswith(_PROTOBUF_CONTENT_TYPE)
+
+
+def _raise_for_status(response):
+    if response.ok:
+        return
+    elif response.status_code == 404 and _error_code(response) == 5:
+        raise NotFoundError("{}: {}".format(response.status_code, response.reason))
+    else:
+        raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+
+
+def _iter_proto_field(chunks, field_number):
+    """
+    Yields the encoded value of each occurrence of a length-delimited field in a `protobuf`
+    message whose wire format is streamed as `chunks`, skipping other fields.
+
+    """
+    chunks = iter(chunks)
+    buf = b""
+    pos = 0
+
+    def read_varint():
+        nonlocal buf, pos
+        result, shift = 0, 0
+        while True:
+            while pos >= len(buf):
+                buf = buf[pos:] + _next_chunk(chunks)
+                pos = 0
+            byte = buf[pos]
+            pos += 1
+            result |= (byte & 0x7f) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+    def read_bytes(size):
+        nonlocal buf, pos
+        while len(buf) - pos < size:
+            buf = buf[pos:] + _next_chunk(chunks)
+            pos = 0
+        pos += size
+        return buf[pos-size:pos]
+
+    while True:
+        if pos >= len(buf):
+            buf, pos = next(chunks, b""), 0
+            if not buf:
+                return
+            continue
+        tag = read_varint()
+        wire_type = tag & 0x7
+        if wire_type == 0:
+            read_varint()
+        elif wire_type == 1:
+            read_bytes(8)
+        elif wire_type == 2:
+            content = read_bytes(read_varint())
+            if tag >> 3 == field_number:
+                yield content
+        elif wire_type == 5:
+            read_bytes(4)
+        else:
+            raise ValueError("unsupported wire type {} in response".format(wire_type))
+        if pos > len(buf)//2:  # drop what's been consumed
+            buf, pos = buf[pos:], 0
+
+
+def iter_wire_fields(content):
+    """
+    Yields the fields of a `protobuf` message's wire format `content`, without decoding them.
+
+    Yields
+    ------
+    tuple of (int, int, int, int)
+        Each field's number, the offsets in `content` of its start and of its value, and the offset
+        just past its end.
+
+    """
+    pos = 0
+    while pos < len(content):
+        start = pos
+        tag, pos = _read_varint(content, pos)
+        wire_type = tag & 0x7
+        if wire_type == 0:
+            _, end = _read_varint(content, pos)
+        elif wire_type == 1:
+            end = pos + 8
+        elif wire_type == 2:
+            size, pos = _read_varint(content, pos)
+            end = pos + size
+        elif wire_type == 5:
+            end = pos + 4
+        else:
+            raise DecodeError("unsupported wire type {}".format(wire_type))
+        if end > len(content):
+            raise DecodeError("truncated message")
+        yield tag >> 3, start, pos, end
+        pos = end
+
+
+def _read_varint(content, pos):
+    result, shift = 0, 0
+    while True:
+        if pos >= len(content):
+            raise DecodeError("truncated varint")
+        byte = content[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _iter_json_array(chunks, keys):
+    """
+    Yields the elements of the array under any of top-level `keys` of a JSON object streamed as
+    `chunks`, each as soon as it has been received. Other values are skipped.
+
+    """
+    chunks = iter(chunks)
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buf = ""
+    pos = 0
+
+    def fill():
+        nonlocal buf, pos
+        buf = buf[pos:] + text_decoder.decode(_next_chunk(chunks))
+        pos = 0
+
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            fill()
+
+    def expect(chars):
+        nonlocal pos
+        char = skip_whitespace()
+        if char not in chars:
+            raise ValueError("unexpected {!r} in response".format(char))
+        pos += 1
+        return char
+
+    def decode_value():
+        nonlocal buf, pos
+        skip_whitespace()
+        # find where the value ends before decoding it, so each character is only scanned once
+        scanner = _JsonValueScanner(buf[pos])
+        if scanner.scan(buf, pos) is None:
+            pieces = [buf[pos:]]
+            while True:
+                piece = text_decoder.decode(_next_chunk(chunks))
+                pieces.append(piece)
+                if scanner.scan(piece) is not None:
+                    break
+            buf = "".join(pieces)
+            pos = 0
+        value, pos = decoder.raw_decode(buf, pos)
+        return value
+
+    expect("{")
+    if skip_whitespace() == "}":
+        return
+    while True:
+        key = decode_value()
+        expect(":")
+        if key in keys and skip_whitespace() == "[":
+            pos += 1
+            if skip_whitespace() == "]":
+                pos += 1
+            else:
+                while True:
+                    yield decode_value()
+                    if expect(",]") == "]":
+                        break
+        else:
+            decode_value()
+        if expect(",}") == "}":
+            return
+
+
+class _JsonValueScanner:
+    """
+    Finds the end of a JSON value received as consecutive pieces of text, given its first character.
+
+    """
+    _STRING_SPECIAL = re.compile(r'["\\]')
+    _NESTED_SPECIAL = re.compile(r'[][{}"]')
+    _SCALAR_END = re.compile(r'[\s,:\]}]')
+
+    def __init__(self, first_char):
+        self._scalar = first_char not in '[{"'
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def scan(self, text, start=0):
+        """
+        Returns the index in `text` just past the end of the value, or None if it continues past `text`.
+
+        """
+        if self._scalar:  # number, true, false, or null
+            match = self._SCALAR_END.search(text, start)
+            return None if match is None else match.start()
+
+        pos = start
+        while True:
+            if self._escaped:
+                if pos >= len(text):
+                    return None
+                pos += 1
+                self._escaped = False
+            pattern = self._STRING_SPECIAL if self._in_string else self._NESTED_SPECIAL
+            match = pattern.search(text, pos)
+            if match is None:
+                return None
+            char, pos = match.group(), match.end()
+            if self._in_string:
+                if char == "\\":
+                    self._escaped = True
+                else:
+                    self._in_string = False
+                    if self._depth == 0:
+                        return pos
+            elif char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return pos
+
+
+def _next_chunk(chunks):
+    chunk = next(chunks, b"")
+    if not chunk:
+        raise ValueError("response ended unexpectedly")
+    return chunk
+
+
+def _error_code(response):
+    if response.headers.get('Content-Type', "").startswith(_PROTOBUF_CONTENT_TYPE):
+        from google.rpc import status_pb2
+        try:
+            return status_pb2.Status.FromString(response.content).code
+        except DecodeError:
+            return None
+    try:
+        return response.json().get('code')
+    except ValueError:  # not a gRPC gateway error body
+        return None
+
+
+class RequestQueue:
+    """
+    Bounded FIFO of requests sent to the ModelDB backend by a background worker.
+
+    Requests are sent in the order they were put, over `conn`. The first error encountered by the
+    worker is held and raised by the next call to :meth:`put`, :meth:`flush`, or :meth:`close`.
+    A request's callback, if any, is called by the worker only once the request has succeeded.
+
+    Parameters
+    ----------
+    conn : :class:`Connection`
+        Connection over which to send requests.
+    maxsize : int, default 1000
+        Maximum number of pending requests; :meth:`put` blocks while the queue is full.
+
+    """
+    def __init__(self, conn, maxsize=1000):
+        self._conn = conn
+        self._queue = queue.Queue(maxsize)
+        self._error = None
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _drain(self):
+        while True:
+            request = self._queue.get()
+            try:
+                if request is None:
+                    return
+                method, path, msg, on_success = request
+                self._conn.call(method, path, msg)
+                if on_success is not None:
+                    on_success()
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def put(self, method, path, msg, on_success=None):
+        """
+        Enqueues a request to be sent by the background worker.
+
+        Parameters are as for :meth:`Connection.call`, plus
+
+        Parameters
+        ----------
+        on_success : callable, optional
+            Function of no arguments to call after the request has been sent successfully.
+
+        """
+        if self._closed:
+            raise RuntimeError("cannot put a request into a closed queue")
+        self._raise_error()
+        self._queue.put((method, path, msg, on_success))
+
+    def flush(self):
+        """
+        Blocks until all pending requests have been sent.
+
+        """
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """
+        Sends all pending requests and stops the background worker.
+
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+            atexit.unregister(self.close)
+        self._raise_error()
+
+
+class Spool:
+    """
+    Append-only on-disk log of requests deferred until the ModelDB backend is reachable.
+
+    Each record is one JSON line in the file at `path`, tagged with a unique record ID. As each record
+    is replayed, its ID and the byte offset just past it---along with the backend ID that a
+    placeholder ID has resolved to---are appended to a journal at ``<path>.checkpoint``, so that a
+    replay which is interrupted and restarted---even by a different process---resumes after the
+    records that were already sent instead of re-sending them. Lines that cannot be parsed, such as
+    one left partially written by a process that was killed, are moved to ``<path>.corrupt`` instead
+    of blocking the rest of the log.
+
+    Pending records are replayed whenever :meth:`replay` is called, and opportunistically by
+    :meth:`replay_pending` once the backend is known to be reachable.
+
+    Parameters
+    ----------
+    path : str
+        File system path of the spool. It will be created if it does not already exist.
+    create : callable
+        Function that takes a :class:`Connection` and a ``"create"`` record (with resolved
+        `parent_ids`) and returns the backend ID of the gotten or created entity.
+
+    """
+    _PLACEHOLDER_PREFIX = "spool-"
+
+    def __init__(self, path, create):
+        self.path = path
+        self._checkpoint_path = path + ".checkpoint"
+        self._corrupt_path = path + ".corrupt"
+        self._create = create
+        self._lock = threading.Lock()  # guards appends to the spool
+        self._replay_lock = threading.Lock()  # held while replaying, which may take many network calls
+        self._replaying_thread = None
+
+        dirpath = os.path.dirname(path)
+        if dirpath:
+            pathlib.Path(dirpath).mkdir(parents=True, exist_ok=True)
+        self._file = open(path, 'a+b')
+
+        self._replayed = set()
+        self._ids = {}
+        self._scan_offset = 0  # bytes of the spool that have been replayed, skipped, or quarantined
+        self._checkpoint_offset = 0  # bytes of the journal that have been read
+        self._load_checkpoint()
+
+    def _load_checkpoint(self):
+        """
+        Reads new entries from the journal, which may also have been written by other processes.
+
+        """
+        if not os.path.exists(self._checkpoint_path):
+            return
+        with open(self._checkpoint_path, 'rb') as f:
+            f.seek(self._checkpoint_offset)
+            for line in f:
+                if not line.endswith(b'\n'):  # entry may still be being written
+                    break
+                self._checkpoint_offset += len(line)
+                try:
+                    entry = json.loads(line.decode('utf-8'))
+                except ValueError:  # interrupted while journaling, so the record will be re-sent
+                    continue
+                self._replayed.add(entry['key'])
+                self._scan_offset = max(self._scan_offset, entry['end'])
+                if entry.get('placeholder') is not None:
+                    self._ids[entry['placeholder']] = entry['id']
+
+    def _append(self, record):
+        record['record_id'] = str(uuid.uuid4())
+        with self._lock:
+            _append_line(self._file, json.dumps(record).encode('utf-8'))
+
+    def _commit(self, key, end, placeholder=None, id_=None):
+        if key in self._replayed:  # already committed
+            return
+        entry = {'key': key, 'end': end, 'placeholder': placeholder, 'id': id_}
+        with open(self._checkpoint_path, 'a+b') as f:
+            _append_line(f, json.dumps(entry).encode('utf-8'))
+        self._replayed.add(key)
+        self._scan_offset = max(self._scan_offset, end)
+        if placeholder is not None:
+            self._ids[placeholder] = id_
+
+    def _quarantine(self, line):
+        with open(self._corrupt_path, 'a+b') as f:
+            _append_line(f, line.rstrip(b'\n'))
+
+    def defer_call(self, method, path, msg):
+        """
+        Appends a request to be sent by :meth:`Connection.call` during replay.
+
+        Parameters are as for :meth:`Connection.call`.
+
+        """
+        self._append({'type': "call",
+                      'method': method, 'path': path,
+                      'msg_type': msg.DESCRIPTOR.full_name, 'msg': proto_to_json(msg)})
+
+    def defer_create(self, entity, parent_ids, name, desc=None, tags=None, attrs=None):
+        """
+        Appends the get-or-create of a Project, Experiment, or Experiment Run.
+
+        Parameters
+        ----------
+        entity : {"project", "experiment", "experiment-run"}
+            Type of entity to get or create.
+        parent_ids : list of str
+            IDs (possibly placeholders) of the entity's parents, outermost first.
+        name, desc, tags, attrs
+            As for the entity's constructor.
+
+        Returns
+        -------
+        str
+            Placeholder ID to use for the entity until it has been replayed.
+
+        """
+        placeholder = self._PLACEHOLDER_PREFIX + str(uuid.uuid4())
+        self._append({'type': "create", 'entity': entity, 'placeholder': placeholder,
+                      'parent_ids': parent_ids, 'name': name,
+                      'desc': desc, 'tags': tags, 'attrs': attrs})
+        return placeholder
+
+    def has_pending(self):
+        """
+        Returns whether records may have been appended since the last replay, by any process.
+
+        """
+        return os.path.getsize(self.path) > self._scan_offset
+
+    def resolve(self, id_):
+        """
+        Returns the backend ID for `id_` if it is a replayed placeholder, otherwise `id_` itself.
+
+        """
+        return self._ids.get(id_, id_)
+
+    def _is_unresolved(self, id_):
+        return id_.startswith(self._PLACEHOLDER_PREFIX) and id_ not in self._ids
+
+    def resolve_all(self, conn, ids):
+        """
+        Returns `ids` with placeholders replaced by their backend IDs, first replaying the spool
+        over `conn` if any of them haven't been replayed yet.
+
+        """
+        if (any(self._is_unresolved(id_) for id_ in ids)
+                and self._replaying_thread != threading.get_ident()):
+            self.replay(conn)
+        return [self.resolve(id_) for id_ in ids]
+
+    def resolve_ids(self, msg):
+        """
+        Replaces replayed placeholder IDs in `msg`'s ID fields with their backend IDs, in place.
+
+        ID fields are the string fields named ``id`` or ending in ``_id``, and the repeated string
+        fields ending in ``_ids``.
+
+        """
+        for field_desc in msg.DESCRIPTOR.fields:
+            if field_desc.type != field_desc.TYPE_STRING:
+                continue
+            if field_desc.label == field_desc.LABEL_REPEATED:
+                if not field_desc.name.endswith("_ids"):
+                    continue
+                values = getattr(msg, field_desc.name)
+                if any(value.startswith(self._PLACEHOLDER_PREFIX) for value in values):
+                    resolved = [self.resolve(value) for value in values]
+                    del values[:]
+                    values.extend(resolved)
+            elif field_desc.name == "id" or field_desc.name.endswith("_id"):
+                value = getattr(msg, field_desc.name)
+                if value.startswith(self._PLACEHOLDER_PREFIX):
+                    setattr(msg, field_desc.name, self.resolve(value))
+
+    def replay(self, conn):
+        """
+        Sends all records that have not yet been replayed, in order.
+
+        Parameters
+        ----------
+        conn : :class:`Connection`
+            Connection over which to send deferred requests.
+
+        Returns
+        -------
+        int
+            Number of records replayed.
+
+        """
+        with self._replay_lock:
+            return self._replay(conn)
+
+    def replay_pending(self, conn):
+        """
+        Replays any pending records over `conn`, which has just reached the backend.
+
+        This has no effect if a replay is already in progress, including one that made the call
+        which triggered this. If the replay fails, it is attempted again the next time this is called.
+
+        """
+        if not self.has_pending() or not self._replay_lock.acquire(blocking=False):
+            return
+        try:
+            self._replay(conn)
+        except (requests.ConnectionError, requests.HTTPError):
+            pass
+        finally:
+            self._replay_lock.release()
+
+    def _replay(self, conn):
+        self._load_checkpoint()  # another process may have replayed some records since
+        if not self.has_pending():
+            return 0
+
+        self._replaying_thread = threading.get_ident()
+        try:
+            num_replayed = 0
+            with open(self.path, 'rb') as f:
+                f.seek(self._scan_offset)
+                start = self._scan_offset
+                for line in f:
+                    if not line.endswith(b'\n'):  # final record may still be being written
+                        break
+                    end = start + len(line)
+                    try:
+                        record = json.loads(line.decode('utf-8'))
+                        key = record['record_id']
+                    except (ValueError, KeyError, TypeError):
+                        key = "offset-{}".format(start)  # lines are never rewritten, so its position identifies it
+                        if key not in self._replayed:
+                            self._quarantine(line)
+                            self._commit(key, end)
+                        start = end
+                        continue
+
+                    self._load_checkpoint()
+                    if key not in self._replayed:
+                        if record['type'] == "create":
+                            record['parent_ids'] = [self.resolve(id_) for id_ in record['parent_ids']]
+                            self._commit(key, end, record['placeholder'], self._create(conn, record))
+                        else:
+                            msg_cls = symbol_database.Default().GetSymbol(record['msg_type'])
+                            msg = json_format.ParseDict(record['msg'], msg_cls())
+                            self.resolve_ids(msg)
+                            conn.call(record['method'], record['path'], msg)
+                            self._commit(key, end)
+                        num_replayed += 1
+                    start = end
+            return num_replayed
+        finally:
+            self._replaying_thread = None
+
+    def close(self):
+        self._file.close()
+
+
+def _append_line(f, line):
+    """
+    Appends `line` to `f`, which was opened in ``'a+b'`` mode, starting it on a fresh line.
+
+    """
+    f.seek(0, os.SEEK_END)
+    end = f.tell()
+    if end:
+        f.seek(end - 1)
+        if f.read(1) != b'\n':  # the previous writer was interrupted mid-line
+            line = b'\n' + line
+    f.write(line + b'\n')
+    f.flush()
+
+
+def _stdlib_json_loads(content):
+    if isinstance(content, bytes):  # not accepted by `json` before Python 3.6
+        content = content.decode('utf-8')
+    return json.loads(content)
+
+
+def _stdlib_json_dumps(obj):
+    return json.dumps(obj).encode('utf-8')
+
+
+def _default_json_codec():
+    try:
+        import orjson
+    except ImportError:
+        return _stdlib_json_loads, _stdlib_json_dumps
+    return orjson.loads, orjson.dumps
+
+
+_json_loads, _json_dumps = _default_json_codec()
+
+
+def set_json_codec(loads=None, dumps=None):
+    """
+    Sets the functions used to decode and encode JSON request and response bodies.
+
+    By default, `orjson` is used if it is installed, and the standard library's `json` otherwise.
+
+    Parameters
+    ----------
+    loads : callable, optional
+        Function that takes ``bytes`` and returns a JSON-compliant object, e.g. ``ujson.loads``.
+        If not provided, the default is restored.
+    dumps : callable, optional
+        Function that takes a JSON-compliant object and returns ``bytes`` or ``str``. If not
+        provided, the default is restored.
+
+    """
+    global _json_loads, _json_dumps
+    default_loads, default_dumps = _default_json_codec()
+    _json_loads = loads if loads is not None else default_loads
+    _json_dumps = dumps if dumps is not None else default_dumps
+
 
 def proto_to_json(msg):
     """
@@ -29,9 +1353,9 @@ def proto_to_json(msg):
         JSON object representing `msg`.
 
     """
-    return json.loads(json_format.MessageToJson(msg,
-                                                preserving_proto_field_name=True,
-                                                use_integers_for_enums=True))
+    return json_format.MessageToDict(msg,
+                                     preserving_proto_field_name=True,
+                                     use_integers_for_enums=True)
 
 
 def json_to_proto(response_json, response_cls):
@@ -51,7 +1375,45 @@ def json_to_proto(response_json, response_cls):
         `protobuf` `Message` object represented by `response_json`.
 
     """
-    return json_format.Parse(json.dumps(response_json), response_cls())
+    return json_format.ParseDict(response_json, response_cls())
+
+
+def proto_to_json_bytes(msg):
+    """
+    Encodes a `protobuf` `Message` object as a JSON request body.
+
+    Parameters
+    ----------
+    msg : google.protobuf.message.Message
+        `protobuf` `Message` object.
+
+    Returns
+    -------
+    bytes or str
+        JSON representation of `msg`, as for :func:`proto_to_json`.
+
+    """
+    return _json_dumps(proto_to_json(msg))
+
+
+def json_bytes_to_proto(content, response_cls):
+    """
+    Decodes a JSON response body into a `protobuf` `Message` object.
+
+    Parameters
+    ----------
+    content : bytes
+        JSON representation of a Protocol Buffer message.
+    response_cls : type
+        `protobuf` `Message` subclass, e.g. ``CreateProject.Response``.
+
+    Returns
+    -------
+    google.protobuf.message.Message
+        `protobuf` `Message` object represented by `content`.
+
+    """
+    return json_to_proto(_json_loads(content), response_cls)
 
 
 def python_to_val_proto(val):
@@ -60,7 +1422,7 @@ def python_to_val_proto(val):
 
     Parameters
     ----------
-    val : one of {None, bool, float, int, str}
+    val : one of {None, bool, float, int, str, list}
         Python variable.
 
     Returns
@@ -79,12 +1441,43 @@ def python_to_val_proto(val):
         return Value(string_value=val)
     elif isinstance(val, dict):
         raise NotImplementedError()
-    elif isinstance(val, list):
-        raise NotImplementedError()
+    elif isinstance(val, (list, tuple)):
+        return Value(list_value=ListValue(values=[python_to_val_proto(item) for item in val]))
     else:
         raise ValueError("unsupported type {}".format(type(val)))
 
 
+def iter_chunks(values, size):
+    """
+    Yields successive lists of up to `size` Python scalars from an array-like or iterable.
+
+    Objects that provide ``tolist()``, such as NumPy arrays and PyTorch tensors, are converted a
+    slice at a time in native calls rather than element by element. Other iterables are consumed
+    lazily, so a generator is never held in memory all at once.
+
+    Parameters
+    ----------
+    values : array-like or iterable
+        Sequence of values.
+    size : int
+        Maximum length of each chunk.
+
+    Yields
+    ------
+    list
+
+    """
+    if hasattr(values, 'tolist') and hasattr(values, '__getitem__'):
+        for start in range(0, len(values), size):
+            yield values[start:start + size].tolist()
+    else:
+        iterator = iter(values)
+        chunk = list(itertools.islice(iterator, size))
+        while chunk:
+            yield chunk
+            chunk = list(itertools.islice(iterator, size))
+
+
 def val_proto_to_python(msg):
     """
     Converts a `protobuf` `Value` `Message` object into a Python variable.
@@ -96,7 +1489,7 @@ def val_proto_to_python(msg):
 
     Returns
     -------
-    one of {None, bool, float, int, str}
+    one of {None, bool, float, int, str, list}
         Python variable represented by `msg`.
 
     """
@@ -115,11 +1508,29 @@ def val_proto_to_python(msg):
     if msg.HasField("struct_value"):
         raise NotImplementedError()
     if msg.HasField("list_value"):
-        raise NotImplementedError()
+        return [val_proto_to_python(item) for item in msg.list_value.values]
     else:
         raise ValueError("Value is empty")
 
 
+def generate_default_name(prefix):
+    """
+    Generates a name that will not collide with one generated by another process or host.
+
+    Parameters
+    ----------
+    prefix : str
+        Type of entity being named, e.g. ``"ExperimentRun"``.
+
+    Returns
+    -------
+    str
+        Name consisting of `prefix`, the current time, and a random suffix.
+
+    """
+    return "{} {}{}".format(prefix, str(time.time()).replace('.', ''), uuid.uuid4().hex[:12])
+
+
 def validate_flat_key(key):
     """
     Checks whether `key` contains invalid characters.
@@ -1,6 +1,11 @@
 import re
-import ast
+import copy
+import collections
+import functools
+import heapq
+import itertools
 import time
+from concurrent import futures
 from urllib.parse import urlparse
 
 import requests
@@ -10,6 +15,8 @@ from ._protos.public.modeldb import ProjectService_pb2 as _ProjectService
 from ._protos.public.modeldb import ExperimentService_pb2 as _ExperimentService
 from ._protos.public.modeldb import ExperimentRunService_pb2 as _ExperimentRunService
 from . import _utils
+from . import _query
+from ._query import Query
 
 
 class ModelDBClient:
@@ -31,6 +38,26 @@ class ModelDBClient:
     dev_key : str or None, default None
         Authentication credentials for managed service. If this does not sound familiar, then there
         is no need to set it.
+    pool_connections : int, default 10
+        Number of per-host connection pools to keep cached.
+    pool_maxsize : int, default 10
+        Maximum number of connections kept alive to each host.
+    pool_block : bool, default False
+        Whether to block when more than `pool_maxsize` requests to a host are in flight, rather than
+        opening (and then discarding) extra connections.
+    keep_alive : bool, default True
+        Whether to reuse connections to the ModelDB backend across requests.
+    transport : {"rest", "grpc"}, default "rest"
+        Protocol with which to communicate with the ModelDB backend. ``"grpc"`` sends binary
+        `protobuf` messages over a persistent gRPC channel, in which case `port` must be the port of
+        the backend's gRPC server rather than its REST gateway.
+    spool_path : str or None, default None
+        If provided, enables offline mode: creating Projects, Experiments, and Experiment Runs, and
+        logging to Experiment Runs, will append to an on-disk spool at this path and return
+        immediately, without contacting the backend. The spool is sent to the backend in order
+        whenever it is reachable: after any successful call to it, when an Experiment Run is flushed
+        or closed, and by :meth:`replay_spool`, which can also be called later from another process
+        with the same `spool_path`.
 
     Attributes
     ----------
@@ -39,12 +66,16 @@ class ModelDBClient:
     expt : :class:`Experiment` or None
         Currently active Experiment.
     expt_runs : :class:`ExperimentRuns` or None
-        ExperimentRuns under the currently active Experiment.
+        ExperimentRuns under the currently active Experiment. This is listed once and reused until
+        the active Experiment changes or a run is created with :meth:`set_experiment_run` or
+        :meth:`set_experiment_runs`; use :meth:`Experiment.runs` for an up-to-date listing.
 
     """
-    _GRPC_PREFIX = "Grpc-Metadata-"
+    _GRPC_PREFIX = _utils._GRPC_PREFIX
 
-    def __init__(self, host="localhost", port="8080", email=None, dev_key=None):
+    def __init__(self, host="localhost", port="8080", email=None, dev_key=None,
+                 pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True,
+                 transport="rest", spool_path=None):
         if email is None and dev_key is None:
             auth = None
         elif email is not None and dev_key is not None:
@@ -69,43 +100,59 @@ class ModelDBClient:
 
         # verify connection
         socket = "{}:{}".format(host, port)
+        spool = _utils.Spool(spool_path, _get_or_create_spooled) if spool_path is not None else None
+        conn = _utils.Connection(socket, auth,
+                                 pool_connections, pool_maxsize, pool_block, keep_alive,
+                                 transport, spool)
         try:
-            response = requests.get("http://{}/v1/project/verifyConnection".format(socket), headers=auth)
-        except requests.ConnectionError:
-            raise requests.ConnectionError("connection failed; please check `host` and `port`")
-
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        if not response.json()['status']:
-            raise requests.HTTPError("the server encountered an error")
-
-        print("connection successfully established")
+            conn.verify()
+        except (requests.ConnectionError, requests.HTTPError):
+            if spool is None:
+                raise
+            print("backend unreachable; writes will be spooled to {}".format(spool_path))
+        else:
+            print("connection successfully established")
 
         self._auth = auth
         self._socket = socket
+        self._conn = conn
 
         self.proj = None
         self.expt = None
+        self._expt_runs = None  # (Experiment ID, ExperimentRuns) from the last `expt_runs` access
 
     @property
     def expt_runs(self):
         if self.expt is None:
             return None
-        else:
-            Message = _ExperimentRunService.GetExperimentRunsInProject
-            msg = Message(project_id=self.proj._id)
-            data = _utils.proto_to_json(msg)
-            response = requests.get("http://{}/v1/experiment-run/getExperimentRunsInProject".format(self._socket),
-                                    params=data, headers=self._auth)
-            if response.ok:
-                response_msg = _utils.json_to_proto(response.json(), Message.Response)
-                expt_run_ids = [expt_run.id
-                                for expt_run in response_msg.experiment_runs
-                                if expt_run.experiment_id == self.expt._id]
-                return ExperimentRuns(self._auth, self._socket, expt_run_ids)
-            else:
-                raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        elif self._expt_runs is None or self._expt_runs[0] != self.expt._id:
+            self._expt_runs = (self.expt._id, self.expt.runs())
+        return self._expt_runs[1]
+
+    def replay_spool(self):
+        """
+        Sends everything spooled in offline mode to the backend, in order.
+
+        Deferred Projects, Experiments, and Experiment Runs are gotten or created first, as they
+        would have been online. Records that have already been replayed are skipped, so this can
+        safely be called repeatedly, e.g. until the backend is reachable again.
+
+        Returns
+        -------
+        int
+            Number of spooled records sent.
+
+        Raises
+        ------
+        ValueError
+            If this Client was not created with a `spool_path`.
+        requests.ConnectionError
+            If the backend is unreachable. Records sent before the error will not be sent again.
+
+        """
+        if self._conn.spool is None:
+            raise ValueError("this Client was not created with a `spool_path`")
+        return self._conn.spool.replay(self._conn)
 
     def set_project(self, proj_name=None, desc=None, tags=None, attrs=None):
         """
@@ -142,7 +189,7 @@ class ModelDBClient:
         if self.proj is not None:
             self.expt = None
 
-        proj = Project(self._auth, self._socket,
+        proj = Project(self._conn,
                        proj_name,
                        desc, tags, attrs)
 
@@ -184,14 +231,15 @@ class ModelDBClient:
         if self.proj is None:
             raise AttributeError("a project must first in progress")
 
-        expt = Experiment(self._auth, self._socket,
+        expt = Experiment(self._conn,
                           self.proj._id, expt_name,
                           desc, tags, attrs)
 
         self.expt = expt
         return expt
 
-    def set_experiment_run(self, expt_run_name=None, desc=None, tags=None, attrs=None):
+    def set_experiment_run(self, expt_run_name=None, desc=None, tags=None, attrs=None,
+                           async_logging=False, cache_ttl=None, create_only=False):
         """
         Attaches an Experiment Run under the currently active Experiment to this Client.
 
@@ -210,6 +258,20 @@ class ModelDBClient:
             Tags of the Experiment Run.
         attrs : dict of str to {None, bool, float, int, str}, optional
             Attributes of the Experiment Run.
+        async_logging : bool, default False
+            Whether the Experiment Run's ``log_*`` methods should return immediately and have their
+            requests sent by a background worker. Pending requests are sent before any ``get_*``
+            call, and can be awaited with :meth:`ExperimentRun.flush`; errors are raised by the next
+            ``log_*`` or ``get_*`` call, or by :meth:`ExperimentRun.flush`.
+        cache_ttl : float, optional
+            If provided, the Experiment Run's ``get_*`` methods will be served from a local snapshot
+            of its metadata, which is fetched in a single request and is considered fresh for this
+            many seconds. ``log_*`` calls update the snapshot in place, and
+            :meth:`ExperimentRun.refresh` re-fetches it on demand.
+        create_only : bool, default False
+            Whether to create a new Experiment Run without first checking for an existing one named
+            `expt_run_name`, saving a request. This is always done when `expt_run_name` is not
+            provided, since generated names are unique.
 
         Returns
         -------
@@ -226,9 +288,39 @@ class ModelDBClient:
         if self.expt is None:
             raise AttributeError("an experiment must first in progress")
 
-        return ExperimentRun(self._auth, self._socket,
+        self._expt_runs = None
+        return ExperimentRun(self._conn,
                              self.proj._id, self.expt._id, expt_run_name,
-                             desc, tags, attrs)
+                             desc, tags, attrs, async_logging, cache_ttl, create_only)
+
+
+    def set_experiment_runs(self, specs):
+        """
+        Creates many Experiment Runs under the currently active Experiment at once.
+
+        This is much faster than calling :meth:`set_experiment_run` in a loop; see
+        :meth:`Experiment.create_runs` for details.
+
+        Parameters
+        ----------
+        specs : list of dict or list of str
+            One entry per Experiment Run, as for :meth:`Experiment.create_runs`.
+
+        Returns
+        -------
+        :class:`ExperimentRuns`
+
+        Raises
+        ------
+        AttributeError
+            If an Experiment is not yet in progress.
+
+        """
+        if self.expt is None:
+            raise AttributeError("an experiment must first in progress")
+
+        self._expt_runs = None
+        return self.expt.create_runs(specs)
 
 
 class Project:
@@ -245,9 +337,15 @@ class Project:
     ----------
     name : str
         Name of this Project.
+    description : str
+        Description of this Project.
+    tags : list of str
+        Tags of this Project as of when it was set.
+    date_created : int
+        Unix time in milliseconds at which this Project was created.
 
     """
-    def __init__(self, auth, socket,
+    def __init__(self, conn,
                  proj_name=None,
                  desc=None, tags=None, attrs=None,
                  *, _proj_id=None):
@@ -255,99 +353,88 @@ class Project:
             raise ValueError("cannot specify both `proj_name` and `_proj_id`")
 
         if _proj_id is not None:
-            proj = Project._get(auth, socket, _proj_id=_proj_id)
+            proj = Project._get(conn, _proj_id=_proj_id)
             if proj is not None:
                 print("set existing Project: {}".format(proj.name))
             else:
                 raise ValueError("Project with ID {} not found".format(_proj_id))
-        else:
+        elif conn.spool is not None:
             if proj_name is None:
                 proj_name = Project._generate_default_name()
-            proj = Project._get(auth, socket, proj_name)
+            proj_id = conn.spool.defer_create("project", [], proj_name, desc, tags, attrs)
+            proj = _ProjectService.Project(id=proj_id, name=proj_name)
+            print("deferred setting Project: {}".format(proj.name))
+        elif proj_name is None:  # generated name can't exist yet, so skip the lookup
+            proj = Project._create(conn, Project._generate_default_name(), desc, tags, attrs)
+            print("created new Project: {}".format(proj.name))
+        else:
+            proj = Project._get(conn, proj_name)
             if proj is not None:
                 if any(param is not None for param in (desc, tags, attrs)):
                     raise ValueError("Project with name {} already exists;"
                                      " cannot initialize `desc`, `tags`, or `attrs`".format(proj_name))
                 print("set existing Project: {}".format(proj.name))
             else:
-                proj = Project._create(auth, socket, proj_name, desc, tags, attrs)
+                proj = Project._create(conn, proj_name, desc, tags, attrs)
                 print("created new Project: {}".format(proj.name))
 
-        self._auth = auth
-        self._socket = socket
+        self._conn = conn
         self._id = proj.id
+        self._msg = proj  # snapshot as of creation/retrieval
 
     @property
     def name(self):
-        Message = _ProjectService.GetProjectById
-        msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/project/getProjectById".format(self._socket),
-                                params=data, headers=self._auth)
-        if response.ok:
-            response_msg = _utils.json_to_proto(response.json(), Message.Response)
-            return response_msg.project.name
-        else:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        return self._msg.name
+
+    @property
+    def description(self):
+        return self._msg.description
+
+    @property
+    def tags(self):
+        return list(self._msg.tags)
+
+    @property
+    def date_created(self):
+        return self._msg.date_created
 
     @staticmethod
     def _generate_default_name():
-        return "Project {}".format(str(time.time()).replace('.', ''))
+        return _utils.generate_default_name("Project")
 
     @staticmethod
-    def _get(auth, socket, proj_name=None, *, _proj_id=None):
+    def _get(conn, proj_name=None, *, _proj_id=None):
         if _proj_id is not None:
             Message = _ProjectService.GetProjectById
             msg = Message(id=_proj_id)
-            data = _utils.proto_to_json(msg)
-            response = requests.get("http://{}/v1/project/getProjectById".format(socket),
-                                    params=data, headers=auth)
-
-            if response.ok:
-                response_msg = _utils.json_to_proto(response.json(), Message.Response)
-                return response_msg.project
-            else:
-                if response.status_code == 404 and response.json()['code'] == 5:
-                    return None
-                else:
-                    raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+            try:
+                response_msg = conn.call("GET", "project/getProjectById", msg)
+            except _utils.NotFoundError:
+                return None
+            return response_msg.project
         elif proj_name is not None:
             Message = _ProjectService.GetProjectByName
             msg = Message(name=proj_name)
-            data = _utils.proto_to_json(msg)
-            response = requests.get("http://{}/v1/project/getProjectByName".format(socket),
-                                    params=data, headers=auth)
-
-            if response.ok:
-                response_msg = _utils.json_to_proto(response.json(), Message.Response)
-                return response_msg.project_by_user[0]
-            else:
-                if response.status_code == 404 and response.json()['code'] == 5:
-                    return None
-                else:
-                    raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+            try:
+                response_msg = conn.call("GET", "project/getProjectByName", msg)
+            except _utils.NotFoundError:
+                return None
+            return response_msg.project_by_user[0]
         else:
             raise ValueError("insufficient arguments")
 
     @staticmethod
-    def _create(auth, socket, proj_name, desc=None, tags=None, attrs=None):
+    def _create(conn, proj_name, desc=None, tags=None, attrs=None):
         if attrs is not None:
             attrs = [_CommonService.KeyValue(key=key, value=_utils.python_to_val_proto(value))
                      for key, value in attrs.items()]
 
         Message = _ProjectService.CreateProject
         msg = Message(name=proj_name, description=desc, tags=tags, metadata=attrs)
-        data = _utils.proto_to_json(msg)
-        response = requests.post("http://{}/v1/project/createProject".format(socket),
-                                 json=data, headers=auth)
-
-        if response.ok:
-            response_msg = _utils.json_to_proto(response.json(), Message.Response)
-            return response_msg.project
-        else:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        response_msg = conn.call("POST", "project/createProject", msg)
+        return response_msg.project
 
-    def find(self, where, ret_all_info=False):
+    def find(self, where, ret_all_info=False, fields=None):
         """
         Gets the Experiment Runs from this Project that match predicates `where`.
 
@@ -357,12 +444,18 @@ class Project:
             - a Python boolean operator such as ``>=``
             - a literal value such as ``.8``
 
+        For disjunctions, negations, ranges, membership tests, and key-existence checks, pass a
+        :class:`~verta.Query` instead.
+
         Parameters
         ----------
-        where : str or list of str
+        where : str or list of str or :class:`~verta.Query`
             Predicates specifying Experiment Runs to get.
         ret_all_info : bool, default False
             If False, return an :class:`ExperimentRuns`. Otherwise, return an iterable of `protobuf` `Message`\ s.
+        fields : list of str, optional
+            With `ret_all_info`, only these dot-delimited Experiment Run properties, such as
+            ``"metrics.accuracy"``, are fetched for each Experiment Run, along with its ID.
 
         Returns
         -------
@@ -376,10 +469,10 @@ class Project:
         <ExperimentRuns containing 3 runs>
 
         """
-        expt_runs = ExperimentRuns(self._auth, self._socket)
-        return expt_runs.find(where, ret_all_info, _proj_id=self._id)
+        expt_runs = ExperimentRuns(self._conn)
+        return expt_runs.find(where, ret_all_info, fields, _proj_id=self._id)
 
-    def top_k(self, key, k, ret_all_info=False):
+    def top_k(self, key, k, ret_all_info=False, fields=None):
         """
         Gets the Experiment Runs from this Project with the `k` highest `key`\ s.
 
@@ -393,6 +486,9 @@ class Project:
             Number of Experiment Runs to get.
         ret_all_info : bool, default False
             If False, return an :class:`ExperimentRuns`. Otherwise, return an iterable of `protobuf` `Message`\ s.
+        fields : list of str, optional
+            With `ret_all_info`, only these dot-delimited Experiment Run properties, such as
+            ``"metrics.accuracy"``, are fetched for each Experiment Run, along with its ID.
 
         Returns
         -------
@@ -404,10 +500,10 @@ class Project:
         <ExperimentRuns containing 3 runs>
 
         """
-        expt_runs = ExperimentRuns(self._auth, self._socket)
-        return expt_runs.top_k(key, k, ret_all_info, _proj_id=self._id)
+        expt_runs = ExperimentRuns(self._conn)
+        return expt_runs.top_k(key, k, ret_all_info, fields, _proj_id=self._id)
 
-    def bottom_k(self, key, k, ret_all_info=False):
+    def bottom_k(self, key, k, ret_all_info=False, fields=None):
         """
         Gets the Experiment Runs from this Project with the `k` lowest `key`\ s.
 
@@ -421,6 +517,9 @@ class Project:
             Number of Experiment Runs to get.
         ret_all_info : bool, default False
             If False, return an :class:`ExperimentRuns`. Otherwise, return an iterable of `protobuf` `Message`\ s.
+        fields : list of str, optional
+            With `ret_all_info`, only these dot-delimited Experiment Run properties, such as
+            ``"metrics.accuracy"``, are fetched for each Experiment Run, along with its ID.
 
         Returns
         -------
@@ -432,8 +531,8 @@ class Project:
         <ExperimentRuns containing 3 runs>
 
         """
-        expt_runs = ExperimentRuns(self._auth, self._socket)
-        return expt_runs.bottom_k(key, k, ret_all_info, _proj_id=self._id)
+        expt_runs = ExperimentRuns(self._conn)
+        return expt_runs.bottom_k(key, k, ret_all_info, fields, _proj_id=self._id)
 
 
 class Experiment:
@@ -450,9 +549,15 @@ class Experiment:
     ----------
     name : str
         Name of this Experiment.
+    description : str
+        Description of this Experiment.
+    tags : list of str
+        Tags of this Experiment as of when it was set.
+    date_created : int
+        Unix time in milliseconds at which this Experiment was created.
 
     """
-    def __init__(self, auth, socket,
+    def __init__(self, conn,
                  proj_id=None, expt_name=None,
                  desc=None, tags=None, attrs=None,
                  *, _expt_id=None):
@@ -460,75 +565,78 @@ class Experiment:
             raise ValueError("cannot specify both `expt_name` and `_expt_id`")
 
         if _expt_id is not None:
-            expt = Experiment._get(auth, socket, _expt_id=_expt_id)
+            expt = Experiment._get(conn, _expt_id=_expt_id)
             if expt is not None:
                 print("set existing Experiment: {}".format(expt.name))
             else:
                 raise ValueError("Experiment with ID {} not found".format(_expt_id))
-        elif proj_id is not None:
+        elif proj_id is not None and conn.spool is not None:
             if expt_name is None:
                 expt_name = Experiment._generate_default_name()
-            expt = Experiment._get(auth, socket, proj_id, expt_name)
+            expt_id = conn.spool.defer_create("experiment", [proj_id], expt_name, desc, tags, attrs)
+            expt = _ExperimentService.Experiment(id=expt_id, project_id=proj_id, name=expt_name)
+            print("deferred setting Experiment: {}".format(expt.name))
+        elif proj_id is not None and expt_name is None:  # generated name can't exist yet, so skip the lookup
+            expt = Experiment._create(conn, proj_id, Experiment._generate_default_name(), desc, tags, attrs)
+            print("created new Experiment: {}".format(expt.name))
+        elif proj_id is not None:
+            expt = Experiment._get(conn, proj_id, expt_name)
             if expt is not None:
                 if any(param is not None for param in (desc, tags, attrs)):
                     raise ValueError("Experiment with name {} already exists;"
                                      " cannot initialize `desc`, `tags`, or `attrs`".format(expt_name))
                 print("set existing Experiment: {}".format(expt.name))
             else:
-                expt = Experiment._create(auth, socket, proj_id, expt_name, desc, tags, attrs)
+                expt = Experiment._create(conn, proj_id, expt_name, desc, tags, attrs)
                 print("created new Experiment: {}".format(expt.name))
         else:
             raise ValueError("insufficient arguments")
 
-        self._auth = auth
-        self._socket = socket
+        self._conn = conn
         self._id = expt.id
+        self._msg = expt  # snapshot as of creation/retrieval
 
     @property
     def name(self):
-        Message = _ExperimentService.GetExperimentById
-        msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment/getExperimentById".format(self._socket),
-                                params=data, headers=self._auth)
-        if response.ok:
-            response_msg = _utils.json_to_proto(response.json(), Message.Response)
-            return response_msg.experiment.name
-        else:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        return self._msg.name
+
+    @property
+    def description(self):
+        return self._msg.description
+
+    @property
+    def tags(self):
+        return list(self._msg.tags)
+
+    @property
+    def date_created(self):
+        return self._msg.date_created
 
     @staticmethod
     def _generate_default_name():
-        return "Experiment {}".format(str(time.time()).replace('.', ''))
+        return _utils.generate_default_name("Experiment")
 
     @staticmethod
-    def _get(auth, socket, proj_id=None, expt_name=None, *, _expt_id=None):
+    def _get(conn, proj_id=None, expt_name=None, *, _expt_id=None):
         if _expt_id is not None:
             Message = _ExperimentService.GetExperimentById
             msg = Message(id=_expt_id)
-            data = _utils.proto_to_json(msg)
-            response = requests.get("http://{}/v1/experiment/getExperimentById".format(socket),
-                                    params=data, headers=auth)
+            path = "experiment/getExperimentById"
         elif None not in (proj_id, expt_name):
             Message = _ExperimentService.GetExperimentByName
             msg = Message(project_id=proj_id, name=expt_name)
-            data = _utils.proto_to_json(msg)
-            response = requests.get("http://{}/v1/experiment/getExperimentByName".format(socket),
-                                    params=data, headers=auth)
+            path = "experiment/getExperimentByName"
         else:
             raise ValueError("insufficient arguments")
 
-        if response.ok:
-            response_msg = _utils.json_to_proto(response.json(), Message.Response)
-            return response_msg.experiment
-        else:
-            if response.status_code == 404 and response.json()['code'] == 5:
-                return None
-            else:
-                raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        try:
+            response_msg = conn.call("GET", path, msg)
+        except _utils.NotFoundError:
+            return None
+        return response_msg.experiment
 
     @staticmethod
-    def _create(auth, socket, proj_id, expt_name, desc=None, tags=None, attrs=None):
+    def _create(conn, proj_id, expt_name, desc=None, tags=None, attrs=None):
         if attrs is not None:
             attrs = [_CommonService.KeyValue(key=key, value=_utils.python_to_val_proto(value))
                      for key, value in attrs.items()]
@@ -536,17 +644,92 @@ class Experiment:
         Message = _ExperimentService.CreateExperiment
         msg = Message(project_id=proj_id, name=expt_name,
                       description=desc, tags=tags, attributes=attrs)
-        data = _utils.proto_to_json(msg)
-        response = requests.post("http://{}/v1/experiment/createExperiment".format(socket),
-                                 json=data, headers=auth)
+        response_msg = conn.call("POST", "experiment/createExperiment", msg)
+        return response_msg.experiment
 
-        if response.ok:
-            response_msg = _utils.json_to_proto(response.json(), Message.Response)
-            return response_msg.experiment
-        else:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+    def create_runs(self, specs):
+        """
+        Creates many Experiment Runs under this Experiment at once, e.g. for a hyperparameter sweep.
+
+        Creation requests are sent concurrently over the Client's connection pool, and each run's
+        initial hyperparameters are sent along with its creation request. Unlike
+        :meth:`ModelDBClient.set_experiment_run`, existing Experiment Runs are not looked up, so
+        every spec creates a new Experiment Run.
+
+        Parameters
+        ----------
+        specs : list of dict or list of str
+            One entry per Experiment Run. A dict may contain any of the keys ``"name"``, ``"desc"``,
+            ``"tags"``, ``"attrs"``, and ``"hyperparams"``, which are as for
+            :meth:`ModelDBClient.set_experiment_run` and :meth:`ExperimentRun.log_hyperparameters`.
+            A str is shorthand for ``{"name": <str>}``. Names are generated where not provided.
+
+        Returns
+        -------
+        :class:`ExperimentRuns`
+            The new Experiment Runs, in the same order as `specs`.
+
+        Raises
+        ------
+        requests.HTTPError
+            If any creation fails. Experiment Runs created before the error are not deleted.
+
+        Examples
+        --------
+        >>> runs = expt.create_runs([{"hyperparams": {"C": C, "penalty": penalty}}
+        ...                          for C in [.01, .1, 1] for penalty in ["l1", "l2"]])
+        >>> len(runs)
+        6
+
+        """
+        specs = [{'name': spec} if isinstance(spec, str) else spec for spec in specs]
+        for spec in specs:
+            unknown_keys = set(spec) - {'name', 'desc', 'tags', 'attrs', 'hyperparams'}
+            if unknown_keys:
+                raise ValueError("unrecognized spec keys: {}".format(sorted(unknown_keys)))
+
+        if self._conn.spool is not None:
+            # deferred creation is local and cheap, so there's nothing to batch
+            expt_run_ids = []
+            for spec in specs:
+                expt_run = ExperimentRun(self._conn, self._msg.project_id, self._id, spec.get('name'),
+                                         spec.get('desc'), spec.get('tags'), spec.get('attrs'))
+                if spec.get('hyperparams'):
+                    expt_run.log_hyperparameters(spec['hyperparams'])
+                expt_run_ids.append(expt_run._id)
+            return ExperimentRuns(self._conn, expt_run_ids)
+
+        msgs = [ExperimentRun._create_msg(self._msg.project_id, self._id,
+                                          spec.get('name') or ExperimentRun._generate_default_name(),
+                                          spec.get('desc'), spec.get('tags'), spec.get('attrs'),
+                                          spec.get('hyperparams'))
+                for spec in specs]
+        response_msgs = self._conn.call_many("POST", "experiment-run/createExperimentRun", msgs)
+
+        expt_run_ids = []
+        for response_msg in response_msgs:
+            expt_run = response_msg.experiment_run
+            self._conn.expt_run_index.put(self._id, expt_run.name, expt_run.id)
+            expt_run_ids.append(expt_run.id)
+        return ExperimentRuns(self._conn, expt_run_ids)
+
+    def runs(self):
+        """
+        Gets all Experiment Runs under this Experiment.
+
+        Only the Experiment Runs' IDs are listed, a page at a time as needed if the backend supports
+        pagination, so this is cheap even for an Experiment in a very large Project.
+
+        Returns
+        -------
+        :class:`ExperimentRuns`
+
+        """
+        Message = _ExperimentRunService.GetExperimentRunsInExperiment
+        msg = Message(experiment_id=self._id)
+        return ExperimentRuns._from_query(self._conn, "GET", "experiment-run/getExperimentRunsInExperiment", msg)
 
-    def find(self, where, ret_all_info=False):
+    def find(self, where, ret_all_info=False, fields=None):
         """
         Gets the Experiment Runs from this Experiment that match predicates `where`.
 
@@ -556,12 +739,18 @@ class Experiment:
             - a Python boolean operator such as ``>=``
             - a literal value such as ``.8``
 
+        For disjunctions, negations, ranges, membership tests, and key-existence checks, pass a
+        :class:`~verta.Query` instead.
+
         Parameters
         ----------
-        where : str or list of str
+        where : str or list of str or :class:`~verta.Query`
             Predicates specifying Experiment Runs to get.
         ret_all_info : bool, default False
             If False, return an :class:`ExperimentRuns`. Otherwise, return an iterable of `protobuf` `Message`\ s.
+        fields : list of str, optional
+            With `ret_all_info`, only these dot-delimited Experiment Run properties, such as
+            ``"metrics.accuracy"``, are fetched for each Experiment Run, along with its ID.
 
         Returns
         -------
@@ -575,10 +764,10 @@ class Experiment:
         <ExperimentRuns containing 3 runs>
 
         """
-        expt_runs = ExperimentRuns(self._auth, self._socket)
-        return expt_runs.find(where, ret_all_info, _expt_id=self._id)
+        expt_runs = ExperimentRuns(self._conn)
+        return expt_runs.find(where, ret_all_info, fields, _expt_id=self._id)
 
-    def top_k(self, key, k, ret_all_info=False):
+    def top_k(self, key, k, ret_all_info=False, fields=None):
         """
         Gets the Experiment Runs from this Experiment with the `k` highest `key`\ s.
 
@@ -592,6 +781,9 @@ class Experiment:
             Number of Experiment Runs to get.
         ret_all_info : bool, default False
             If False, return an :class:`ExperimentRuns`. Otherwise, return an iterable of `protobuf` `Message`\ s.
+        fields : list of str, optional
+            With `ret_all_info`, only these dot-delimited Experiment Run properties, such as
+            ``"metrics.accuracy"``, are fetched for each Experiment Run, along with its ID.
 
         Returns
         -------
@@ -603,10 +795,10 @@ class Experiment:
         <ExperimentRuns containing 3 runs>
 
         """
-        expt_runs = ExperimentRuns(self._auth, self._socket)
-        return expt_runs.top_k(key, k, ret_all_info, _expt_id=self._id)
+        expt_runs = ExperimentRuns(self._conn)
+        return expt_runs.top_k(key, k, ret_all_info, fields, _expt_id=self._id)
 
-    def bottom_k(self, key, k, ret_all_info=False):
+    def bottom_k(self, key, k, ret_all_info=False, fields=None):
         """
         Gets the Experiment Runs from this Experiment with the `k` lowest `key`\ s.
 
@@ -620,6 +812,9 @@ class Experiment:
             Number of Experiment Runs to get.
         ret_all_info : bool, default False
             If False, return an :class:`ExperimentRuns`. Otherwise, return an iterable of `protobuf` `Message`\ s.
+        fields : list of str, optional
+            With `ret_all_info`, only these dot-delimited Experiment Run properties, such as
+            ``"metrics.accuracy"``, are fetched for each Experiment Run, along with its ID.
 
         Returns
         -------
@@ -631,8 +826,12 @@ class Experiment:
         <ExperimentRuns containing 3 runs>
 
         """
-        expt_runs = ExperimentRuns(self._auth, self._socket)
-        return expt_runs.bottom_k(key, k, ret_all_info, _expt_id=self._id)
+        expt_runs = ExperimentRuns(self._conn)
+        return expt_runs.bottom_k(key, k, ret_all_info, fields, _expt_id=self._id)
+
+
+# a lazily-executed chain of ExperimentRuns operations, on either a collection (`base`) or a scope
+_QueryPlan = collections.namedtuple('_QueryPlan', ['base', 'proj_id', 'expt_id', 'query', 'sort', 'limit'])
 
 
 class ExperimentRuns:
@@ -654,6 +853,14 @@ class ExperimentRuns:
 
     The individual ``ExperimentRun``\ s themselves, however, are still synchronized with the backend.
 
+    Filtering, sorting, and slicing return collections whose contents are only fetched when first
+    needed, e.g. by ``len()`` or iteration, so that a chain of operations can be sent to the backend in
+    as few requests as possible; :meth:`explain` describes them. Contents are fixed once fetched.
+
+    If the backend supports pagination, collections spanning a whole Project or Experiment are
+    fetched a page at a time as they are iterated or indexed, so Experiment Runs created or deleted
+    in the meantime may shift which runs appear on pages that have not yet been fetched.
+
     Examples
     --------
     >>> runs = expt.find("hyperparameters.hidden size == 256")
@@ -675,38 +882,577 @@ class ExperimentRuns:
                '>=': _ExperimentRunService.OperatorEnum.GTE,
                '<':  _ExperimentRunService.OperatorEnum.LT,
                '<=': _ExperimentRunService.OperatorEnum.LTE}
-    _OP_PATTERN = re.compile(r"({})".format('|'.join(sorted(_OP_MAP.keys(), key=lambda s: len(s), reverse=True))))
-
-    def __init__(self, auth, socket, expt_run_ids=None):
-        self._auth = auth
-        self._socket = socket
-        self._ids = expt_run_ids if expt_run_ids is not None else []
+    if hasattr(_ExperimentRunService.OperatorEnum, 'IN'):
+        _OP_MAP['in'] = _ExperimentRunService.OperatorEnum.IN
+    _FIND_CAN_SORT = {'sort_key', 'ascending'} <= set(_ExperimentRunService.FindExperimentRuns.DESCRIPTOR.fields_by_name)
+    _FIND_CAN_LIMIT = 'page_limit' in _ExperimentRunService.FindExperimentRuns.DESCRIPTOR.fields_by_name
+    _PAGE_SIZE = 1000
+    _MAX_PAGES = 4
+    _ID_CHUNK_SIZE = 1000  # most IDs to send in one request, to stay within request body limits
+    _GET_ID_CHUNK_SIZE = 100  # GET requests carry IDs in the URL, which servers commonly limit to 8 KB
+    _BATCH_SIZE = 100  # Experiment Runs to fetch per request when iterating
+
+    def __init__(self, conn, expt_run_ids=None, *, _cursor=None, _engine=None, _plan=None):
+        self._conn = conn
+        self._cursor = _cursor
+        self._engine = _engine
+        self._plan = _plan
+        if expt_run_ids is not None or (_cursor is None and _plan is None):
+            self._ids = self._to_id_list(expt_run_ids if expt_run_ids is not None else [])
+
+    def _to_id_list(self, expt_run_ids):
+        if isinstance(expt_run_ids, _utils.IdList):
+            return expt_run_ids
+        return _utils.IdList(self._conn.id_dictionary, expt_run_ids)
+
+    def __getattr__(self, name):
+        if name == '_ids' and '_plan' in self.__dict__:
+            self._resolve()
+            if '_ids' not in self.__dict__:
+                # IDs of a paginated collection are only all fetched once something needs them
+                self._ids = self._to_id_list(expt_run.id for expt_run in self._cursor)
+            return self._ids
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
 
     def __repr__(self):
         return "<ExperimentRuns containing {} runs>".format(self.__len__())
 
     def __getitem__(self, key):
         if isinstance(key, int):
+            self._resolve()
+            if '_ids' not in self.__dict__:
+                if key < 0:
+                    key += self.__len__()
+                    if key < 0:
+                        raise IndexError("index out of range")
+                return ExperimentRun(self._conn, _expt_run_id=self._cursor[key].id)
             expt_run_id = self._ids[key]
-            return ExperimentRun(self._auth, self._socket, _expt_run_id=expt_run_id)
+            return ExperimentRun(self._conn, _expt_run_id=expt_run_id)
         elif isinstance(key, slice):
+            if (self._plan is not None and key.start in (None, 0) and key.step in (None, 1)
+                    and key.stop is not None and key.stop >= 0):
+                return self._derive(limit=key.stop)
             expt_run_ids = self._ids[key]
-            return self.__class__(self._auth, self._socket, expt_run_ids)
+            return self.__class__(self._conn, expt_run_ids, _engine=self._engine)
         else:
             raise TypeError("index must be integer or slice, not {}".format(type(key)))
 
+    def __iter__(self):
+        return self.iterate()
+
+    def iterate(self, batch_size=None, cache_ttl=None):
+        """
+        Iterates over the Experiment Runs in this collection, fetching them in batches.
+
+        Each batch is fetched in a single request, and the next batch is fetched in the background
+        while the current one is being iterated over, so iterating over N Experiment Runs takes about
+        ``N / batch_size`` requests. Iterating over the collection directly does the same with the
+        default arguments.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            Number of Experiment Runs to fetch per request. Defaults to 100.
+        cache_ttl : float, optional
+            If provided, each Experiment Run's ``get_*`` methods will be served from the metadata
+            fetched with its batch, which is considered fresh for this many seconds, as with
+            :meth:`ModelDBClient.set_experiment_run`.
+
+        Yields
+        ------
+        :class:`ExperimentRun`
+            Experiment Runs deleted since this collection was fetched are skipped.
+
+        """
+        self._resolve()
+        if batch_size is None:
+            batch_size = self._BATCH_SIZE
+        if '_ids' in self.__dict__:
+            expt_run_ids = iter(self._ids)
+        else:  # pages of IDs are fetched as they're reached
+            expt_run_ids = (expt_run.id for expt_run in self._cursor)
+
+        def batches():
+            while True:
+                batch = list(itertools.islice(expt_run_ids, batch_size))
+                if not batch:
+                    return
+                yield batch
+
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            batch_future = None
+            for batch in itertools.chain(batches(), [None]):
+                next_batch_future = executor.submit(self._request_protos, batch) if batch is not None else None
+                if batch_future is not None:
+                    for expt_run in batch_future.result():
+                        yield ExperimentRun(self._conn, cache_ttl=cache_ttl, _expt_run_msg=expt_run)
+                batch_future = next_batch_future
+
     def __len__(self):
+        self._resolve()
+        if '_ids' not in self.__dict__:
+            return len(self._cursor)
         return len(self._ids)
 
+    @classmethod
+    def _from_query(cls, conn, method, path, msg):
+        """
+        Returns the IDs of the Experiment Runs matched by `msg`, fetched a page at a time as needed
+        if the backend supports it.
+
+        The Experiment Runs' other metadata is only fetched when iterating over them, or by methods
+        such as :meth:`to_numpy`.
+
+        """
+        fields = type(msg).DESCRIPTOR.fields_by_name
+        if 'ids_only' in fields:
+            msg.ids_only = True
+        if 'page_limit' not in fields:
+            # everything comes in one response, so only hold onto the IDs as they're parsed
+            return cls(conn, conn.call_streaming(method, path, msg, 'experiment_runs', ids_only=True))
+
+        has_total = 'total_records' in type(msg).Response.DESCRIPTOR.fields_by_name
+
+        def fetch_page(page_number, page_limit):
+            page_msg = type(msg)()
+            page_msg.CopyFrom(msg)
+            page_msg.page_number = page_number
+            page_msg.page_limit = page_limit
+            response_msg = conn.call(method, path, page_msg)
+            total = response_msg.total_records if has_total else None
+            return list(response_msg.experiment_runs), total
+
+        return cls(conn, _cursor=_utils.PageCursor(fetch_page, cls._PAGE_SIZE, cls._MAX_PAGES))
+
+    def _combine(self, other, operation):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        engine = self._engine if self._engine is other._engine else None
+        return self.__class__(self._conn, operation(self._ids, other._ids), _engine=engine)
+
     def __add__(self, other):
-        if isinstance(other, self.__class__):
-            self_ids_set = set(self._ids)
-            other_ids = [expt_run_id for expt_run_id in other._ids if expt_run_id not in self_ids_set]
-            return self.__class__(self._auth, self._socket, self._ids + other_ids)
+        return self._combine(other, _utils.IdList.union)
+
+    def __or__(self, other):
+        """
+        Returns the Experiment Runs in this collection, followed by those only in `other`.
+
+        """
+        return self._combine(other, _utils.IdList.union)
+
+    def __and__(self, other):
+        """
+        Returns the Experiment Runs in this collection that are also in `other`.
+
+        """
+        return self._combine(other, _utils.IdList.intersection)
+
+    def __sub__(self, other):
+        """
+        Returns the Experiment Runs in this collection that aren't in `other`.
+
+        """
+        return self._combine(other, _utils.IdList.difference)
+
+    def local(self):
+        """
+        Loads the Experiment Runs from this collection for local querying.
+
+        The metrics, hyperparameters, and attributes of all Experiment Runs in this collection are
+        fetched in a single request and held in NumPy arrays. :meth:`find`, :meth:`sort`,
+        :meth:`top_k`, and :meth:`bottom_k` on the returned collection, and on collections derived
+        from it, are then evaluated locally instead of by the backend. Queries on other properties
+        still go to the backend.
+
+        The local snapshot will not reflect metadata logged after this call.
+
+        Returns
+        -------
+        :class:`ExperimentRuns`
+
+        Examples
+        --------
+        >>> runs = proj.find("hyperparameters.hidden size == 256").local()
+        >>> runs.find("metrics.accuracy >= .8").top_k("metrics.accuracy", 3)  # no requests
+        <ExperimentRuns containing 3 runs>
+
+        """
+        from ._local_query import LocalEngine
+
+        columns = self.to_numpy()
+        return self.__class__(self._conn, columns['id'].tolist(), _engine=LocalEngine(columns))
+
+    def _derive(self, query=None, sort=None, limit=None, *, _proj_id=None, _expt_id=None):
+        """
+        Returns a lazy collection of the result of filtering, sorting, and truncating this one.
+
+        """
+        if _proj_id is not None or _expt_id is not None:
+            plan = _QueryPlan(None, _proj_id, _expt_id, query, sort, limit)
+        elif self._plan is not None and query is None and sort is None:
+            # truncating only ever narrows an existing plan
+            limit = limit if self._plan.limit is None else min(limit, self._plan.limit)
+            plan = self._plan._replace(limit=limit)
+        elif self._plan is not None and self._plan.limit is None:
+            # filters and sorts commute, so fold them into this collection's plan
+            if query is not None and self._plan.query is not None:
+                query = self._plan.query & query
+            plan = self._plan._replace(query=query or self._plan.query, sort=sort or self._plan.sort, limit=limit)
+        elif '_ids' in self.__dict__ and not self._ids:
+            return self.__class__(self._conn, _engine=self._engine)
         else:
-            return NotImplemented
+            plan = _QueryPlan(self, None, None, query, sort, limit)
+        return self.__class__(self._conn, _engine=self._engine, _plan=plan)
+
+    def _resolve(self):
+        """
+        Executes this collection's plan, if it hasn't been already.
+
+        """
+        if self._plan is None:
+            return
+        result = self._execute(ids_only=True)
+        if isinstance(result, ExperimentRuns):  # paginated
+            if '_ids' in result.__dict__:
+                self._ids = result._ids
+            else:
+                self._cursor = result._cursor
+        else:
+            self._ids = self._to_id_list(expt_run.id for expt_run in result)
+        self._plan = None
+
+    def _execute(self, ids_only, fields=None):
+        result = None
+        for _, _, step in self._steps(ids_only, fields):
+            result = step(result)
+        return result
 
-    def find(self, where, ret_all_info=False, *, _proj_id=None, _expt_id=None):
+    def _steps(self, ids_only, fields=None):
+        """
+        Plans the requests needed to get this collection's contents, with only `fields` of each
+        Experiment Run if not `ids_only`.
+
+        Returns
+        -------
+        list of tuple of (int, str, callable)
+            Number of requests, description, and function of each step. Each function takes the
+            previous step's result (None for the first step), and returns a list of `protobuf`
+            ``ExperimentRun``\ s, or for a paginated result, an :class:`ExperimentRuns`.
+
+        """
+        plan = self._plan
+        steps = []
+        base = plan.base
+        if base is None:
+            scope = "in Project" if plan.proj_id is not None else "in Experiment"
+        elif base._plan is not None:
+            # resolve `base` itself, so that it doesn't need to be fetched again if it's used later
+            base_steps = base._steps(ids_only=True)
+            for num_requests, description, _ in base_steps[:-1]:
+                steps.append((num_requests, description, lambda result: result))
+            steps.append((base_steps[-1][0], base_steps[-1][1],
+                          lambda _: [_ExperimentRunService.ExperimentRun(id=expt_run_id)
+                                     for expt_run_id in base._ids]))
+            scope = "among the previous step's results"
+        else:
+            if '_ids' not in base.__dict__:
+                # the number of pages isn't known until the first one has been fetched
+                total = base._cursor.total
+                num_pages = None if total is None else -(-total//base._PAGE_SIZE)
+                steps.append((num_pages, "list all IDs of the paginated collection",
+                              lambda _: [_ExperimentRunService.ExperimentRun(id=expt_run_id)
+                                         for expt_run_id in base._ids]))
+            else:
+                steps.append((0, "start from {} Experiment Runs".format(len(base._ids)),
+                              lambda _: [_ExperimentRunService.ExperimentRun(id=expt_run_id)
+                                         for expt_run_id in base._ids]))
+            scope = "among the previous step's results"
+
+        def ids_of(result):
+            return None if result is None else [expt_run.id for expt_run in result]
+
+        proj_id, expt_id = plan.proj_id, plan.expt_id
+        sort_desc = "" if plan.sort is None else ", sorted by {} ({})".format(
+            plan.sort[0], "descending" if plan.sort[1] else "ascending")
+        limit_desc = "" if plan.limit is None else ", first {}".format(plan.limit)
+
+        if plan.query is not None:
+            conjuncts = self._expand_in(plan.query.compile())
+            in_one_request = (len(conjuncts) == 1
+                              and all(operator in self._OP_MAP for _, operator, _ in conjuncts[0])
+                              and (plan.sort is None or self._FIND_CAN_SORT)
+                              and (plan.limit is None or self._FIND_CAN_LIMIT))
+            predicates_desc = " OR ".join(map(self._describe_conjunct, conjuncts))
+            if in_one_request:
+                paged = base is None and plan.sort is None and plan.limit is None and ids_only
+                steps.append((1, "findExperimentRuns {} {}{}{}".format(predicates_desc, scope, sort_desc, limit_desc),
+                              lambda result: self._request_find(conjuncts, proj_id, expt_id, ids_of(result), ids_only,
+                                                                plan.sort, plan.limit, paged, fields)))
+                return steps
+            done = plan.sort is None and plan.limit is None
+            steps.append((len(conjuncts), "findExperimentRuns {} {}".format(predicates_desc, scope),
+                          lambda result: self._request_find(conjuncts, proj_id, expt_id, ids_of(result),
+                                                            ids_only if done else True, fields=fields)))
+            if done:
+                return steps
+            scope = "among the previous step's results"
+            from_scope = False
+        else:
+            from_scope = base is None
+
+        if plan.sort is not None and plan.limit is not None:
+            steps.append((1, "getTopExperimentRuns {}{}{}".format(scope, sort_desc, limit_desc),
+                          lambda result: self._request_top(proj_id if from_scope else None,
+                                                           expt_id if from_scope else None,
+                                                           ids_of(result), plan.sort, plan.limit, ids_only, fields)))
+        elif from_scope and (plan.sort is None or self._FIND_CAN_SORT) and (plan.limit is None or self._FIND_CAN_LIMIT):
+            paged = plan.sort is None and plan.limit is None and ids_only
+            steps.append((1, "findExperimentRuns {}{}{}".format(scope, sort_desc, limit_desc),
+                          lambda result: self._request_find([()], proj_id, expt_id, None, ids_only,
+                                                            plan.sort, plan.limit, paged, fields)))
+        else:
+            if from_scope:
+                steps.append((1, "findExperimentRuns {}".format(scope),
+                              lambda result: self._request_find([()], proj_id, expt_id, None, True)))
+                scope = "among the previous step's results"
+            if plan.sort is not None:
+                steps.append((1, "sortExperimentRuns {}{}".format(scope, sort_desc),
+                              lambda result: self._request_sort(ids_of(result), plan.sort, ids_only, fields)))
+            if plan.limit is not None:
+                steps.append((0, "keep the first {}".format(plan.limit), lambda result: result[:plan.limit]))
+        return steps
+
+    def _describe_conjunct(self, conjunct):
+        num_predicates = sum(operator in self._OP_MAP for _, operator, _ in conjunct)
+        num_checks = len(conjunct) - num_predicates
+        description = "{} predicate{}".format(num_predicates, "" if num_predicates == 1 else "s")
+        if num_checks:
+            description += " + {} local check{}".format(num_checks, "" if num_checks == 1 else "s")
+        return "({})".format(description)
+
+    def explain(self):
+        """
+        Describes the requests that getting this collection's contents will make.
+
+        Operations such as :meth:`find`, :meth:`sort`, :meth:`top_k`, and slicing are not executed
+        until their results are needed, e.g. by ``len()`` or iteration, at which point a chain of
+        them is sent to the backend in as few requests as possible.
+
+        Returns
+        -------
+        str
+
+        Examples
+        --------
+        >>> print(proj.find("metrics.accuracy >= .8").sort("metrics.accuracy", descending=True)[:10].explain())
+        1. findExperimentRuns (1 predicate) in Project [1 request]
+        2. getTopExperimentRuns among the previous step's results, sorted by metrics.accuracy (descending), first 10 [1 request]
+        total: 2 requests
+
+        """
+        if self._plan is None:
+            return "already fetched; no requests"
+
+        steps = self._steps(ids_only=True)
+        lines = []
+        for i, (num_requests, description, _) in enumerate(steps, start=1):
+            if num_requests is None:  # depends on results not yet fetched
+                lines.append("{}. {} [unknown number of requests]".format(i, description))
+            else:
+                lines.append("{}. {} [{} request{}]".format(i, description,
+                                                            num_requests, "" if num_requests == 1 else "s"))
+        known = all(num_requests is not None for num_requests, _, _ in steps)
+        total = sum(1 if num_requests is None else num_requests for num_requests, _, _ in steps)
+        lines.append("total: {}{} request{}".format("" if known else "at least ",
+                                                    total, "" if total == 1 else "s"))
+        return "\n".join(lines)
+
+    def _backend_ids(self, expt_run_ids):
+        """
+        Replaces the placeholder IDs of spooled Experiment Runs in `expt_run_ids` with their backend
+        IDs, replaying the spool first if needed.
+
+        """
+        if self._conn.spool is None or expt_run_ids is None:
+            return expt_run_ids
+        return self._conn.spool.resolve_all(self._conn, expt_run_ids)
+
+    def _chunk_ids(self, expt_run_ids, method="POST"):
+        """
+        Splits `expt_run_ids` into lists small enough to send in one `method` request each.
+
+        """
+        if expt_run_ids is None:
+            return [None]
+        chunk_size = self._GET_ID_CHUNK_SIZE if method == "GET" else self._ID_CHUNK_SIZE
+        return [expt_run_ids[i:i+chunk_size]
+                for i in range(0, len(expt_run_ids), chunk_size)]
+
+    @staticmethod
+    def _merge_sorted(results, sort, limit=None):
+        """
+        Merges lists of `protobuf` ``ExperimentRun``\ s, each already sorted by `sort`.
+
+        `results` must have been fetched with their values for the sort key. Runs without the sort
+        key are placed last.
+
+        """
+        key, descending = sort
+
+        def sort_key(expt_run):
+            has_value, value = _query.get_value(expt_run, key)
+            return (int(descending), value) if has_value else (int(not descending),)
+
+        merged = heapq.merge(*results, key=sort_key, reverse=descending)
+        return list(itertools.islice(merged, limit))
+
+    def _request_find(self, conjuncts, proj_id, expt_id, expt_run_ids, ids_only, sort=None, limit=None, paged=False,
+                      fields=None):
+        if expt_run_ids is not None and not expt_run_ids:
+            return []
+        expt_run_ids = self._backend_ids(expt_run_ids)
+
+        # each alternative is one request per chunk of IDs, with the conditions the backend can't
+        # evaluate checked here
+        chunks = self._chunk_ids(expt_run_ids)
+        merge_sorted = sort is not None and len(chunks) > 1  # needs the sort key's values
+        residual_keys = {key for conjunct in conjuncts for key, operator, _ in conjunct if operator not in self._OP_MAP}
+        needed_fields = self._needed_fields(ids_only, fields, residual_keys | ({sort[0]} if merge_sorted else set()))
+        Message = _ExperimentRunService.FindExperimentRuns
+        msgs, residuals = [], []
+        for conjunct in conjuncts:
+            predicates = [_ExperimentRunService.KeyValueQuery(key=key, value=_utils.python_to_val_proto(value),
+                                                              operator=self._OP_MAP[operator])
+                          for key, operator, value in conjunct if operator in self._OP_MAP]
+            residual = [(key, operator) for key, operator, _ in conjunct if operator not in self._OP_MAP]
+            for chunk in chunks:
+                msg = Message(project_id=proj_id, experiment_id=expt_id, experiment_run_ids=chunk,
+                              predicates=predicates, ids_only=ids_only and not residual and not merge_sorted)
+                if sort is not None:
+                    msg.sort_key, msg.ascending = sort[0], not sort[1]
+                if limit is not None:
+                    msg.page_number, msg.page_limit = 1, limit
+                self._push_down_fields(msg, needed_fields)
+                msgs.append(msg)
+                residuals.append(residual)
+
+        if len(msgs) == 1:
+            if paged and not residuals[0]:
+                # results across a whole Project or Experiment can be arbitrarily many, so page through them
+                return self._from_query(self._conn, "POST", "experiment-run/findExperimentRuns", msgs[0])
+            # parse runs as they arrive, so that those failing the residual checks are never all held at
+            # once, and so that unneeded fields are dropped before being decoded
+            responses = [self._conn.call_streaming("POST", "experiment-run/findExperimentRuns", msgs[0],
+                                                   'experiment_runs', **self._trimmers(needed_fields))]
+        else:
+            responses = self._call_many_runs("POST", "experiment-run/findExperimentRuns", msgs, needed_fields)
+
+        results = [[expt_run for expt_run in response
+                    if all(_query.has_key(expt_run, key) == (operator == 'exists') for key, operator in residual)]
+                   for residual, response in zip(residuals, responses)]
+        if merge_sorted:
+            expt_runs = self._merge_sorted(results, sort, limit)
+        else:
+            expt_runs_by_id = collections.OrderedDict()
+            for expt_run in itertools.chain.from_iterable(results):
+                expt_runs_by_id.setdefault(expt_run.id, expt_run)
+            if expt_run_ids is not None and len(msgs) > 1:
+                expt_runs_by_id = collections.OrderedDict((expt_run_id, expt_runs_by_id[expt_run_id])
+                                                          for expt_run_id in expt_run_ids
+                                                          if expt_run_id in expt_runs_by_id)
+            expt_runs = list(expt_runs_by_id.values())[:limit]
+        return self._project(expt_runs, ids_only, fields)
+
+    def _request_sort(self, expt_run_ids, sort, ids_only, fields=None):
+        if not expt_run_ids:
+            return []
+        expt_run_ids = self._backend_ids(expt_run_ids)
+
+        key, descending = sort
+        chunks = self._chunk_ids(expt_run_ids, "GET")
+        needed_fields = self._needed_fields(ids_only, fields, {key} if len(chunks) > 1 else set())
+        Message = _ExperimentRunService.SortExperimentRuns
+        msgs = [Message(experiment_run_ids=chunk, sort_key=key, ascending=not descending,
+                        ids_only=ids_only and len(chunks) == 1)
+                for chunk in chunks]
+        for msg in msgs:
+            self._push_down_fields(msg, needed_fields)
+        responses = self._call_many_runs("GET", "experiment-run/sortExperimentRuns", msgs, needed_fields)
+        expt_runs = responses[0] if len(responses) == 1 else self._merge_sorted(responses, sort)
+        return self._project(expt_runs, ids_only, fields)
+
+    def _request_top(self, proj_id, expt_id, expt_run_ids, sort, k, ids_only, fields=None):
+        if expt_run_ids is not None and not expt_run_ids:
+            return []
+        expt_run_ids = self._backend_ids(expt_run_ids)
+
+        key, descending = sort
+        chunks = self._chunk_ids(expt_run_ids, "GET")
+        needed_fields = self._needed_fields(ids_only, fields, {key} if len(chunks) > 1 else set())
+        Message = _ExperimentRunService.TopExperimentRunsSelector
+        msgs = [Message(project_id=proj_id, experiment_id=expt_id, experiment_run_ids=chunk,
+                        sort_key=key, ascending=not descending, top_k=k,
+                        ids_only=ids_only and len(chunks) == 1)
+                for chunk in chunks]
+        for msg in msgs:
+            self._push_down_fields(msg, needed_fields)
+        responses = self._call_many_runs("GET", "experiment-run/getTopExperimentRuns", msgs, needed_fields)
+        # the overall top k are among each chunk's top k
+        expt_runs = responses[0] if len(responses) == 1 else self._merge_sorted(responses, sort, k)
+        return self._project(expt_runs, ids_only, fields)
+
+    @staticmethod
+    def _needed_fields(ids_only, fields, extra_keys):
+        """
+        Returns the fields to request: `fields` unless `ids_only`, plus `extra_keys` needed to
+        process the response, or None for all fields.
+
+        """
+        if fields is None:
+            return None
+        needed_fields = extra_keys if ids_only else set(fields) | extra_keys
+        return sorted(needed_fields) if needed_fields else None
+
+    @staticmethod
+    def _trimmers(needed_fields):
+        """
+        Returns arguments for :meth:`Connection.call_streaming` that drop all but `needed_fields` of
+        each Experiment Run before it is decoded.
+
+        """
+        if needed_fields is None:
+            return {}
+        projection = _query.parse_fields(needed_fields)
+        return {'trim_json': functools.partial(_query.project_json, projection=projection),
+                'trim_proto': functools.partial(_query.project_proto_bytes, projection=projection,
+                                                descriptor=_ExperimentRunService.ExperimentRun.DESCRIPTOR)}
+
+    def _call_many_runs(self, method, path, msgs, needed_fields):
+        """
+        Sends `msgs` concurrently, returning each response's Experiment Runs with only `needed_fields`.
+
+        """
+        if needed_fields is None:
+            return [list(response_msg.experiment_runs) for response_msg in self._conn.call_many(method, path, msgs)]
+        return self._conn.call_many_streaming(method, path, msgs, 'experiment_runs', **self._trimmers(needed_fields))
+
+    @staticmethod
+    def _push_down_fields(msg, fields):
+        """
+        Asks the backend for only `fields` of each Experiment Run, if it supports it.
+
+        """
+        if fields is not None and 'fields' in type(msg).DESCRIPTOR.fields_by_name:
+            msg.fields.extend(fields)
+
+    @staticmethod
+    def _project(expt_runs, ids_only, fields):
+        if ids_only or fields is None:
+            return expt_runs
+        projection = _query.parse_fields(fields)
+        return [_query.project_proto(expt_run, projection) for expt_run in expt_runs]
+
+    def find(self, where, ret_all_info=False, fields=None, *, _proj_id=None, _expt_id=None):
         """
         Gets the Experiment Runs from this collection that match predicates `where`.
 
@@ -716,12 +1462,20 @@ class ExperimentRuns:
             - a Python boolean operator such as ``>=``
             - a literal value such as ``.8``
 
+        For disjunctions, negations, ranges, membership tests, and key-existence checks, pass a
+        :class:`~verta.Query` instead.
+
+        The returned collection is only fetched once its contents are needed; see :meth:`explain`.
+
         Parameters
         ----------
-        where : str or list of str
+        where : str or list of str or :class:`~verta.Query`
             Predicates specifying Experiment Runs to get.
         ret_all_info : bool, default False
             If False, return an :class:`ExperimentRuns`. Otherwise, return an iterable of `protobuf` `Message`\ s.
+        fields : list of str, optional
+            With `ret_all_info`, only these dot-delimited Experiment Run properties, such as
+            ``"metrics.accuracy"``, are fetched for each Experiment Run, along with its ID.
 
         Returns
         -------
@@ -737,66 +1491,49 @@ class ExperimentRuns:
         """
         if _proj_id is not None and _expt_id is not None:
             raise ValueError("cannot specify both `_proj_id` and `_expt_id`")
-        elif _proj_id is None and _expt_id is None:
-            if self.__len__() == 0:
-                return self.__class__(self._auth, self._socket)
-            else:
-                expt_run_ids = self._ids
-        else:
-            expt_run_ids = None
+        self._check_fields(ret_all_info, fields)
 
-        predicates = []
-        if isinstance(where, str):
-            where = [where]
-        for predicate in where:
-            # split predicate
-            try:
-                key, operator, value = map(str.strip, self._OP_PATTERN.split(predicate, maxsplit=1))
-            except ValueError:
-                raise ValueError("predicate `{}` must be a two-operand comparison".format(predicate))
+        query = Query.from_where(where)
 
-            # cast operator into protobuf enum variant
-            operator = self._OP_MAP[operator]
+        if self._engine is not None and _proj_id is None and _expt_id is None and not ret_all_info:
+            results = [self._engine.find(self._ids, conjunct) for conjunct in query.compile()]
+            if None not in results:
+                return self.__class__(self._conn,
+                                      self._ids.intersection(itertools.chain.from_iterable(results)),
+                                      _engine=self._engine)
 
-            # parse value
-            try:
-                expr_node = ast.parse(value, mode='eval')
-            except SyntaxError:
-                raise ValueError("value `{}` must be a number or string literal".format(value))
-            value_node = expr_node.body
-            if type(value_node) is ast.Num:
-                value = value_node.n
-            elif type(value_node) is ast.Str:
-                value = value_node.s
-            elif type(value_node) is ast.Compare:
-                raise ValueError("predicate `{}` must be a two-operand comparison".format(predicate))
-            else:
-                raise ValueError("value `{}` must be a number or string literal".format(value))
+        expt_runs = self._derive(query, _proj_id=_proj_id, _expt_id=_expt_id)
+        if ret_all_info:
+            return expt_runs._execute(ids_only=False, fields=fields) if expt_runs._plan is not None else []
+        return expt_runs
 
-            predicates.append(_ExperimentRunService.KeyValueQuery(key=key, value=_utils.python_to_val_proto(value),
-                                                                  operator=operator))
-        Message = _ExperimentRunService.FindExperimentRuns
-        msg = Message(project_id=_proj_id, experiment_id=_expt_id, experiment_run_ids=expt_run_ids,
-                      predicates=predicates, ids_only=not ret_all_info)
-        data = _utils.proto_to_json(msg)
-        response = requests.post("http://{}/v1/experiment-run/findExperimentRuns".format(self._socket),
-                                 json=data, headers=self._auth)
-        if response.ok:
-            response_msg = _utils.json_to_proto(response.json(), Message.Response)
-            if ret_all_info:
-                return response_msg.experiment_runs
-            else:
-                return self.__class__(self._auth, self._socket,
-                                      [expt_run.id for expt_run in response_msg.experiment_runs])
-        else:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+    @staticmethod
+    def _check_fields(ret_all_info, fields):
+        if fields is not None and not ret_all_info:
+            raise ValueError("`fields` can only be specified with `ret_all_info=True`")
 
-    def sort(self, key, descending=False, ret_all_info=False):
+    def _expand_in(self, conjuncts):
+        """
+        Rewrites ``in`` conditions as alternatives of ``==`` if the backend can't evaluate them.
+
+        """
+        if 'in' in self._OP_MAP:
+            return conjuncts
+        expanded = []
+        for conjunct in conjuncts:
+            choices = [[(key, '==', item) for item in value] if operator == 'in' else [(key, operator, value)]
+                       for key, operator, value in conjunct]
+            expanded.extend(itertools.product(*choices))
+        return expanded
+
+    def sort(self, key, descending=False, ret_all_info=False, fields=None):
         """
         Sorts the Experiment Runs from this collection by `key`.
 
         A `key` is a string containing a dot-delimited Experiment Run property such as ``metrics.accuracy``.
 
+        The returned collection is only fetched once its contents are needed; see :meth:`explain`.
+
         Parameters
         ----------
         key : str
@@ -805,6 +1542,9 @@ class ExperimentRuns:
             Order in which to return sorted Experiment Runs.
         ret_all_info : bool, default False
             If False, return an :class:`ExperimentRuns`. Otherwise, return an iterable of `protobuf` `Message`\ s.
+        fields : list of str, optional
+            With `ret_all_info`, only these dot-delimited Experiment Run properties, such as
+            ``"metrics.accuracy"``, are fetched for each Experiment Run, along with its ID.
 
         Returns
         -------
@@ -816,31 +1556,25 @@ class ExperimentRuns:
         <ExperimentRuns containing 3 runs>
 
         """
-        if self.__len__() == 0:
-            return self.__class__(self._auth, self._socket)
+        self._check_fields(ret_all_info, fields)
+        if self._engine is not None and not ret_all_info:
+            result = self._engine.sort(self._ids, key, descending)
+            if result is not None:
+                return self.__class__(self._conn, result, _engine=self._engine)
 
-        Message = _ExperimentRunService.SortExperimentRuns
-        msg = Message(experiment_run_ids=self._ids,
-                      sort_key=key, ascending=not descending, ids_only=not ret_all_info)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/sortExperimentRuns".format(self._socket),
-                                params=data, headers=self._auth)
-        if response.ok:
-            response_msg = _utils.json_to_proto(response.json(), Message.Response)
-            if ret_all_info:
-                return response_msg.experiment_runs
-            else:
-                return self.__class__(self._auth, self._socket,
-                                      [expt_run.id for expt_run in response_msg.experiment_runs])
-        else:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        expt_runs = self._derive(sort=(key, descending))
+        if ret_all_info:
+            return expt_runs._execute(ids_only=False, fields=fields) if expt_runs._plan is not None else []
+        return expt_runs
 
-    def top_k(self, key, k, ret_all_info=False, *, _proj_id=None, _expt_id=None):
+    def top_k(self, key, k, ret_all_info=False, fields=None, *, _proj_id=None, _expt_id=None):
         """
         Gets the Experiment Runs from this collection with the `k` highest `key`\ s.
 
         A `key` is a string containing a dot-delimited Experiment Run property such as ``metrics.accuracy``.
 
+        The returned collection is only fetched once its contents are needed; see :meth:`explain`.
+
         Parameters
         ----------
         key : str
@@ -849,6 +1583,9 @@ class ExperimentRuns:
             Number of Experiment Runs to get.
         ret_all_info : bool, default False
             If False, return an :class:`ExperimentRuns`. Otherwise, return an iterable of `protobuf` `Message`\ s.
+        fields : list of str, optional
+            With `ret_all_info`, only these dot-delimited Experiment Run properties, such as
+            ``"metrics.accuracy"``, are fetched for each Experiment Run, along with its ID.
 
         Returns
         -------
@@ -860,38 +1597,16 @@ class ExperimentRuns:
         <ExperimentRuns containing 3 runs>
 
         """
-        if _proj_id is not None and _expt_id is not None:
-            raise ValueError("cannot specify both `_proj_id` and `_expt_id`")
-        elif _proj_id is None and _expt_id is None:
-            if self.__len__() == 0:
-                return self.__class__(self._auth, self._socket)
-            else:
-                expt_run_ids = self._ids
-        else:
-            expt_run_ids = None
-
-        Message = _ExperimentRunService.TopExperimentRunsSelector
-        msg = Message(project_id=_proj_id, experiment_id=_expt_id, experiment_run_ids=expt_run_ids,
-                      sort_key=key, ascending=False, top_k=k, ids_only=not ret_all_info)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getTopExperimentRuns".format(self._socket),
-                                params=data, headers=self._auth)
-        if response.ok:
-            response_msg = _utils.json_to_proto(response.json(), Message.Response)
-            if ret_all_info:
-                return response_msg.experiment_runs
-            else:
-                return self.__class__(self._auth, self._socket,
-                                      [expt_run.id for expt_run in response_msg.experiment_runs])
-        else:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        return self._top_k(key, k, True, ret_all_info, fields, _proj_id, _expt_id)
 
-    def bottom_k(self, key, k, ret_all_info=False, *, _proj_id=None, _expt_id=None):
+    def bottom_k(self, key, k, ret_all_info=False, fields=None, *, _proj_id=None, _expt_id=None):
         """
         Gets the Experiment Runs from this collection with the `k` lowest `key`\ s.
 
         A `key` is a string containing a dot-delimited Experiment Run property such as ``metrics.accuracy``.
 
+        The returned collection is only fetched once its contents are needed; see :meth:`explain`.
+
         Parameters
         ----------
         key : str
@@ -900,6 +1615,9 @@ class ExperimentRuns:
             Number of Experiment Runs to get.
         ret_all_info : bool, default False
             If False, return an :class:`ExperimentRuns`. Otherwise, return an iterable of `protobuf` `Message`\ s.
+        fields : list of str, optional
+            With `ret_all_info`, only these dot-delimited Experiment Run properties, such as
+            ``"metrics.accuracy"``, are fetched for each Experiment Run, along with its ID.
 
         Returns
         -------
@@ -911,31 +1629,134 @@ class ExperimentRuns:
         <ExperimentRuns containing 3 runs>
 
         """
-        if _proj_id is not None and _expt_id is not None:
+        return self._top_k(key, k, False, ret_all_info, fields, _proj_id, _expt_id)
+
+    def _top_k(self, key, k, descending, ret_all_info, fields, proj_id, expt_id):
+        if proj_id is not None and expt_id is not None:
             raise ValueError("cannot specify both `_proj_id` and `_expt_id`")
-        elif _proj_id is None and _expt_id is None:
-            if self.__len__() == 0:
-                return self.__class__(self._auth, self._socket)
-            else:
-                expt_run_ids = self._ids
-        else:
-            expt_run_ids = None
+        self._check_fields(ret_all_info, fields)
 
-        Message = _ExperimentRunService.TopExperimentRunsSelector
-        msg = Message(project_id=_proj_id, experiment_id=_expt_id, experiment_run_ids=expt_run_ids,
-                      sort_key=key, ascending=True, top_k=k, ids_only=not ret_all_info)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getTopExperimentRuns".format(self._socket),
-                                params=data, headers=self._auth)
-        if response.ok:
-            response_msg = _utils.json_to_proto(response.json(), Message.Response)
-            if ret_all_info:
-                return response_msg.experiment_runs
+        if self._engine is not None and proj_id is None and expt_id is None and not ret_all_info:
+            result = self._engine.top_k(self._ids, key, k, descending=descending)
+            if result is not None:
+                return self.__class__(self._conn, result, _engine=self._engine)
+
+        expt_runs = self._derive(sort=(key, descending), limit=k, _proj_id=proj_id, _expt_id=expt_id)
+        if ret_all_info:
+            return expt_runs._execute(ids_only=False, fields=fields) if expt_runs._plan is not None else []
+        return expt_runs
+
+    def _fetch_protos(self):
+        self._resolve()
+        return self._request_protos(self._ids)
+
+    def _request_protos(self, expt_run_ids):
+        """
+        Fetches the full `protobuf` ``ExperimentRun``\ s for `expt_run_ids`, in order, skipping any
+        that no longer exist.
+
+        """
+        expt_run_ids = self._backend_ids(expt_run_ids)
+        Message = _ExperimentRunService.FindExperimentRuns
+        msgs = [Message(experiment_run_ids=chunk, ids_only=False) for chunk in self._chunk_ids(expt_run_ids)]
+        response_msgs = self._conn.call_many("POST", "experiment-run/findExperimentRuns", msgs)
+        expt_runs = {expt_run.id: expt_run
+                     for response_msg in response_msgs
+                     for expt_run in response_msg.experiment_runs}
+        return [expt_runs[expt_run_id] for expt_run_id in expt_run_ids if expt_run_id in expt_runs]
+
+    def _to_columns(self):
+        expt_runs = self._fetch_protos()
+        num_runs = len(expt_runs)
+        nan = float('nan')
+
+        columns = collections.OrderedDict()
+        columns['id'] = [expt_run.id for expt_run in expt_runs]
+        columns['name'] = [expt_run.name for expt_run in expt_runs]
+        for field in ('metrics', 'hyperparameters', 'attributes'):
+            field_columns = {}
+            for i, expt_run in enumerate(expt_runs):
+                for key_value in getattr(expt_run, field):
+                    key = "{}.{}".format(field, key_value.key)
+                    if key not in field_columns:
+                        field_columns[key] = [nan]*num_runs
+                    field_columns[key][i] = _utils.val_proto_to_python(key_value.value)
+            for key in sorted(field_columns):
+                columns[key] = field_columns[key]
+        return columns
+
+    def to_numpy(self):
+        """
+        Gets the metrics, hyperparameters, and attributes of the Experiment Runs from this collection
+        as NumPy arrays.
+
+        All Experiment Runs' data is fetched in a single request. Columns are named ``"id"``,
+        ``"name"``, and ``"<field>.<key>"`` e.g. ``"metrics.accuracy"``; an Experiment Run that
+        doesn't have a key has NaN in its column. Numeric columns are ``float64``, and all others are
+        ``object``.
+
+        Returns
+        -------
+        collections.OrderedDict of str to numpy.ndarray
+            Column names and values, with one element per Experiment Run in this collection's order.
+
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("numpy is not installed; try `pip install numpy`")
+
+        arrays = collections.OrderedDict()
+        for key, values in self._to_columns().items():
+            if all(type(value) in (int, float) or value is None for value in values):
+                arrays[key] = np.array(values, dtype=np.float64)
             else:
-                return self.__class__(self._auth, self._socket,
-                                      [expt_run.id for expt_run in response_msg.experiment_runs])
-        else:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+                arrays[key] = np.array(values, dtype=object)
+        return arrays
+
+    def to_dataframe(self):
+        """
+        Gets the metrics, hyperparameters, and attributes of the Experiment Runs from this collection
+        as a pandas DataFrame.
+
+        Columns are as for :meth:`to_numpy`, with ``"id"`` as the index.
+
+        Returns
+        -------
+        pandas.DataFrame
+
+        Examples
+        --------
+        >>> expt.find("metrics.accuracy >= .8").to_dataframe().sort_values("metrics.accuracy")
+
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("pandas is not installed; try `pip install pandas`")
+
+        return pd.DataFrame(self.to_numpy()).set_index('id')
+
+    def to_arrow(self):
+        """
+        Gets the metrics, hyperparameters, and attributes of the Experiment Runs from this collection
+        as a PyArrow Table.
+
+        Columns are as for :meth:`to_numpy`, with missing values as nulls.
+
+        Returns
+        -------
+        pyarrow.Table
+
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is not installed; try `pip install pyarrow`")
+
+        arrays = self.to_numpy()
+        return pa.Table.from_arrays([pa.array(values, from_pandas=True) for values in arrays.values()],
+                                    names=list(arrays.keys()))
 
 
 class ExperimentRun:
@@ -951,111 +1772,278 @@ class ExperimentRun:
     ----------
     name : str
         Name of this Experiment Run.
+    description : str
+        Description of this Experiment Run.
+    tags : list of str
+        Tags of this Experiment Run as of when it was set.
+    date_created : int
+        Unix time in milliseconds at which this Experiment Run was created.
 
     """
-    def __init__(self, auth, socket,
+    _OBSERVATIONS_CHUNK_SIZE = 10000
+
+    def __init__(self, conn,
                  proj_id=None, expt_id=None, expt_run_name=None,
                  desc=None, tags=None, attrs=None,
-                 *, _expt_run_id=None):
+                 async_logging=False, cache_ttl=None, create_only=False,
+                 *, _expt_run_id=None, _expt_run_msg=None):
         if expt_run_name is not None and _expt_run_id is not None:
             raise ValueError("cannot specify both `expt_run_name` and `_expt_run_id`")
 
-        if _expt_run_id is not None:
-            expt_run = ExperimentRun._get(auth, socket, _expt_run_id=_expt_run_id)
+        if _expt_run_msg is not None:  # already fetched, e.g. as part of a page of results
+            expt_run = _expt_run_msg
+        elif _expt_run_id is not None:
+            expt_run = ExperimentRun._get(conn, _expt_run_id=_expt_run_id)
             if expt_run is not None:
                 pass
             else:
                 raise ValueError("ExperimentRun with ID {} not found".format(_expt_run_id))
-        elif None not in (proj_id, expt_id):
+        elif None not in (proj_id, expt_id) and conn.spool is not None:
+            if expt_run_name is None:
+                expt_run_name = ExperimentRun._generate_default_name()
+            expt_run_id = conn.spool.defer_create("experiment-run", [proj_id, expt_id], expt_run_name,
+                                                  desc, tags, attrs)
+            expt_run = _ExperimentRunService.ExperimentRun(id=expt_run_id, project_id=proj_id,
+                                                           experiment_id=expt_id, name=expt_run_name)
+        elif None not in (proj_id, expt_id) and (create_only or expt_run_name is None):
+            # generated name can't exist yet, so skip the lookup
             if expt_run_name is None:
                 expt_run_name = ExperimentRun._generate_default_name()
-            expt_run = ExperimentRun._get(auth, socket, proj_id, expt_id, expt_run_name)
+            expt_run = ExperimentRun._create(conn, proj_id, expt_id, expt_run_name, desc, tags, attrs)
+        elif None not in (proj_id, expt_id):
+            expt_run = ExperimentRun._get(conn, proj_id, expt_id, expt_run_name)
             if expt_run is not None:
                 if any(param is not None for param in (desc, tags, attrs)):
                     raise ValueError("ExperimentRun with name {} already exists;"
                                      " cannot initialize `desc`, `tags`, or `attrs`".format(expt_run_name))
                 pass
             else:
-                expt_run = ExperimentRun._create(auth, socket, proj_id, expt_id, expt_run_name, desc, tags, attrs)
+                expt_run = ExperimentRun._create(conn, proj_id, expt_id, expt_run_name, desc, tags, attrs)
         else:
             raise ValueError("insufficient arguments")
 
-        self._auth = auth
-        self._socket = socket
+        self._conn = conn
         self._id = expt_run.id
+        self._msg = expt_run  # snapshot as of creation/retrieval
+        self._request_queue = _utils.RequestQueue(conn) if async_logging else None
+        self._cache_ttl = cache_ttl
+        self._cache = None
+        self._cache_time = None
+        if cache_ttl is not None and _expt_run_msg is not None:
+            self._cache = self._proto_to_dict(expt_run)
+            self._cache_time = time.time()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+            return
+        try:
+            self.close()
+        except Exception:  # don't mask the exception already propagating out of the `with` block
+            pass
 
     @property
     def name(self):
-        Message = _ExperimentRunService.GetExperimentRunById
-        msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getExperimentRunById".format(self._socket),
-                                params=data, headers=self._auth)
-        if response.ok:
-            response_msg = _utils.json_to_proto(response.json(), Message.Response)
-            return response_msg.experiment_run.name
-        else:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        return self._msg.name
+
+    @property
+    def description(self):
+        return self._msg.description
+
+    @property
+    def tags(self):
+        return list(self._msg.tags)
+
+    @property
+    def date_created(self):
+        return self._msg.date_created
 
     @staticmethod
     def _generate_default_name():
-        return "ExperimentRun {}".format(str(time.time()).replace('.', ''))
+        return _utils.generate_default_name("ExperimentRun")
+
+    def _get_cached(self, field):
+        if self._cache is None or time.time() - self._cache_time > self._cache_ttl:
+            self.refresh()
+        return self._cache[field]
 
     @staticmethod
-    def _get(auth, socket, proj_id=None, expt_id=None, expt_run_name=None, *, _expt_run_id=None):
+    def _normalize_cached(field, values):
+        """
+        Converts logged `values` into the types they will have when fetched back from the backend.
+
+        """
+        if field == 'observations':
+            return {key: [_utils.val_proto_to_python(_utils.python_to_val_proto(value)) for value in series]
+                    for key, series in values.items()}
+        elif field in ('attributes', 'metrics', 'hyperparameters'):
+            return {key: _utils.val_proto_to_python(_utils.python_to_val_proto(value))
+                    for key, value in values.items()}
+        else:  # artifact paths
+            return dict(values)
+
+    def _update_cache(self, field, values):
+        if self._cache is None:
+            return
+        if field == 'observations':
+            for key, series in values.items():
+                self._cache[field].setdefault(key, []).extend(series)
+        else:
+            self._cache[field].update(values)
+
+    def refresh(self):
+        """
+        Re-fetches this Experiment Run's cached metadata from the backend.
+
+        This has no effect if this Experiment Run was not created with a `cache_ttl`.
+
+        """
+        if self._cache_ttl is not None:
+            self._cache = self.fetch()
+            self._cache_time = time.time()
+
+    def _write(self, method, path, msg, cache_update=None):
+        """
+        Sends, queues, or spools `msg`, then applies `cache_update`---a (field, values) pair for
+        :meth:`_update_cache`---once the write has been accepted.
+
+        """
+        on_success = None
+        if cache_update is not None and self._cache_ttl is not None:
+            field, values = cache_update
+            on_success = functools.partial(self._update_cache, field, self._normalize_cached(field, values))
+
+        if self._conn.spool is not None:
+            self._conn.spool.defer_call(method, path, msg)
+        elif self._request_queue is not None:
+            self._request_queue.put(method, path, msg, on_success)  # cache is updated once the write succeeds
+            return
+        else:
+            self._conn.call(method, path, msg)
+        if on_success is not None:
+            on_success()
+
+    def _read(self, method, path, msg):
+        # pending writes must land before reading them back
+        self.flush()
+        return self._conn.call(method, path, msg)
+
+    def _replay_spool(self):
+        if self._conn.spool is not None:
+            try:
+                self._conn.spool.replay(self._conn)
+            except requests.ConnectionError:  # still offline, so leave the rest spooled
+                pass
+
+    def flush(self):
+        """
+        Blocks until all queued log calls have been sent to the backend.
+
+        In offline mode, this also replays the spool if the backend is reachable. Otherwise, this
+        has no effect if this Experiment Run was not created with ``async_logging=True``.
+
+        Raises
+        ------
+        requests.HTTPError
+            If a queued log call failed since the last time an error was raised.
+
+        """
+        if self._request_queue is not None:
+            self._request_queue.flush()
+        self._replay_spool()
+
+    def close(self):
+        """
+        Sends all queued log calls to the backend and stops the background worker.
+
+        Subsequent log calls on this Experiment Run will be sent synchronously. In offline mode,
+        this also replays the spool if the backend is reachable. Otherwise, this has no effect if
+        this Experiment Run was not created with ``async_logging=True``.
+
+        Raises
+        ------
+        requests.HTTPError
+            If a queued log call failed since the last time an error was raised.
+
+        """
+        if self._request_queue is not None:
+            request_queue, self._request_queue = self._request_queue, None
+            request_queue.close()
+        self._replay_spool()
+
+    @staticmethod
+    def _get(conn, proj_id=None, expt_id=None, expt_run_name=None, *, _expt_run_id=None):
         if _expt_run_id is not None:
             Message = _ExperimentRunService.GetExperimentRunById
             msg = Message(id=_expt_run_id)
-            data = _utils.proto_to_json(msg)
-            response = requests.get("http://{}/v1/experiment-run/getExperimentRunById".format(socket),
-                                    params=data, headers=auth)
+            try:
+                response_msg = conn.call("GET", "experiment-run/getExperimentRunById", msg)
+            except _utils.NotFoundError:
+                return None
+            return response_msg.experiment_run
         elif None not in (proj_id, expt_id, expt_run_name):
-            Message = _ExperimentRunService.GetExperimentRunsInProject
-            msg = Message(project_id=proj_id)
-            data = _utils.proto_to_json(msg)
-            response = requests.get("http://{}/v1/experiment-run/getExperimentRunsInProject".format(socket),
-                                    params=data, headers=auth)
-            if not response.ok:
-                raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+            index = conn.expt_run_index
+            expt_run_id = index.get(expt_id, expt_run_name)
+            if expt_run_id is not None:
+                expt_run = ExperimentRun._get(conn, _expt_run_id=expt_run_id)
+                if expt_run is not None:
+                    return expt_run
+                index.discard(expt_id, expt_run_name)  # deleted since it was indexed
+            elif index.is_complete(expt_id):
+                return None
+
+            if hasattr(_ExperimentRunService, "GetExperimentRunByName"):
+                Message = _ExperimentRunService.GetExperimentRunByName
+                msg = Message(experiment_id=expt_id, name=expt_run_name)
+                try:
+                    response_msg = conn.call("GET", "experiment-run/getExperimentRunByName", msg)
+                except _utils.NotFoundError:
+                    return None
+                expt_run = response_msg.experiment_run
             else:
-                if 'experiment_runs' in response.json():
-                    response_msg = _utils.json_to_proto(response.json(), Message.Response)
-                    result = [expt_run
-                              for expt_run in response_msg.experiment_runs
-                              if expt_run.name == expt_run_name]
-                    return result[-1] if len(result) else None
-                else:  # no expt_runs in proj
+                # backend can't look up by name, so index the whole Experiment to only do this once
+                Message = _ExperimentRunService.GetExperimentRunsInExperiment
+                msg = Message(experiment_id=expt_id)
+                response_msg = conn.call("GET", "experiment-run/getExperimentRunsInExperiment", msg)
+                expt_run = None
+                for candidate in response_msg.experiment_runs:
+                    index.put(expt_id, candidate.name, candidate.id)
+                    if candidate.name == expt_run_name:
+                        expt_run = candidate
+                index.mark_complete(expt_id)
+                if expt_run is None:
                     return None
-        else:
-            raise ValueError("insufficient arguments")
 
-        if response.ok:
-            response_msg = _utils.json_to_proto(response.json(), Message.Response)
-            return response_msg.experiment_run
+            index.put(expt_id, expt_run.name, expt_run.id)
+            return expt_run
         else:
-            if response.status_code == 404 and response.json()['code'] == 5:
-                return None
-            else:
-                raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+            raise ValueError("insufficient arguments")
 
     @staticmethod
-    def _create(auth, socket, proj_id, expt_id, expt_run_name, desc=None, tags=None, attrs=None):
+    def _create_msg(proj_id, expt_id, expt_run_name, desc=None, tags=None, attrs=None, hyperparams=None):
         if attrs is not None:
             attrs = [_CommonService.KeyValue(key=key, value=_utils.python_to_val_proto(value))
                      for key, value in attrs.items()]
+        if hyperparams is not None:
+            for key in hyperparams.keys():
+                _utils.validate_flat_key(key)
+            hyperparams = [_CommonService.KeyValue(key=key, value=_utils.python_to_val_proto(value))
+                           for key, value in hyperparams.items()]
 
         Message = _ExperimentRunService.CreateExperimentRun
-        msg = Message(project_id=proj_id, experiment_id=expt_id, name=expt_run_name,
-                      description=desc, tags=tags, attributes=attrs)
-        data = _utils.proto_to_json(msg)
-        response = requests.post("http://{}/v1/experiment-run/createExperimentRun".format(socket),
-                                 json=data, headers=auth)
+        return Message(project_id=proj_id, experiment_id=expt_id, name=expt_run_name,
+                       description=desc, tags=tags, attributes=attrs, hyperparameters=hyperparams)
 
-        if response.ok:
-            response_msg = _utils.json_to_proto(response.json(), Message.Response)
-            return response_msg.experiment_run
-        else:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+    @staticmethod
+    def _create(conn, proj_id, expt_id, expt_run_name, desc=None, tags=None, attrs=None):
+        msg = ExperimentRun._create_msg(proj_id, expt_id, expt_run_name, desc, tags, attrs)
+        response_msg = conn.call("POST", "experiment-run/createExperimentRun", msg)
+        expt_run = response_msg.experiment_run
+        conn.expt_run_index.put(expt_id, expt_run.name, expt_run.id)
+        return expt_run
 
     def log_attribute(self, key, value):
         """
@@ -1076,11 +2064,37 @@ class ExperimentRun:
 
         attribute = _CommonService.KeyValue(key=key, value=_utils.python_to_val_proto(value))
         msg = _ExperimentRunService.LogAttribute(id=self._id, attribute=attribute)
-        data = _utils.proto_to_json(msg)
-        response = requests.post("http://{}/v1/experiment-run/logAttribute".format(self._socket),
-                                 json=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        self._write("POST", "experiment-run/logAttribute", msg, cache_update=('attributes', {key: value}))
+
+    def log_attributes(self, attrs=None, **attrs_kwargs):
+        """
+        Logs attributes to this Experiment Run in a single request.
+
+        This function supports passing in a dictionary as well as argument unpacking.
+
+        Parameters
+        ----------
+        attrs : dict of str to {None, bool, float, int, str}
+            Names and values of all attributes.
+
+        """
+        if attrs is not None and attrs_kwargs:
+            raise ValueError("too many arguments")
+        if attrs is None and not attrs_kwargs:
+            raise ValueError("insufficient arguments")
+
+        # rebind so don't have to duplicate code
+        if attrs_kwargs:
+            attrs = attrs_kwargs
+
+        # validate all keys first
+        for key in attrs.keys():
+            _utils.validate_flat_key(key)
+
+        attributes = [_CommonService.KeyValue(key=key, value=_utils.python_to_val_proto(value))
+                      for key, value in attrs.items()]
+        msg = _ExperimentRunService.LogAttributes(id=self._id, attributes=attributes)
+        self._write("POST", "experiment-run/logAttributes", msg, cache_update=('attributes', attrs))
 
     def get_attribute(self, key):
         """
@@ -1099,15 +2113,12 @@ class ExperimentRun:
         """
         _utils.validate_flat_key(key)
 
+        if self._cache_ttl is not None:
+            return copy.copy(self._get_cached('attributes')[key])
+
         Message = _CommonService.GetAttributes
         msg = Message(id=self._id, attribute_keys=[key])
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getAttributes".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
+        response_msg = self._read("GET", "experiment-run/getAttributes", msg)
         return {attribute.key: _utils.val_proto_to_python(attribute.value)
                 for attribute in response_msg.attributes}[key]
 
@@ -1121,15 +2132,12 @@ class ExperimentRun:
             Names and values of all attributes.
 
         """
+        if self._cache_ttl is not None:
+            return copy.deepcopy(self._get_cached('attributes'))
+
         Message = _CommonService.GetAttributes
         msg = Message(id=self._id, get_all=True)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getAttributes".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
+        response_msg = self._read("GET", "experiment-run/getAttributes", msg)
         return {attribute.key: _utils.val_proto_to_python(attribute.value)
                 for attribute in response_msg.attributes}
 
@@ -1153,11 +2161,37 @@ class ExperimentRun:
 
         metric = _CommonService.KeyValue(key=key, value=_utils.python_to_val_proto(value))
         msg = _ExperimentRunService.LogMetric(id=self._id, metric=metric)
-        data = _utils.proto_to_json(msg)
-        response = requests.post("http://{}/v1/experiment-run/logMetric".format(self._socket),
-                                 json=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        self._write("POST", "experiment-run/logMetric", msg, cache_update=('metrics', {key: value}))
+
+    def log_metrics(self, metrics=None, **metrics_kwargs):
+        """
+        Logs metrics to this Experiment Run in a single request.
+
+        This function supports passing in a dictionary as well as argument unpacking.
+
+        Parameters
+        ----------
+        metrics : dict of str to {None, bool, float, int, str}
+            Names and values of all metrics.
+
+        """
+        if metrics is not None and metrics_kwargs:
+            raise ValueError("too many arguments")
+        if metrics is None and not metrics_kwargs:
+            raise ValueError("insufficient arguments")
+
+        # rebind so don't have to duplicate code
+        if metrics_kwargs:
+            metrics = metrics_kwargs
+
+        # validate all keys first
+        for key in metrics.keys():
+            _utils.validate_flat_key(key)
+
+        metric_msgs = [_CommonService.KeyValue(key=key, value=_utils.python_to_val_proto(value))
+                       for key, value in metrics.items()]
+        msg = _ExperimentRunService.LogMetrics(id=self._id, metrics=metric_msgs)
+        self._write("POST", "experiment-run/logMetrics", msg, cache_update=('metrics', metrics))
 
     def get_metric(self, key):
         """
@@ -1176,15 +2210,12 @@ class ExperimentRun:
         """
         _utils.validate_flat_key(key)
 
+        if self._cache_ttl is not None:
+            return copy.copy(self._get_cached('metrics')[key])
+
         Message = _ExperimentRunService.GetMetrics
         msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getMetrics".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
+        response_msg = self._read("GET", "experiment-run/getMetrics", msg)
         return {metric.key: _utils.val_proto_to_python(metric.value)
                 for metric in response_msg.metrics}[key]
 
@@ -1198,15 +2229,12 @@ class ExperimentRun:
             Names and values of all metrics.
 
         """
+        if self._cache_ttl is not None:
+            return copy.deepcopy(self._get_cached('metrics'))
+
         Message = _ExperimentRunService.GetMetrics
         msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getMetrics".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
+        response_msg = self._read("GET", "experiment-run/getMetrics", msg)
         return {metric.key: _utils.val_proto_to_python(metric.value)
                 for metric in response_msg.metrics}
 
@@ -1229,15 +2257,11 @@ class ExperimentRun:
 
         hyperparameter = _CommonService.KeyValue(key=key, value=_utils.python_to_val_proto(value))
         msg = _ExperimentRunService.LogHyperparameter(id=self._id, hyperparameter=hyperparameter)
-        data = _utils.proto_to_json(msg)
-        response = requests.post("http://{}/v1/experiment-run/logHyperparameter".format(self._socket),
-                                 json=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        self._write("POST", "experiment-run/logHyperparameter", msg, cache_update=('hyperparameters', {key: value}))
 
     def log_hyperparameters(self, hyperparams=None, **hyperparams_kwargs):
         """
-        Logs hyperparameters to this Experiment Run.
+        Logs hyperparameters to this Experiment Run in a single request.
 
         This function supports passing in a dictionary as well as argument unpacking.
 
@@ -1260,14 +2284,10 @@ class ExperimentRun:
         for key in hyperparams.keys():
             _utils.validate_flat_key(key)
 
-        for key, value in hyperparams.items():
-            hyperparameter = _CommonService.KeyValue(key=key, value=_utils.python_to_val_proto(value))
-            msg = _ExperimentRunService.LogHyperparameter(id=self._id, hyperparameter=hyperparameter)
-            data = _utils.proto_to_json(msg)
-            response = requests.post("http://{}/v1/experiment-run/logHyperparameter".format(self._socket),
-                                     json=data, headers=self._auth)
-            if not response.ok:
-                raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        hyperparameters = [_CommonService.KeyValue(key=key, value=_utils.python_to_val_proto(value))
+                           for key, value in hyperparams.items()]
+        msg = _ExperimentRunService.LogHyperparameters(id=self._id, hyperparameters=hyperparameters)
+        self._write("POST", "experiment-run/logHyperparameters", msg, cache_update=('hyperparameters', hyperparams))
 
     def get_hyperparameter(self, key):
         """
@@ -1286,15 +2306,12 @@ class ExperimentRun:
         """
         _utils.validate_flat_key(key)
 
+        if self._cache_ttl is not None:
+            return copy.copy(self._get_cached('hyperparameters')[key])
+
         Message = _ExperimentRunService.GetHyperparameters
         msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getHyperparameters".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
+        response_msg = self._read("GET", "experiment-run/getHyperparameters", msg)
         return {hyperparameter.key: _utils.val_proto_to_python(hyperparameter.value)
                 for hyperparameter in response_msg.hyperparameters}[key]
 
@@ -1308,15 +2325,12 @@ class ExperimentRun:
             Names and values of all hyperparameters.
 
         """
+        if self._cache_ttl is not None:
+            return copy.deepcopy(self._get_cached('hyperparameters'))
+
         Message = _ExperimentRunService.GetHyperparameters
         msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getHyperparameters".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
+        response_msg = self._read("GET", "experiment-run/getHyperparameters", msg)
         return {hyperparameter.key: _utils.val_proto_to_python(hyperparameter.value)
                 for hyperparameter in response_msg.hyperparameters}
 
@@ -1346,11 +2360,38 @@ class ExperimentRun:
         dataset = _CommonService.Artifact(key=key, path=path,
                                           artifact_type=_CommonService.ArtifactTypeEnum.DATA)
         msg = _ExperimentRunService.LogDataset(id=self._id, dataset=dataset)
-        data = _utils.proto_to_json(msg)
-        response = requests.post("http://{}/v1/experiment-run/logDataset".format(self._socket),
-                                 json=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        self._write("POST", "experiment-run/logDataset", msg, cache_update=('datasets', {key: path}))
+
+    def log_datasets(self, paths=None, **paths_kwargs):
+        """
+        Logs the file system paths of datasets to this Experiment Run in a single request.
+
+        This function supports passing in a dictionary as well as argument unpacking.
+
+        Parameters
+        ----------
+        paths : dict of str to str
+            Names and file system paths of all datasets.
+
+        """
+        if paths is not None and paths_kwargs:
+            raise ValueError("too many arguments")
+        if paths is None and not paths_kwargs:
+            raise ValueError("insufficient arguments")
+
+        # rebind so don't have to duplicate code
+        if paths_kwargs:
+            paths = paths_kwargs
+
+        # validate all keys first
+        for key in paths.keys():
+            _utils.validate_flat_key(key)
+
+        datasets = [_CommonService.Artifact(key=key, path=path,
+                                            artifact_type=_CommonService.ArtifactTypeEnum.DATA)
+                    for key, path in paths.items()]
+        msg = _ExperimentRunService.LogDatasets(id=self._id, datasets=datasets)
+        self._write("POST", "experiment-run/logDatasets", msg, cache_update=('datasets', paths))
 
     def get_dataset(self, key):
         """
@@ -1369,15 +2410,12 @@ class ExperimentRun:
         """
         _utils.validate_flat_key(key)
 
+        if self._cache_ttl is not None:
+            return copy.copy(self._get_cached('datasets')[key])
+
         Message = _ExperimentRunService.GetDatasets
         msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getDatasets".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
+        response_msg = self._read("GET", "experiment-run/getDatasets", msg)
         return {dataset.key: dataset.path for dataset in response_msg.datasets}[key]
 
     def get_datasets(self):
@@ -1390,15 +2428,12 @@ class ExperimentRun:
             File system paths of all datasets.
 
         """
+        if self._cache_ttl is not None:
+            return copy.deepcopy(self._get_cached('datasets'))
+
         Message = _ExperimentRunService.GetDatasets
         msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getDatasets".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
+        response_msg = self._read("GET", "experiment-run/getDatasets", msg)
         return {dataset.key: dataset.path for dataset in response_msg.datasets}
 
     def log_model(self, key, path, model=None):
@@ -1428,11 +2463,7 @@ class ExperimentRun:
         model_artifact = _CommonService.Artifact(key=key, path=path,
                                                  artifact_type=_CommonService.ArtifactTypeEnum.MODEL)
         msg = _ExperimentRunService.LogArtifact(id=self._id, artifact=model_artifact)
-        data = _utils.proto_to_json(msg)
-        response = requests.post("http://{}/v1/experiment-run/logArtifact".format(self._socket),
-                                 json=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        self._write("POST", "experiment-run/logArtifact", msg, cache_update=('models', {key: path}))
 
     def get_model(self, key):
         """
@@ -1451,15 +2482,12 @@ class ExperimentRun:
         """
         _utils.validate_flat_key(key)
 
+        if self._cache_ttl is not None:
+            return copy.copy(self._get_cached('models')[key])
+
         Message = _ExperimentRunService.GetArtifacts
         msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getArtifacts".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
+        response_msg = self._read("GET", "experiment-run/getArtifacts", msg)
         return {artifact.key: artifact.path
                 for artifact in response_msg.artifacts
                 if artifact.artifact_type == _CommonService.ArtifactTypeEnum.MODEL}[key]
@@ -1474,15 +2502,12 @@ class ExperimentRun:
             File system paths of all models.
 
         """
+        if self._cache_ttl is not None:
+            return copy.deepcopy(self._get_cached('models'))
+
         Message = _ExperimentRunService.GetArtifacts
         msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getArtifacts".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
+        response_msg = self._read("GET", "experiment-run/getArtifacts", msg)
         return {artifact.key: artifact.path
                 for artifact in response_msg.artifacts
                 if artifact.artifact_type == _CommonService.ArtifactTypeEnum.MODEL}
@@ -1514,11 +2539,7 @@ class ExperimentRun:
         image = _CommonService.Artifact(key=key, path=path,
                                         artifact_type=_CommonService.ArtifactTypeEnum.IMAGE)
         msg = _ExperimentRunService.LogArtifact(id=self._id, artifact=image)
-        data = _utils.proto_to_json(msg)
-        response = requests.post("http://{}/v1/experiment-run/logArtifact".format(self._socket),
-                                 json=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        self._write("POST", "experiment-run/logArtifact", msg, cache_update=('images', {key: path}))
 
     def get_image(self, key):
         """
@@ -1537,15 +2558,12 @@ class ExperimentRun:
         """
         _utils.validate_flat_key(key)
 
+        if self._cache_ttl is not None:
+            return copy.copy(self._get_cached('images')[key])
+
         Message = _ExperimentRunService.GetArtifacts
         msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getArtifacts".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
+        response_msg = self._read("GET", "experiment-run/getArtifacts", msg)
         return {artifact.key: artifact.path
                 for artifact in response_msg.artifacts
                 if artifact.artifact_type == _CommonService.ArtifactTypeEnum.IMAGE}[key]
@@ -1560,15 +2578,12 @@ class ExperimentRun:
             File system paths of all images.
 
         """
+        if self._cache_ttl is not None:
+            return copy.deepcopy(self._get_cached('images'))
+
         Message = _ExperimentRunService.GetArtifacts
         msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getArtifacts".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
+        response_msg = self._read("GET", "experiment-run/getArtifacts", msg)
         return {artifact.key: artifact.path
                 for artifact in response_msg.artifacts
                 if artifact.artifact_type == _CommonService.ArtifactTypeEnum.IMAGE}
@@ -1593,11 +2608,71 @@ class ExperimentRun:
         attribute = _CommonService.KeyValue(key=key, value=_utils.python_to_val_proto(value))
         observation = _ExperimentRunService.Observation(attribute=attribute)  # TODO: support Artifacts
         msg = _ExperimentRunService.LogObservation(id=self._id, observation=observation)
-        data = _utils.proto_to_json(msg)
-        response = requests.post("http://{}/v1/experiment-run/logObservation".format(self._socket),
-                                 json=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
+        self._write("POST", "experiment-run/logObservation", msg, cache_update=('observations', {key: [value]}))
+
+    def log_observations(self, key, values, steps=None, timestamps=None):
+        """
+        Logs a series of observations to this Experiment Run.
+
+        The series is uploaded in as few requests as possible, rather than one request per value as
+        with :meth:`.log_observation`.
+
+        Parameters
+        ----------
+        key : str
+            Name of the observation series.
+        values : array-like or iterable of {None, bool, float, int, str}
+            Values of the observation series, such as a NumPy array, list, or generator.
+        steps : array-like or iterable of {float, int}, optional
+            Step (e.g. epoch number) at which each value was observed.
+        timestamps : array-like or iterable of int, optional
+            Unix time in milliseconds at which each value was observed. If not provided, the backend
+            will assign one.
+
+        Raises
+        ------
+        ValueError
+            If `steps` or `timestamps` does not have the same length as `values`. Iterables without a
+            length are checked as they are consumed, so chunks before the mismatch will already have
+            been logged.
+
+        """
+        _utils.validate_flat_key(key)
+
+        for name, series in (('steps', steps), ('timestamps', timestamps)):
+            # fail before uploading anything when both lengths are known
+            if hasattr(series, '__len__') and hasattr(values, '__len__') and len(series) != len(values):
+                raise ValueError("`{}` must have the same length as `values`".format(name))
+
+        size = self._OBSERVATIONS_CHUNK_SIZE
+        step_chunks = itertools.repeat(None) if steps is None else _utils.iter_chunks(steps, size)
+        timestamp_chunks = itertools.repeat(None) if timestamps is None else _utils.iter_chunks(timestamps, size)
+        # a trailing empty chunk checks that `steps` and `timestamps` run out along with `values`
+        for value_chunk in itertools.chain(_utils.iter_chunks(values, size), [[]]):
+            step_chunk, timestamp_chunk = next(step_chunks, []), next(timestamp_chunks, [])
+            for name, chunk in (('steps', step_chunk), ('timestamps', timestamp_chunk)):
+                if chunk is not None and len(chunk) != len(value_chunk):
+                    raise ValueError("`{}` must have the same length as `values`".format(name))
+            if not value_chunk:
+                break
+
+            msg = _ExperimentRunService.LogObservations(id=self._id)
+            msg.observations.extend(self._observations(key, value_chunk, step_chunk, timestamp_chunk))
+            self._write("POST", "experiment-run/logObservations", msg,
+                        cache_update=('observations', {key: value_chunk}))
+
+    @staticmethod
+    def _observations(key, values, steps=None, timestamps=None):
+        """
+        Yields a `protobuf` ``Observation`` for each of `values`, with its step and timestamp if provided.
+
+        """
+        steps = itertools.repeat(None) if steps is None else map(_utils.python_to_val_proto, steps)
+        timestamps = itertools.repeat(None) if timestamps is None else timestamps
+        for value, step, timestamp in zip(values, steps, timestamps):
+            yield _ExperimentRunService.Observation(
+                attribute=_CommonService.KeyValue(key=key, value=_utils.python_to_val_proto(value)),
+                epoch_number=step, timestamp=timestamp)
 
     def get_observation(self, key):
         """
@@ -1616,15 +2691,12 @@ class ExperimentRun:
         """
         _utils.validate_flat_key(key)
 
+        if self._cache_ttl is not None:
+            return copy.copy(self._get_cached('observations')[key])
+
         Message = _ExperimentRunService.GetObservations
         msg = Message(id=self._id, observation_key=key)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getObservations".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
+        response_msg = self._read("GET", "experiment-run/getObservations", msg)
         if len(response_msg.observations) == 0:
             raise KeyError(key)
         else:
@@ -1641,18 +2713,85 @@ class ExperimentRun:
             Names and values of all observation series.
 
         """
+        if self._cache_ttl is not None:
+            return copy.deepcopy(self._get_cached('observations'))
+
+        return self._observations_to_dict(self._fetch_proto().observations)
+
+    def fetch(self):
+        """
+        Gets all metadata from this Experiment Run in a single request.
+
+        Returns
+        -------
+        dict
+            Snapshot of this Experiment Run, with keys ``"id"``, ``"project_id"``,
+            ``"experiment_id"``, ``"name"``, ``"description"``, and ``"tags"``, as well as
+            ``"attributes"``, ``"hyperparameters"``, ``"metrics"``, ``"observations"``,
+            ``"datasets"``, ``"models"``, and ``"images"`` whose values are as returned by the
+            corresponding ``get_*`` methods.
+
+        """
+        return self._proto_to_dict(self._fetch_proto())
+
+    def _fetch_proto(self):
         Message = _ExperimentRunService.GetExperimentRunById
         msg = Message(id=self._id)
-        data = _utils.proto_to_json(msg)
-        response = requests.get("http://{}/v1/experiment-run/getExperimentRunById".format(self._socket),
-                                params=data, headers=self._auth)
-        if not response.ok:
-            raise requests.HTTPError("{}: {}".format(response.status_code, response.reason))
-
-        response_msg = _utils.json_to_proto(response.json(), Message.Response)
-        observations = {}
-        for observation in response_msg.experiment_run.observations:  # TODO: support Artifacts
+        response_msg = self._read("GET", "experiment-run/getExperimentRunById", msg)
+        return response_msg.experiment_run
+
+    @staticmethod
+    def _key_values_to_dict(key_values):
+        return {key_value.key: _utils.val_proto_to_python(key_value.value)
+                for key_value in key_values}
+
+    @staticmethod
+    def _artifacts_to_dict(artifacts, artifact_type=None):
+        return {artifact.key: artifact.path
+                for artifact in artifacts
+                if artifact_type is None or artifact.artifact_type == artifact_type}
+
+    @staticmethod
+    def _observations_to_dict(observations):
+        observations_dict = {}
+        for observation in observations:  # TODO: support Artifacts
             key = observation.attribute.key
             value = observation.attribute.value
-            observations.setdefault(key, []).append(_utils.val_proto_to_python(value))
-        return observations
+            observations_dict.setdefault(key, []).append(_utils.val_proto_to_python(value))
+        return observations_dict
+
+    @staticmethod
+    def _proto_to_dict(expt_run):
+        return {
+            'id': expt_run.id,
+            'project_id': expt_run.project_id,
+            'experiment_id': expt_run.experiment_id,
+            'name': expt_run.name,
+            'description': expt_run.description,
+            'tags': list(expt_run.tags),
+            'attributes': ExperimentRun._key_values_to_dict(expt_run.attributes),
+            'hyperparameters': ExperimentRun._key_values_to_dict(expt_run.hyperparameters),
+            'metrics': ExperimentRun._key_values_to_dict(expt_run.metrics),
+            'observations': ExperimentRun._observations_to_dict(expt_run.observations),
+            'datasets': ExperimentRun._artifacts_to_dict(expt_run.datasets),
+            'models': ExperimentRun._artifacts_to_dict(expt_run.artifacts,
+                                                       _CommonService.ArtifactTypeEnum.MODEL),
+            'images': ExperimentRun._artifacts_to_dict(expt_run.artifacts,
+                                                       _CommonService.ArtifactTypeEnum.IMAGE),
+        }
+
+
+def _get_or_create_spooled(conn, record):
+    """
+    Gets or creates the entity described by a spooled ``"create"`` record, returning its ID.
+
+    """
+    entity_cls = {"project": Project,
+                  "experiment": Experiment,
+                  "experiment-run": ExperimentRun}[record['entity']]
+    args = record['parent_ids'] + [record['name']]
+
+    entity = entity_cls._get(conn, *args)
+    if entity is None:
+        entity = entity_cls._create(conn, *args, record['desc'], record['tags'], record['attrs'])
+    return entity.id